@@ -0,0 +1,97 @@
+import sys
+import json
+import argparse
+from typing import List, Optional, Tuple
+
+# Metrics where a higher value is better; every other timed or sized
+# metric is better when lower.
+HIGHER_IS_BETTER = ('_per_sec',)
+LOWER_IS_BETTER = ('_ms', '_bytes')
+
+def direction(metric: str) -> Optional[int]:
+  """
+  Get 1 if a higher value of `metric` is better, -1 if a lower value is
+  better, or None if the metric is informational (e.g. a run count).
+  """
+  if metric.endswith(HIGHER_IS_BETTER):
+    return 1
+  if metric.endswith(LOWER_IS_BETTER):
+    return -1
+  return None
+
+def load(path: str) -> dict:
+  with open(path, 'r') as file:
+    return json.load(file)
+
+def compare(base: dict, head: dict, threshold: float) -> Tuple[List[tuple], List[tuple]]:
+  """
+  Compare the results of two benchmark runs.
+
+  Args:
+    base (dict): Report of the reference run.
+    head (dict): Report of the run to check.
+    threshold (float): Relative change above which a worse value is a
+      regression, e.g. 0.1 for 10%.
+
+  Returns:
+    Tuple[List[tuple], List[tuple]]: Every compared metric and the
+    regressions, as (benchmark, metric, base value, head value, change)
+    tuples where change is relative to the base value.
+  """
+  rows = []
+  regressions = []
+
+  for name, base_metrics in base['results'].items():
+    head_metrics = head['results'].get(name)
+    if head_metrics is None:
+      continue
+
+    for metric, base_value in base_metrics.items():
+      sign = direction(metric)
+      head_value = head_metrics.get(metric)
+      if sign is None or head_value is None or not base_value:
+        continue
+
+      change = (head_value - base_value) / base_value
+      row = (name, metric, base_value, head_value, change)
+      rows.append(row)
+      if -sign * change > threshold:
+        regressions.append(row)
+
+  return rows, regressions
+
+def format_row(row: tuple) -> str:
+  name, metric, base_value, head_value, change = row
+  return f'{name:<40} {metric:<18} {base_value:>14.2f} {head_value:>14.2f} {change:>+8.1%}'
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(
+    description='Compare two benchmark results and fail on regressions.'
+  )
+  parser.add_argument('base', help='Results of the reference commit.')
+  parser.add_argument('head', help='Results of the commit to check.')
+  parser.add_argument(
+    '--threshold',
+    type=float,
+    default=0.1,
+    help='Relative change counted as a regression (default: 0.1).'
+  )
+  options = parser.parse_args(argv)
+
+  base = load(options.base)
+  head = load(options.head)
+  rows, regressions = compare(base, head, options.threshold)
+
+  print(f'base: {base["meta"].get("commit")}  head: {head["meta"].get("commit")}')
+  print(f'{"benchmark":<40} {"metric":<18} {"base":>14} {"head":>14} {"change":>8}')
+  for row in rows:
+    print(format_row(row))
+
+  if regressions:
+    print(f'\n{len(regressions)} regression(s) above {options.threshold:.0%}:')
+    for row in regressions:
+      print(format_row(row))
+    sys.exit(1)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,153 @@
+import copy
+import json
+import os
+from typing import Any, Callable, Dict, Mapping, Optional
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+# Responses are built from a query dict and return the JSON document.
+Fixture = Callable[[Mapping[str, str]], Any]
+
+def load_example(name: str) -> Any:
+  """
+  Load an example response from the examples directory.
+  """
+  with open(os.path.join(EXAMPLES_DIR, f'{name}.json'), 'rb') as file:
+    return json.loads(file.read())
+
+def replicate(items: list, count: int, id_key: Optional[str], prefix: str) -> list:
+  """
+  Build a list of `count` items cycling through `items`. When `id_key` is
+  given, each item gets a unique string under it so pages look like real,
+  distinct results.
+  """
+  result = []
+  for index in range(count):
+    item = copy.deepcopy(items[index % len(items)])
+    if id_key is not None:
+      item[id_key] = f'{prefix}{index}'
+    result.append(item)
+  return result
+
+def paginated(
+  document: dict,
+  items_path: tuple,
+  items: list,
+  page_size: int,
+  pages: int,
+  cursor_key: str = 'cursor',
+  has_more_key: str = 'hasMore',
+  cursor_param: str = 'cursor',
+  id_key: Optional[str] = 'id'
+) -> Fixture:
+  """
+  Build a cursor-paginated fixture serving `pages` pages of `page_size`
+  items copied from `items`, placed at `items_path` in `document`.
+  """
+  def build(query: Mapping[str, str]) -> dict:
+    try:
+      page = int(query.get(cursor_param) or 0)
+    except ValueError:
+      page = 0
+
+    page_document = copy.copy(document)
+    container = page_document
+    for key in items_path[:-1]:
+      container[key] = copy.copy(container[key])
+      container = container[key]
+
+    container[items_path[-1]] = replicate(items, page_size, id_key, f'{page}-')
+    # Keep the cursor type of the example so schema decoding is unaffected.
+    next_cursor = page + 1
+    if isinstance(container.get(cursor_key), str):
+      next_cursor = str(next_cursor)
+    container[cursor_key] = next_cursor
+    container[has_more_key] = page + 1 < pages
+    return page_document
+
+  return build
+
+def static(document: Any) -> Fixture:
+  def build(query: Mapping[str, str]) -> Any:
+    return document
+  return build
+
+def build_fixtures(page_size: int = 35, pages: int = 5) -> Dict[str, Fixture]:
+  """
+  Build the fixtures of every endpoint, keyed by endpoint path.
+
+  List endpoints serve `pages` pages of `page_size` items, so post, story
+  and comment pages are as large as with the largest `count` values.
+
+  Args:
+    page_size (int): Number of items per page of list endpoints.
+    pages (int): Number of pages served before hasMore turns false.
+
+  Returns:
+    Dict[str, Callable[[Mapping[str, str]], Any]]: Fixtures keyed by path.
+  """
+  user_posts = load_example('user-posts')
+  post_items = user_posts['data']['itemList']
+  posts = paginated(user_posts, ('data', 'itemList'), post_items, page_size, pages)
+
+  story = load_example('user-story')
+  comments = load_example('post-comments')
+  followers = load_example('user-followers')
+  following = load_example('user-following')
+  playlist = load_example('user-playlist')
+  search_general = load_example('search-general')
+  search_live = load_example('search-live')
+  search_account = load_example('search-account')
+
+  fixtures = {
+    '/user/info': static(load_example('user-info')),
+    '/user/posts': posts,
+    '/user/popular-posts': posts,
+    '/user/oldest-posts': posts,
+    '/user/liked-posts': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/user/repost': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/user/story': paginated(
+      dict(story, HasMoreBefore=False), ('itemList',), story['itemList'], page_size, pages,
+      cursor_key='MaxCursor', has_more_key='HasMoreAfter', cursor_param='maxCursor'
+    ),
+    '/user/followers': paginated(
+      followers, ('userList',), followers['userList'], page_size, pages,
+      cursor_key='minCursor', cursor_param='minCursor', id_key=None
+    ),
+    '/user/followings': paginated(
+      following, ('userList',), following['userList'], page_size, pages,
+      cursor_key='minCursor', cursor_param='minCursor', id_key=None
+    ),
+    '/user/playlist': paginated(
+      playlist, ('playList',), playlist['playList'], page_size, pages, id_key='mixId'
+    ),
+    '/search/general': paginated(
+      search_general, ('data',), search_general['data'], page_size, pages, id_key=None
+    ),
+    '/search/video': paginated({}, ('item_list',), post_items, page_size, pages),
+    '/search/account': paginated(
+      search_account, ('user_list',), search_account['user_list'], page_size, pages,
+      id_key=None
+    ),
+    '/search/live': paginated(
+      search_live, ('data',), search_live['data'], page_size, pages, id_key=None
+    ),
+    '/post/detail': static(load_example('post-detail')),
+    '/post/comments': paginated(
+      comments, ('comments',), comments['comments'], page_size, pages, id_key='cid'
+    ),
+    '/post/comment/replies': paginated(
+      comments, ('comments',), comments['comments'], page_size, pages, id_key='cid'
+    ),
+    '/challenge/info': static(load_example('hashtag-info')),
+    '/challenge/posts': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/music/info': static(load_example('music-info')),
+    '/music/posts': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/place/info': static(load_example('place-info')),
+    '/place/posts': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/effect/info': static(load_example('effect-info')),
+    '/effect/posts': paginated({}, ('itemList',), post_items, page_size, pages),
+    '/collection/info': static({'collectionInfo': {'id': '1', 'name': 'benchmark'}}),
+    '/collection/posts': paginated({}, ('itemList',), post_items, page_size, pages),
+  }
+  return fixtures
@@ -0,0 +1,144 @@
+import os
+import json
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+from .fixtures import Fixture, build_fixtures
+
+class MockTikflyServer():
+  def __init__(
+    self,
+    fixtures: Optional[Dict[str, Fixture]] = None,
+    latency: float = 0.0,
+    media_size: int = 16 * 1024 * 1024,
+    host: str = '127.0.0.1',
+    port: int = 0
+  ):
+    """
+    Local aiohttp server mimicking the Tikfly API and the TikTok CDN.
+
+    Every endpoint under /api serves its fixture. Bodies are encoded once
+    per endpoint and cursor and then served from memory, so the server
+    adds as little as possible to the measured client time. /api/download
+    endpoints return URLs of a /cdn/media file of `media_size` bytes that
+    supports Range requests. API requests can also be answered without
+    HTTP through an InProcessTransport.
+
+    Args:
+      fixtures (Optional[Dict[str, Callable]]): Fixtures keyed by endpoint
+        path. Defaults to `build_fixtures()`.
+      latency (float): Seconds to wait before answering each API request,
+        to simulate network and server time.
+      media_size (int): Size in bytes of the served media file.
+      host (str): Interface to listen on.
+      port (int): Port to listen on. The default value 0 picks a free port.
+    """
+    self.fixtures = fixtures if fixtures is not None else build_fixtures()
+    self.latency = latency
+    self.media = os.urandom(media_size)
+    self.host = host
+    self.port = port
+    self.requests = 0
+
+    self.__bodies: Dict[Tuple[str, str], bytes] = {}
+    self.__runner: Optional[web.AppRunner] = None
+
+  @property
+  def base_url(self) -> str:
+    return f'http://{self.host}:{self.port}'
+
+  @property
+  def base_api_url(self) -> str:
+    """
+    URL to set as `TikflyApi.base_api_url` to send requests to this server.
+    """
+    return f'{self.base_url}/api'
+
+  async def start(self):
+    app = web.Application()
+    app.router.add_get('/api/{endpoint:.+}', self.__api)
+    app.router.add_get('/cdn/media', self.__media)
+
+    self.__runner = web.AppRunner(app, access_log=None)
+    await self.__runner.setup()
+    site = web.TCPSite(self.__runner, self.host, self.port)
+    await site.start()
+    self.port = site._server.sockets[0].getsockname()[1]
+
+  async def stop(self):
+    if self.__runner is not None:
+      await self.__runner.cleanup()
+      self.__runner = None
+
+  async def __aenter__(self):
+    await self.start()
+    return self
+
+  async def __aexit__(self, exc_type, exc, tb):
+    await self.stop()
+
+  def body(self, endpoint: str, query: dict) -> Optional[bytes]:
+    """
+    Get the encoded body served for an endpoint and query, or None if the
+    endpoint has no fixture.
+    """
+    fixture = self.fixtures.get(endpoint)
+    if fixture is None:
+      return None
+
+    cursor = str(sorted(
+      (k, v) for k, v in query.items() if 'cursor' in k.lower()
+    ))
+    key = (endpoint, cursor)
+    body = self.__bodies.get(key)
+    if body is None:
+      body = self.__bodies[key] = json.dumps(fixture(query)).encode()
+    return body
+
+  def respond(self, endpoint: str, query: dict) -> Tuple[int, bytes]:
+    """
+    Get the status and body answered to an API request, without the
+    latency.
+    """
+    self.requests += 1
+
+    if endpoint.startswith('/download/'):
+      url = f'{self.base_url}/cdn/media'
+      return 200, json.dumps({'play': url, 'play_watermark': url}).encode()
+
+    body = self.body(endpoint, query)
+    if body is None:
+      return 404, b'{"message": "Endpoint not found"}'
+    return 200, body
+
+  async def __api(self, request: web.Request) -> web.Response:
+    if self.latency:
+      await asyncio.sleep(self.latency)
+
+    status, body = self.respond('/' + request.match_info['endpoint'], dict(request.query))
+    return web.Response(status=status, body=body, content_type='application/json')
+
+  async def __media(self, request: web.Request) -> web.StreamResponse:
+    size = len(self.media)
+    start, end = 0, size - 1
+    status = 200
+    headers = {'Accept-Ranges': 'bytes'}
+
+    header = request.headers.get('Range')
+    if header and header.startswith('bytes='):
+      first, _, last = header[6:].partition('-')
+      start = int(first)
+      end = min(int(last), size - 1) if last else size - 1
+      if start >= size:
+        return web.Response(status=416, headers={'Content-Range': f'bytes */{size}'})
+      status = 206
+      headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    return web.Response(
+      status=status,
+      body=self.media[start:end + 1],
+      headers=headers,
+      content_type='video/mp4'
+    )
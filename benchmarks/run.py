@@ -0,0 +1,317 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List
+
+import aiohttp
+
+from tikfly import TikflyApi
+from tikfly.cache import MemoryCache
+from tikfly.JsonBackend import get_json_loads
+from tikfly.JsonStream import JsonArrayStream
+
+from .fixtures import build_fixtures
+from .mock_server import MockTikflyServer
+from .transport import InProcessTransport
+
+Benchmark = Callable[[MockTikflyServer, argparse.Namespace], Awaitable[Dict[str, dict]]]
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+def benchmark(name: str):
+  """
+  Register a benchmark group under `name`.
+  """
+  def register(func: Benchmark) -> Benchmark:
+    BENCHMARKS[name] = func
+    return func
+  return register
+
+def percentile(values: List[float], q: float) -> float:
+  ordered = sorted(values)
+  index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+  return ordered[index]
+
+def latency_stats(latencies: List[float], elapsed: float) -> dict:
+  """
+  Summarize per-call latencies (in seconds) of a run lasting `elapsed`.
+  """
+  return {
+    'runs': len(latencies),
+    'ops_per_sec': len(latencies) / elapsed,
+    'p50_ms': percentile(latencies, 0.50) * 1000,
+    'p90_ms': percentile(latencies, 0.90) * 1000,
+    'p99_ms': percentile(latencies, 0.99) * 1000,
+  }
+
+async def peak_memory(call: Callable[[], Awaitable]) -> int:
+  """
+  Measure the peak memory allocated by Python while `call` runs, keeping
+  its result alive until the measure is taken.
+  """
+  tracemalloc.start()
+  try:
+    tracemalloc.reset_peak()
+    result = await call()
+    _, peak = tracemalloc.get_traced_memory()
+    del result
+  finally:
+    tracemalloc.stop()
+  return peak
+
+def make_api(server: MockTikflyServer, options: argparse.Namespace, **kwargs) -> TikflyApi:
+  if options.transport == 'inprocess':
+    kwargs['transport'] = InProcessTransport(server)
+
+  api = TikflyApi('benchmark', **kwargs)
+  api.base_api_url = server.base_api_url
+  return api
+
+async def timed_calls(call: Callable[[], Awaitable], runs: int, concurrency: int = 1) -> dict:
+  """
+  Run `call` `runs` times with at most `concurrency` calls in flight.
+  """
+  latencies = []
+  remaining = iter(range(runs))
+
+  async def worker():
+    for _ in remaining:
+      start = time.perf_counter()
+      await call()
+      latencies.append(time.perf_counter() - start)
+
+  start = time.perf_counter()
+  await asyncio.gather(*(worker() for _ in range(concurrency)))
+  return latency_stats(latencies, time.perf_counter() - start)
+
+@benchmark('request')
+async def bench_request(server: MockTikflyServer, options: argparse.Namespace) -> Dict[str, dict]:
+  """
+  Round trips to the mock server: request, response read and decode of a
+  small response, sequentially and with concurrent callers.
+  """
+  results = {}
+  async with make_api(server, options, coalesce_requests=False) as api:
+    await api.get_user_info('warmup')
+
+    results['request.user_info.sequential'] = await timed_calls(
+      lambda: api.get_user_info('taylorswift'),
+      options.runs
+    )
+    results['request.user_info.concurrent'] = await timed_calls(
+      lambda: api.get_user_info('taylorswift'),
+      options.runs * 4,
+      concurrency=options.concurrency
+    )
+    results['request.user_posts.sequential'] = await timed_calls(
+      lambda: api.get_user_posts('secUid', count=options.page_size),
+      options.runs
+    )
+  return results
+
+@benchmark('decode')
+async def bench_decode(server: MockTikflyServer, options: argparse.Namespace) -> Dict[str, dict]:
+  """
+  Decoding of large pages in every decode mode. Responses are served from
+  a warm MemoryCache, so the network is out of the measure.
+  """
+  results = {}
+  calls = {
+    'user_posts': lambda api: api.get_user_posts('secUid', count=options.page_size),
+    'user_story': lambda api: api.get_user_story('1'),
+    'post_comments': lambda api: api.get_post_comments('1', count=options.page_size),
+  }
+
+  for mode in ('namespace', 'lazy', 'schema'):
+    async with make_api(server, options, decode_mode=mode, cache=MemoryCache(ttl=3600)) as api:
+      for name, call in calls.items():
+        await call(api)
+        stats = await timed_calls(lambda: call(api), options.runs)
+        stats['peak_memory_bytes'] = await peak_memory(lambda: call(api))
+        results[f'decode.{name}.{mode}'] = stats
+  return results
+
+@benchmark('pagination')
+async def bench_pagination(server: MockTikflyServer, options: argparse.Namespace) -> Dict[str, dict]:
+  """
+  Walking every page of a user's posts with the iterator options.
+  """
+  results = {}
+  variants = {
+    'default': {},
+    'prefetch': {'prefetch': 2},
+    'stream': {'stream': True},
+    'fields': {'fields': ['id', 'stats.playCount']},
+  }
+
+  for name, kwargs in variants.items():
+    async with make_api(server, options) as api:
+      # Items are dropped as they are consumed, so the peak memory is the
+      # memory held by the iterator rather than by the results.
+      async def walk():
+        first = None
+        count = 0
+        start = time.perf_counter()
+        async for _ in api.iter_user_posts('secUid', count=options.page_size, **kwargs):
+          if first is None:
+            first = time.perf_counter() - start
+          count += 1
+        return count, first, time.perf_counter() - start
+
+      count, first, elapsed = await walk()
+      results[f'pagination.user_posts.{name}'] = {
+        'items': count,
+        'items_per_sec': count / elapsed,
+        'first_item_ms': first * 1000,
+        'total_ms': elapsed * 1000,
+        'peak_memory_bytes': await peak_memory(walk),
+      }
+  return results
+
+@benchmark('parser')
+async def bench_parser(server: MockTikflyServer, options: argparse.Namespace) -> Dict[str, dict]:
+  """
+  The streaming page parser fed a large user posts page in small and large
+  chunks, next to a single decode of the same body. Each byte should be
+  scanned once, so the time must not grow much as the chunks shrink.
+  """
+  fixtures = build_fixtures(page_size=options.page_size * 10, pages=1)
+  body = json.dumps(fixtures['/user/posts']({})).encode()
+  loads = get_json_loads()
+  runs = max(1, min(options.runs, 5))
+
+  async def decode():
+    loads(body)
+
+  results = {'parser.user_posts.loads': dict(await timed_calls(decode, runs), bytes=len(body))}
+
+  for chunk_size in (256, 4096, 65536):
+    async def parse():
+      parser = JsonArrayStream(('itemList',), loads=loads)
+      for offset in range(0, len(body), chunk_size):
+        parser.feed(body[offset:offset + chunk_size])
+      parser.close()
+
+    stats = await timed_calls(parse, runs)
+    stats['bytes'] = len(body)
+    stats['bytes_per_sec'] = len(body) * stats['ops_per_sec']
+    results[f'parser.user_posts.chunk_{chunk_size}'] = stats
+  return results
+
+@benchmark('download')
+async def bench_download(server: MockTikflyServer, options: argparse.Namespace) -> Dict[str, dict]:
+  """
+  Saving a media file to disk over one connection and in segments.
+  """
+  results = {}
+  size = len(server.media)
+
+  with tempfile.TemporaryDirectory() as directory:
+    async with make_api(server, options) as api:
+      for segments in (1, 4):
+        path = os.path.join(directory, f'media-{segments}.mp4')
+        start = time.perf_counter()
+        await api.save_video('https://www.tiktok.com/@user/video/1', path, segments=segments)
+        elapsed = time.perf_counter() - start
+        os.remove(path)
+
+        results[f'download.save_video.segments_{segments}'] = {
+          'bytes': size,
+          'bytes_per_sec': size / elapsed,
+          'total_ms': elapsed * 1000,
+        }
+  return results
+
+def collect_meta(options: argparse.Namespace) -> dict:
+  try:
+    commit = subprocess.run(
+      ['git', 'rev-parse', 'HEAD'],
+      capture_output=True,
+      text=True,
+      check=True
+    ).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    commit = None
+
+  api = TikflyApi('benchmark')
+  return {
+    'commit': commit,
+    'timestamp': datetime.now(timezone.utc).isoformat(),
+    'python': platform.python_version(),
+    'platform': platform.platform(),
+    'aiohttp': aiohttp.__version__,
+    'json_backend': getattr(api.json_loads, '__module__', None) or type(api.json_loads).__module__,
+    'options': vars(options),
+  }
+
+async def run(options: argparse.Namespace) -> dict:
+  names = [
+    name for name in BENCHMARKS
+    if not options.only or any(name.startswith(prefix) for prefix in options.only)
+  ]
+
+  results = {}
+  server = MockTikflyServer(
+    fixtures=build_fixtures(page_size=options.page_size, pages=options.pages),
+    latency=options.latency,
+    media_size=options.media_size
+  )
+  async with server:
+    for name in names:
+      print(f'Running {name} benchmarks...', file=sys.stderr)
+      results.update(await BENCHMARKS[name](server, options))
+
+  return {
+    'meta': collect_meta(options),
+    'results': results,
+  }
+
+def parse_args(argv=None) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description='Benchmark the Tikfly client against a local mock server.'
+  )
+  parser.add_argument('--output', '-o', help='Write the JSON results to this file instead of stdout.')
+  parser.add_argument('--only', nargs='*', help=f'Benchmark groups to run: {", ".join(BENCHMARKS)}.')
+  parser.add_argument('--runs', type=int, default=200, help='Calls per measure.')
+  parser.add_argument('--concurrency', type=int, default=16, help='Callers of concurrent measures.')
+  parser.add_argument('--page-size', type=int, default=35, help='Items per page of list endpoints.')
+  parser.add_argument('--pages', type=int, default=10, help='Pages served by list endpoints.')
+  parser.add_argument('--latency', type=float, default=0.005, help='Seconds the server waits before each API response.')
+  parser.add_argument('--media-size', type=int, default=32 * 1024 * 1024, help='Size in bytes of the served media file.')
+  parser.add_argument(
+    '--transport',
+    choices=('http', 'inprocess'),
+    default='http',
+    help='Send API requests over HTTP to the mock server, or answer them in process to leave out the HTTP stack.'
+  )
+  parser.add_argument('--quick', action='store_true', help='Fewer runs and smaller payloads, for smoke tests.')
+
+  options = parser.parse_args(argv)
+  if options.quick:
+    options.runs = min(options.runs, 20)
+    options.pages = min(options.pages, 3)
+    options.media_size = min(options.media_size, 4 * 1024 * 1024)
+  return options
+
+def main(argv=None):
+  options = parse_args(argv)
+  report = asyncio.run(run(options))
+
+  output = json.dumps(report, indent=2)
+  if options.output:
+    with open(options.output, 'w') as file:
+      file.write(output + '\n')
+    print(f'Results written to {options.output}', file=sys.stderr)
+  else:
+    print(output)
+
+if __name__ == '__main__':
+  main()
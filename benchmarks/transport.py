@@ -0,0 +1,41 @@
+import asyncio
+from typing import Mapping, Optional
+
+from tikfly.RawResponse import RawResponse
+from tikfly.RequestTiming import RequestTiming
+from tikfly.transports import BaseTransport
+
+from .mock_server import MockTikflyServer
+
+class InProcessTransport(BaseTransport):
+  def __init__(self, server: MockTikflyServer):
+    """
+    Transport answering API requests straight from the fixtures of a mock
+    server, without sockets or HTTP parsing. It takes the server latency
+    into account, so the measures only leave out the HTTP stack.
+
+    Args:
+      server (MockTikflyServer): Server whose fixtures are served. It only
+        has to be running for media downloads.
+    """
+    self.server = server
+
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    if self.server.latency:
+      await asyncio.sleep(self.server.latency)
+
+    endpoint = url[len(self.server.base_api_url):]
+    status, body = self.server.respond(endpoint, {k: str(v) for k, v in params.items()})
+    return RawResponse(
+      status=status,
+      body=body,
+      url=url,
+      headers={'Content-Type': 'application/json'},
+      timing=timing
+    )
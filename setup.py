@@ -15,12 +15,18 @@ setup(
     'Source': 'https://github.com/tikfly/tikfly-api-py',
   },
   keywords=['tiktok', 'api', 'unofficial', 'python', 'tikfly'],
-  packages=find_packages(),
+  packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
   license='MIT',
+  python_requires='>=3.10',
   install_requires=[
     'aiohttp>=3.13.3,<4.0.0',
     'certifi>=2025.11.12',
   ],
+  extras_require={
+    'orjson': ['orjson>=3.9'],
+    'msgspec': ['msgspec>=0.18'],
+    'http2': ['httpx[http2]>=0.24'],
+  },
   long_description=long_description,
   long_description_content_type='text/markdown'
 )
@@ -0,0 +1,50 @@
+import asyncio
+from tikfly import TikflyApi
+from tikfly.exceptions.TikflyApiError import TikflyAPIError
+from benchmarks.mock_server import MockTikflyServer
+
+# Runs offline against the benchmark mock server: python -m tests.close_while_iterating
+# Closing the client while an iterator is consumed must end the iterator
+# with an error instead of leaving the consumer waiting forever.
+
+TIMEOUT = 5 # Seconds after which the consumer is considered stuck
+
+async def consume_then_close(tikfly: TikflyApi, iterator, close_after: int = 5) -> str:
+  received = 0
+  try:
+    async for _ in iterator:
+      received += 1
+      if received == close_after:
+        asyncio.ensure_future(tikfly.aclose())
+  except TikflyAPIError as err:
+    return f'stopped after {received} results: {err}'
+  return f'finished after {received} results'
+
+async def close_while_iterating():
+  async with MockTikflyServer(latency=0.02) as server:
+    iterators = {
+      'iter_user_posts': lambda tikfly: tikfly.iter_user_posts('secUid', count=5),
+      'iter_user_posts(prefetch=2)': lambda tikfly: tikfly.iter_user_posts('secUid', count=5, prefetch=2),
+      'get_user_info_many': lambda tikfly: tikfly.get_user_info_many(
+        [f'user{i}' for i in range(100)],
+        concurrency=3
+      ),
+    }
+
+    for name, make_iterator in iterators.items():
+      tikfly = TikflyApi(x_rapidapi_key='offline')
+      tikfly.base_api_url = server.base_api_url
+
+      try:
+        outcome = await asyncio.wait_for(
+          consume_then_close(tikfly, make_iterator(tikfly)),
+          TIMEOUT
+        )
+      except asyncio.TimeoutError:
+        raise SystemExit(f'{name}: still waiting {TIMEOUT}s after aclose()')
+      finally:
+        await tikfly.aclose()
+
+      print(f'{name}: {outcome}')
+
+asyncio.run(close_while_iterating())
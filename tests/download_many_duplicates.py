@@ -0,0 +1,49 @@
+import asyncio
+import tempfile
+from typing import Mapping
+from tikfly import TikflyApi, RawResponse
+from tikfly.transports import AiohttpTransport
+from benchmarks.mock_server import MockTikflyServer
+
+# Runs offline against the benchmark mock server: python -m tests.download_many_duplicates
+# A URL with the same video ID as a failed download must be downloaded
+# itself instead of being reported as a duplicate.
+
+VIDEO_URLS = [
+  'https://www.tiktok.com/@tikfly/video/7558098574555254046?broken=1',
+  'https://www.tiktok.com/@tikfly/video/7558098574555254046',
+  'https://www.tiktok.com/@tikfly/video/7558098574555254046?lang=en',
+]
+
+class BrokenLinkTransport(AiohttpTransport):
+  """
+  Answers the download URL requests of video URLs marked broken with an
+  error, as the API does for URLs it cannot resolve.
+  """
+  async def send(self, url: str, params: Mapping, headers: Mapping[str, str], timing=None):
+    if 'broken=1' in str(params.get('url', '')):
+      return RawResponse(
+        status=400,
+        body=b'{"message": "Invalid video URL"}',
+        url=url,
+        headers={'Content-Type': 'application/json'},
+        timing=timing
+      )
+    return await super().send(url, params, headers, timing)
+
+async def download_many_duplicates():
+  async with MockTikflyServer(media_size=1024 * 1024) as server:
+    async with TikflyApi(x_rapidapi_key='offline', transport=BrokenLinkTransport()) as tikfly:
+      tikfly.base_api_url = server.base_api_url
+
+      batch = tikfly.download_many(VIDEO_URLS, tempfile.mkdtemp())
+      statuses = {result.url: result.status async for result in batch}
+
+  for url, status in statuses.items():
+    print(f'{status}: {url}')
+
+  expected = ['failed', 'downloaded', 'duplicate']
+  if [statuses[url] for url in VIDEO_URLS] != expected:
+    raise SystemExit(f'expected {expected}')
+
+asyncio.run(download_many_duplicates())
@@ -1,7 +1,4 @@
-import ssl
 import asyncio
-import certifi
-import aiohttp
 from tikfly import TikflyApi
 
 API_KEY = 'YOUR_API_KEY' # How to get your api key -> https://docs.tikfly.io/getting-started/quickstart
@@ -9,29 +6,17 @@ VIDEO_URLS = [
   'https://www.tiktok.com/@taylorswift/video/7558098574555254046'
 ]
 
-async def download_video(url: str, save_path: str):
-  CHUNK_SIZE = 1024 * 1024
-  ssl_context = ssl.create_default_context(cafile=certifi.where())
-  async with aiohttp.ClientSession() as session:
-    async with session.get(url, ssl=ssl_context) as resp:
-      resp.raise_for_status()
-
-      with open(save_path, 'wb') as f:
-        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
-            f.write(chunk)
-
-  print(f'Saved video to: {save_path}')
+def print_progress(written: int, total: int):
+  if total:
+    print(f'\r{written * 100 // total}%', end='', flush=True)
 
 async def download_tiktok_videos():
-  tikfly = TikflyApi(x_rapidapi_key=API_KEY)
-
-  for url in VIDEO_URLS:
-    res = await tikfly.download_video(url)
-    download_url = res.play
-    print(f'Download URL: {download_url}')
-
-    if download_url:
+  async with TikflyApi(x_rapidapi_key=API_KEY) as tikfly:
+    for url in VIDEO_URLS:
       video_id = url.rstrip('/').split('/')[-1]
-      await download_video(download_url, f'{video_id}.mp4')
+      save_path = f'{video_id}.mp4'
+
+      await tikfly.save_video(url, save_path, progress=print_progress)
+      print(f'\nSaved video to: {save_path}')
 
 asyncio.run(download_tiktok_videos())
@@ -7,39 +7,17 @@ USERNAME = 'taylorswift' # Change to the user you want to get data from
 NUM = 50 # Max number of videos to fetch
 
 async def get_tiktok_user_videos():
-  tikfly = TikflyApi(x_rapidapi_key=API_KEY)
+  async with TikflyApi(x_rapidapi_key=API_KEY) as tikfly:
+    print(f'Fetching {NUM} videos of user: {USERNAME}')
+    res_user_info = await tikfly.get_user_info(USERNAME)
 
-  print(f'Fetching {NUM} videos of user: {USERNAME}')
-  res_user_info = await tikfly.get_user_info(USERNAME)
+    user_sec_uid = res_user_info.userInfo.user.secUid
+    print('User secUid:', user_sec_uid)
 
-  user_sec_uid = res_user_info.userInfo.user.secUid
-  print('User secUid:', user_sec_uid)
+    results: list[VideoItem] = []
 
-  results: list[VideoItem] = []
-  cursor = 0
-  count = 15
-  has_more = True
-
-  while has_more and len(results) < NUM:
-    print(f'Current cursor: {cursor}')
-    res_user_posts = await tikfly.get_user_posts(
-      user_sec_uid,
-      count=count,
-      cursor=cursor
-    )
-    
-    itemList = getattr(res_user_posts, 'itemList', [])
-
-    if not itemList:
-      break
-
-    results.extend(itemList)
-
-    remaining = NUM - len(results)
-    results.extend(itemList[:remaining])
-
-    has_more = res_user_posts.hasMore
-    cursor = res_user_posts.cursor
+    async for video in tikfly.iter_user_posts(user_sec_uid, count=15, limit=NUM):
+      results.append(video)
 
   for video in results:
     print(f'- {video.id}: {video.desc}')
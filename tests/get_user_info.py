@@ -5,9 +5,8 @@ API_KEY = 'YOUR_API_KEY' # How to get your api key -> https://docs.tikfly.io/get
 USERNAME = 'taylorswift' # Change to the user you want to get data from
 
 async def get_tiktok_user_info():
-  tikfly = TikflyApi(x_rapidapi_key=API_KEY)
-
-  res_user_info = await tikfly.get_user_info(unique_id=USERNAME)
+  async with TikflyApi(x_rapidapi_key=API_KEY) as tikfly:
+    res_user_info = await tikfly.get_user_info(unique_id=USERNAME)
 
   print(res_user_info.userInfo)
 
@@ -0,0 +1,47 @@
+import time
+import asyncio
+from tikfly.RateLimiter import RateLimiter
+
+# Runs offline: python -m tests.rate_limit_after_block
+# Callers queued while the quota is exhausted must be released at the
+# limiter's pace once the window resets, not all at once.
+
+RATE = 10
+BURST = 2
+RESET = 1 # Seconds until the quota window resets
+CALLERS = 25
+TOLERANCE = 0.03 # Seconds of scheduling jitter allowed
+
+async def rate_limit_after_block():
+  limiter = RateLimiter(RATE, burst=BURST)
+  released = []
+
+  async def call(start: float):
+    await limiter.acquire()
+    released.append(time.monotonic() - start)
+
+  start = time.monotonic()
+  # Callers already waiting when the quota runs out queue again after the reset
+  waiting = [asyncio.ensure_future(call(start)) for _ in range(BURST + 3)]
+  await asyncio.sleep(0)
+
+  limiter.update_from_headers({
+    'x-ratelimit-requests-remaining': '0',
+    'x-ratelimit-requests-reset': str(RESET),
+  })
+  await asyncio.gather(*waiting, *(call(start) for _ in range(CALLERS)))
+
+  # The first callers took the tokens in the bucket before the quota ran out
+  released.sort()
+  queued = released[BURST:]
+  if released[BURST - 1] > TOLERANCE:
+    raise SystemExit(f'{BURST} callers should have been released at once')
+
+  for i, at in enumerate(queued):
+    due = RESET + max(0, i - BURST + 1) / RATE
+    if abs(at - due) > TOLERANCE:
+      raise SystemExit(f'queued caller {i} released at {at:.3f}s instead of {due:.3f}s')
+
+  print(f'{len(queued)} queued callers released from {queued[0]:.2f}s to {queued[-1]:.2f}s: {BURST} at the reset, then one every {1 / RATE:.2f}s')
+
+asyncio.run(rate_limit_after_block())
@@ -0,0 +1,48 @@
+import os
+import json
+from tikfly import schemas
+from tikfly.JsonBackend import TypedJsonDecoder, NOT_DECODED
+from tikfly.schemas.SchemaDecoder import decode
+
+# Runs offline on the example responses: python -m tests.schema_decode_examples
+# Every example must be decoded by msgspec in schema mode, into the same
+# objects as the generic decoder, instead of falling back to it.
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+SCHEMAS = {
+  'effect-info.json': schemas.EffectInfoResponse,
+  'hashtag-info.json': schemas.ChallengeInfoResponse,
+  'music-info.json': schemas.MusicInfoResponse,
+  'place-info.json': schemas.PlaceInfoResponse,
+  'post-comments.json': schemas.CommentListResponse,
+  'post-detail.json': schemas.PostDetailResponse,
+  'search-account.json': schemas.SearchAccountResponse,
+  'search-general.json': schemas.SearchGeneralResponse,
+  'search-live.json': schemas.SearchLiveResponse,
+  'user-followers.json': schemas.UserFollowerResponse,
+  'user-following.json': schemas.UserFollowingResponse,
+  'user-info.json': schemas.UserInfoResponse,
+  'user-playlist.json': schemas.UserPlaylistResponse,
+  'user-posts.json': schemas.UserPostResponse,
+  'user-story.json': schemas.UserStoryResponse,
+}
+
+def schema_decode_examples():
+  if not TypedJsonDecoder.available():
+    print('skipped, msgspec is not installed (pip install msgspec)')
+    return
+
+  for name, schema in SCHEMAS.items():
+    with open(os.path.join(EXAMPLES_DIR, name), 'rb') as file:
+      body = file.read()
+
+    res = TypedJsonDecoder().decode(body, schema)
+    if res is NOT_DECODED:
+      raise SystemExit(f'{name}: not decoded by msgspec into {schema.__name__}')
+    if res != decode(schema, json.loads(body)):
+      raise SystemExit(f'{name}: msgspec and the generic decoder disagree')
+
+    print(f'{name}: decoded by msgspec into {schema.__name__}')
+
+schema_decode_examples()
@@ -0,0 +1,89 @@
+import os
+import asyncio
+import tempfile
+from tikfly import TikflyApi
+from tikfly.transports import AiohttpTransport, HttpxTransport, RecordingTransport, ReplayTransport
+from benchmarks.mock_server import MockTikflyServer
+
+try:
+  import httpx
+except ImportError:
+  httpx = None
+
+# Runs offline against the benchmark mock server: python -m tests.transports_offline
+# Every transport must return the same responses for the same requests, and
+# close its connections with the event loop they were opened in.
+
+async def workload(tikfly: TikflyApi) -> list:
+  info = await tikfly.get_user_info('tikfly', raw=True)
+  posts = [
+    item['id'] async for item in
+    tikfly.iter_user_posts('secUid', count=10, max_pages=3, stream=True, fields=['id'])
+  ]
+  return [info.status, info.body, posts]
+
+async def run(server: MockTikflyServer, transport) -> list:
+  async with TikflyApi(x_rapidapi_key='offline', transport=transport) as tikfly:
+    tikfly.base_api_url = server.base_api_url
+    return await workload(tikfly)
+
+async def transports_offline():
+  cassette = os.path.join(tempfile.mkdtemp(), 'traffic.cassette.gz')
+
+  async with MockTikflyServer() as server:
+    expected = await run(server, AiohttpTransport())
+    print(f'AiohttpTransport: {len(expected[2])} posts')
+
+    if httpx is None:
+      print('HttpxTransport: skipped, httpx is not installed (pip install tikfly[http2])')
+    elif await run(server, HttpxTransport(timeout=10)) != expected:
+      raise SystemExit('HttpxTransport: responses differ from AiohttpTransport')
+    else:
+      print('HttpxTransport: same responses')
+
+    recording = RecordingTransport(cassette)
+    if await run(server, recording) != expected:
+      raise SystemExit('RecordingTransport: responses differ from AiohttpTransport')
+    print(f'RecordingTransport: {recording.recorded} responses recorded')
+
+  # The server is stopped: replayed responses come from the cassette only
+  replay = ReplayTransport(cassette, speed=None)
+  if await run(server, replay) != expected:
+    raise SystemExit('ReplayTransport: responses differ from the recording')
+  print(f'ReplayTransport: {replay.replayed} responses replayed')
+
+def reuse_across_loops(name: str, transport, get_pool, is_closed):
+  async def send_once():
+    async with MockTikflyServer() as server:
+      await transport.send(f'{server.base_api_url}/user/info', {'uniqueId': 'tikfly'}, {})
+      return get_pool()
+
+  async def close():
+    await transport.aclose()
+
+  # The transport is not closed before each loop ends
+  pools = [asyncio.run(send_once()), asyncio.run(send_once())]
+  asyncio.run(close())
+
+  if not all(is_closed(pool) for pool in pools):
+    raise SystemExit(f'{name}: connections left open once their event loop ended')
+  print(f'{name}: connections closed with their event loop')
+
+asyncio.run(transports_offline())
+
+aiohttp_transport = AiohttpTransport()
+reuse_across_loops(
+  'AiohttpTransport',
+  aiohttp_transport,
+  aiohttp_transport.get_session,
+  lambda session: session.closed
+)
+
+if httpx is not None:
+  httpx_transport = HttpxTransport(timeout=10)
+  reuse_across_loops(
+    'HttpxTransport',
+    httpx_transport,
+    httpx_transport.get_client,
+    lambda client: client.is_closed
+  )
@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Literal, Optional
+
+@dataclass(slots=True)
+class DownloadResult:
+  """
+  Outcome of one URL of a `download_many` batch.
+
+  Args:
+    url (str): TikTok video URL, as given.
+    video_id (str): Video ID parsed from the URL, or the last path segment
+      of URLs without one (e.g. short links).
+    path (str): Destination file path.
+    status (Literal['downloaded', 'skipped', 'duplicate', 'failed']):
+      - "downloaded": The file was downloaded.
+      - "skipped": The file already existed and was left untouched.
+      - "duplicate": An earlier URL of the batch has the same video ID and
+        was downloaded or skipped.
+      - "failed": The download failed; see `error`.
+    size (int): Size of the file, or 0 if it was not downloaded.
+    error (Optional[Exception]): Error raised for a failed download.
+  """
+  url: str
+  video_id: str
+  path: str
+  status: Literal['downloaded', 'skipped', 'duplicate', 'failed']
+  size: int = 0
+  error: Optional[Exception] = None
+
+@dataclass(slots=True)
+class DownloadSummary:
+  """
+  Running totals of a `download_many` batch.
+
+  Args:
+    downloaded (int): Number of files downloaded.
+    skipped (int): Number of files already on disk.
+    duplicates (int): Number of URLs collapsed into an earlier successful one.
+    failed (int): Number of failed downloads.
+    bytes (int): Total size of the downloaded files.
+    elapsed (float): Seconds since the batch started.
+  """
+  downloaded: int = 0
+  skipped: int = 0
+  duplicates: int = 0
+  failed: int = 0
+  bytes: int = 0
+  elapsed: float = 0.0
+
+  @property
+  def rate(self) -> float:
+    """
+    Average download rate in bytes per second.
+    """
+    return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+class DownloadBatch():
+  def __init__(self, results: AsyncIterator[DownloadResult]):
+    """
+    Results of a `download_many` call.
+
+    Iterate over the batch with `async for` to run it; results are yielded
+    in completion order. `summary` is updated as results come in and holds
+    the final totals once the iteration is over.
+
+    Args:
+      results (AsyncIterator[DownloadResult]): Results of the batch.
+    """
+    self.summary = DownloadSummary()
+    self.__results = results
+
+  def __aiter__(self) -> AsyncIterator[DownloadResult]:
+    return self.__iterate()
+
+  async def __iterate(self) -> AsyncIterator[DownloadResult]:
+    summary = self.summary
+    start = time.perf_counter() - summary.elapsed
+
+    try:
+      async for result in self.__results:
+        if result.status == 'downloaded':
+          summary.downloaded += 1
+          summary.bytes += result.size
+        elif result.status == 'skipped':
+          summary.skipped += 1
+        elif result.status == 'duplicate':
+          summary.duplicates += 1
+        else:
+          summary.failed += 1
+
+        summary.elapsed = time.perf_counter() - start
+        yield result
+    finally:
+      summary.elapsed = time.perf_counter() - start
+      await self.__results.aclose()
@@ -0,0 +1,93 @@
+import json
+from typing import Any, Callable, Optional
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+try:
+  import msgspec
+except ImportError:
+  msgspec = None
+
+JsonLoads = Callable[[bytes], Any]
+
+NOT_DECODED = object()
+
+# Consecutive bodies not matching a schema after which msgspec is no longer
+# tried for it.
+MAX_SCHEMA_MISMATCHES = 3
+
+def get_json_loads() -> JsonLoads:
+  """
+  Get the fastest available JSON decoder.
+
+  orjson is used when installed, then msgspec, and the standard library
+  `json` module otherwise.
+
+  Returns:
+    Callable[[bytes], Any]: A function decoding a JSON body into Python objects.
+  """
+  if orjson is not None:
+    return orjson.loads
+  if msgspec is not None:
+    return msgspec.json.Decoder().decode
+  return json.loads
+
+class TypedJsonDecoder():
+  def __init__(self):
+    """
+    Decode JSON bodies straight into schema dataclasses with msgspec.
+
+    msgspec builds the dataclass instances while parsing, without an
+    intermediate dict. It validates the body against the schema: schema
+    fields are optional, but a body with mismatching types cannot be
+    decoded this way and `decode` returns NOT_DECODED so the caller falls
+    back to the generic path for that response. A schema failing on
+    `MAX_SCHEMA_MISMATCHES` bodies in a row is marked unsupported, so
+    callers stop paying for a failed parse on every response.
+    """
+    self.__decoders = {}
+    self.__mismatches = {}
+    self.__unsupported = set()
+
+  @staticmethod
+  def available() -> bool:
+    """
+    Whether msgspec is installed.
+    """
+    return msgspec is not None
+
+  def decode(self, body: bytes, schema: Optional[type]) -> Any:
+    """
+    Decode a body into an instance of `schema`.
+
+    Returns:
+      Any: The decoded instance, or NOT_DECODED if msgspec is not installed,
+      no schema is given or the body does not match the schema.
+    """
+    if msgspec is None or schema is None or schema in self.__unsupported:
+      return NOT_DECODED
+
+    decoder = self.__decoders.get(schema)
+    if decoder is None:
+      try:
+        decoder = msgspec.json.Decoder(schema, strict=False)
+      except TypeError:
+        self.__unsupported.add(schema)
+        return NOT_DECODED
+      self.__decoders[schema] = decoder
+
+    try:
+      res = decoder.decode(body)
+    except msgspec.ValidationError:
+      mismatches = self.__mismatches.get(schema, 0) + 1
+      self.__mismatches[schema] = mismatches
+      if mismatches >= MAX_SCHEMA_MISMATCHES:
+        self.__unsupported.add(schema)
+      return NOT_DECODED
+
+    if schema in self.__mismatches:
+      del self.__mismatches[schema]
+    return res
@@ -0,0 +1,254 @@
+import re
+import json
+from typing import Any, Callable, Iterable, Optional
+
+WHITESPACE = re.compile(rb'[ \t\n\r]*')
+STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# Skips to the next bracket outside of a string. It stops at the opening
+# quote of a string that is not complete yet.
+CONTENT = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.S)
+SCALAR_END = re.compile(rb'[ \t\n\r,\]}]')
+
+OPEN_OBJECT, CLOSE_OBJECT = ord('{'), ord('}')
+OPEN_ARRAY, CLOSE_ARRAY = ord('['), ord(']')
+QUOTE, COMMA, COLON = ord('"'), ord(','), ord(':')
+
+class ValueScanner():
+  __slots__ = ('start', 'offset', 'depth')
+
+  def __init__(self, start: int):
+    """
+    Resumable search of the end of the JSON value starting at `start`.
+
+    `scan` is called again each time more bytes are available and goes on
+    from where the previous call stopped, so a value received in many
+    chunks is scanned once, not once per chunk.
+    """
+    self.start = start
+    self.offset = start
+    self.depth = 0
+
+  def shift(self, count: int):
+    """
+    Move the positions back after `count` bytes were dropped from the
+    front of the buffer.
+    """
+    self.start -= count
+    self.offset -= count
+
+  def scan(self, buf: bytearray) -> Optional[int]:
+    """
+    Find the end of the value.
+
+    Returns:
+      Optional[int]: Index just past the value, or None if the buffer ends
+      before the value is complete.
+    """
+    first = buf[self.start]
+
+    if first == QUOTE:
+      match = STRING.match(buf, self.start)
+      return match.end() if match else None
+
+    if first not in (OPEN_OBJECT, OPEN_ARRAY):
+      match = SCALAR_END.search(buf, self.offset)
+      if match is None:
+        self.offset = len(buf)
+        return None
+      return match.start()
+
+    size = len(buf)
+    i = self.offset
+    depth = self.depth
+
+    while True:
+      i = CONTENT.match(buf, i).end()
+      # The end of the buffer, or an incomplete string to scan again
+      # once more bytes have arrived.
+      if i >= size or buf[i] == QUOTE:
+        self.offset = i
+        self.depth = depth
+        return None
+
+      depth += 1 if buf[i] in (OPEN_OBJECT, OPEN_ARRAY) else -1
+      i += 1
+      if depth == 0:
+        return i
+
+class JsonArrayStream():
+  def __init__(
+    self,
+    array_keys: Iterable[str],
+    loads: Callable[[bytes], Any] = json.loads,
+    container_keys: Iterable[str] = ('data',)
+  ):
+    """
+    Incremental parser yielding the elements of an array inside a JSON object.
+
+    Chunks of the body are passed to `feed` as they arrive. Each element of
+    an array found under one of `array_keys`, either at the top level or
+    inside a top-level object under one of `container_keys` (e.g.
+    `{"data": {"itemList": [...]}}`), is decoded with `loads` and returned
+    as soon as its last byte has been received. Every other field is
+    decoded whole and kept in `meta`, with the same nesting, so cursor
+    fields can be read once the body is complete.
+
+    Only the bytes of the element being received are buffered, so memory
+    stays flat however many elements the array holds, and each byte is
+    scanned once whatever the size of the chunks.
+
+    Args:
+      array_keys (Iterable[str]): Keys of the arrays to stream.
+      loads (Callable[[bytes], Any]): JSON decoder used for each value.
+      container_keys (Iterable[str]): Keys of top-level objects searched
+        for the arrays.
+    """
+    self.array_keys = frozenset(array_keys)
+    self.container_keys = frozenset(container_keys)
+    self.meta: dict = {}
+
+    self.__loads = loads
+    self.__buf = bytearray()
+    self.__pos = 0
+    self.__scanner: Optional[ValueScanner] = None
+    self.__stack: list = []
+    self.__started = False
+    self.__done = False
+
+  def feed(self, chunk: bytes) -> list:
+    """
+    Parse the next chunk of the body.
+
+    Returns:
+      list: Array elements completed by this chunk, in order.
+
+    Raises:
+      ValueError: If the body is not valid JSON or not a JSON object.
+    """
+    self.__buf += chunk
+
+    items = []
+    self.__parse(items)
+
+    # Drop the parsed bytes. Deleting the front of a bytearray does not
+    # move the rest of the buffer.
+    if self.__pos:
+      del self.__buf[:self.__pos]
+      if self.__scanner is not None:
+        self.__scanner.shift(self.__pos)
+      self.__pos = 0
+    return items
+
+  def close(self):
+    """
+    Check that the whole body has been parsed.
+
+    Raises:
+      ValueError: If the body ended before the top-level object was closed.
+    """
+    if not self.__done:
+      raise ValueError('JSON body ended before the top-level object was closed')
+
+  def __parse(self, items: list):
+    buf = self.__buf
+    pos = self.__pos
+    stack = self.__stack
+
+    while True:
+      pos = WHITESPACE.match(buf, pos).end()
+      if pos >= len(buf):
+        break
+
+      char = buf[pos]
+
+      if self.__done:
+        raise ValueError(f'Unexpected data after the JSON object at byte {pos}')
+
+      if not self.__started:
+        if char != OPEN_OBJECT:
+          raise ValueError('JSON body is not an object')
+        stack.append(['object', self.meta, 1, 'key', None])
+        self.__started = True
+        pos += 1
+        continue
+
+      frame = stack[-1]
+
+      if frame[0] == 'array':
+        if char == COMMA:
+          pos += 1
+          continue
+        if char == CLOSE_ARRAY:
+          stack.pop()
+          pos += 1
+          continue
+
+        end = self.__scan(buf, pos)
+        if end is None:
+          break
+        items.append(self.__loads(bytes(buf[pos:end])))
+        pos = end
+        continue
+
+      kind, target, depth, state, key = frame
+
+      if state == 'key':
+        if char == COMMA:
+          pos += 1
+        elif char == CLOSE_OBJECT:
+          stack.pop()
+          pos += 1
+          if not stack:
+            self.__done = True
+        elif char == QUOTE:
+          match = STRING.match(buf, pos)
+          if match is None:
+            break
+          frame[4] = json.loads(bytes(buf[pos:match.end()]))
+          frame[3] = 'colon'
+          pos = match.end()
+        else:
+          raise ValueError(f'Expected an object key at byte {pos}')
+        continue
+
+      if state == 'colon':
+        if char != COLON:
+          raise ValueError(f'Expected ":" at byte {pos}')
+        frame[3] = 'value'
+        pos += 1
+        continue
+
+      frame[3] = 'key'
+
+      if char == OPEN_ARRAY and key in self.array_keys:
+        stack.append(['array'])
+        pos += 1
+        continue
+
+      if char == OPEN_OBJECT and key in self.container_keys and depth == 1:
+        nested = target[key] = {}
+        stack.append(['object', nested, 2, 'key', None])
+        pos += 1
+        continue
+
+      end = self.__scan(buf, pos)
+      if end is None:
+        frame[3] = 'value'
+        break
+      target[key] = self.__loads(bytes(buf[pos:end]))
+      pos = end
+
+    self.__pos = pos
+
+  def __scan(self, buf: bytearray, pos: int) -> Optional[int]:
+    """
+    Find the end of the value at `pos`, resuming the scan left incomplete
+    by the previous chunk.
+    """
+    scanner = self.__scanner
+    if scanner is None or scanner.start != pos:
+      scanner = ValueScanner(pos)
+
+    end = scanner.scan(buf)
+    self.__scanner = scanner if end is None else None
+    return end
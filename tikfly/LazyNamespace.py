@@ -0,0 +1,65 @@
+from typing import Any
+
+class LazyNamespace():
+  """
+  Attribute view over a decoded JSON object that converts lazily.
+
+  Nested objects are wrapped only when their attribute is first read, and
+  the converted value is stored on the instance so later reads are plain
+  attribute lookups. Reading five fields of a large response therefore
+  builds a handful of objects instead of one per nested dict.
+
+  It behaves like the SimpleNamespace trees returned by default: fields
+  are read as attributes (e.g. `res.userInfo.user.secUid`), a missing
+  field raises AttributeError, and `getattr(res, 'field', default)` works.
+  The class defines no public methods so no JSON key is ever shadowed.
+  """
+
+  def __init__(self, data: dict):
+    self.__data = data
+
+  def __getattr__(self, name: str):
+    if name.startswith('_LazyNamespace__'):
+      raise AttributeError(name)
+
+    try:
+      value = self.__data[name]
+    except KeyError:
+      raise AttributeError(
+        f"'{type(self).__name__}' object has no attribute '{name}'"
+      ) from None
+
+    value = to_lazy_namespace(value)
+    self.__dict__[name] = value
+    return value
+
+  def __fields(self) -> dict:
+    fields = {name: getattr(self, name) for name in self.__data}
+    fields.update(
+      (k, v) for k, v in self.__dict__.items()
+      if not k.startswith('_LazyNamespace__')
+    )
+    return fields
+
+  def __dir__(self):
+    return list(self.__fields())
+
+  def __eq__(self, other):
+    if not isinstance(other, LazyNamespace):
+      return NotImplemented
+    return self.__fields() == other.__fields()
+
+  def __repr__(self):
+    items = ', '.join(f'{k}={v!r}' for k, v in self.__fields().items())
+    return f'{type(self).__name__}({items})'
+
+def to_lazy_namespace(value: Any) -> Any:
+  """
+  Wrap a decoded JSON value: objects become LazyNamespace instances and
+  lists are wrapped element by element, without descending further.
+  """
+  if isinstance(value, dict):
+    return LazyNamespace(value)
+  if isinstance(value, list):
+    return [to_lazy_namespace(v) for v in value]
+  return value
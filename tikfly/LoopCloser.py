@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+class LoopCloser():
+  def __init__(self, close: Callable[[], Awaitable[None]], name: str):
+    """
+    Close a pooled session or client with the event loop it was created in.
+
+    Connections belong to the loop that opened them and only that loop can
+    close them, so a session left open when its loop ends leaks its sockets.
+    The closer runs a task in the current loop that closes the session once
+    it is cancelled: `asyncio.run` cancels the remaining tasks before it
+    closes the loop, so the session is closed by its own loop even when the
+    client is not.
+
+    Must be created from a running event loop.
+
+    Args:
+      close (Callable[[], Awaitable[None]]): Closes the session, e.g.
+        `session.close`.
+      name (str): Name of the session in log messages.
+    """
+    self.loop = asyncio.get_running_loop()
+    self.name = name
+    self.__close = close
+    self.__closed = False
+    self.__task = self.loop.create_task(self.__close_on_cancel())
+
+  async def __close_on_cancel(self):
+    try:
+      await asyncio.Event().wait()
+    except asyncio.CancelledError:
+      if not self.__closed:
+        self.__closed = True
+        await self.__close()
+
+  async def aclose(self):
+    """
+    Close the session now. From another event loop, see `discard`.
+    """
+    if self.loop is not asyncio.get_running_loop():
+      self.discard()
+      return
+
+    self.__task.cancel()
+    if not self.__closed:
+      self.__closed = True
+      await self.__close()
+
+  def discard(self):
+    """
+    Close the session from another event loop, without waiting.
+
+    If the session's loop still runs (e.g. in another thread), the session
+    is closed there. If that loop ended without cancelling its tasks, as
+    `loop.close()` after `run_until_complete` does, nothing can close the
+    connections anymore: they are left to the garbage collector and a
+    warning is logged.
+    """
+    if self.__closed:
+      return
+
+    if self.loop.is_running():
+      asyncio.run_coroutine_threadsafe(self.aclose(), self.loop)
+      return
+
+    logger.warning(
+      '%s of a %s event loop could not be closed and is left to the garbage '
+      'collector; close the client with aclose() before its event loop ends',
+      self.name,
+      'closed' if self.loop.is_closed() else 'stopped'
+    )
@@ -0,0 +1,645 @@
+import os
+import re
+import ssl
+import asyncio
+import aiohttp
+from contextlib import nullcontext
+from typing import Awaitable, Callable, Optional, Tuple, Union
+
+from .RetryPolicy import RetryPolicy, DEFAULT_RETRY_STATUSES
+from .LoopCloser import LoopCloser
+from .exceptions.TikflyApiError import TikflyAPIError
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+UrlResolver = Callable[[], Awaitable[str]]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Statuses the CDN answers with once a signed URL has expired.
+EXPIRED_STATUSES = frozenset({401, 403, 404, 410})
+
+# Files are not split into segments smaller than this.
+MIN_SEGMENT_SIZE = 1024 * 1024
+
+CONTENT_RANGE = re.compile(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)')
+
+def parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+  """
+  Parse a Content-Range header (e.g. "bytes 100-199/1000" or "bytes */1000").
+
+  Returns:
+    Tuple[Optional[int], Optional[int]]: The first byte position and the
+    total size, each None when absent or unknown.
+  """
+  match = CONTENT_RANGE.match(value or '')
+  if match is None:
+    return None, None
+
+  start, total = match.groups()
+  return (
+    int(start) if start is not None else None,
+    int(total) if total != '*' else None
+  )
+
+class MediaDownloader():
+  def __init__(
+    self,
+    ssl_context: ssl.SSLContext,
+    connector_limit: int = 100,
+    connector_limit_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    dns_cache_ttl: Optional[int] = 300,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sock_read_timeout: float = 60.0,
+    retry_policy: Optional[RetryPolicy] = None
+  ):
+    """
+    Stream media files from the TikTok CDN to disk.
+
+    The downloader owns its own pooled session, separate from the API
+    session, so the RapidAPI headers are never sent to the CDN and media
+    transfers do not hold API connections. The session has no total
+    timeout, since large files can take minutes, only a read timeout.
+
+    Args:
+      ssl_context (ssl.SSLContext): SSL context used for CDN connections.
+      connector_limit (int): Maximum number of simultaneous connections
+        in the pool. Use 0 for no limit. The default value is 100.
+      connector_limit_per_host (int): Maximum number of simultaneous
+        connections to the same host. Use 0 for no limit (default).
+      keepalive_timeout (float): Seconds an idle connection is kept open
+        for reuse. The default value is 30.
+      dns_cache_ttl (Optional[int]): Seconds resolved DNS entries are cached.
+        Use None to cache forever. The default value is 300.
+      chunk_size (int): Default number of bytes read and written at a time.
+        The default value is 1 MiB.
+      sock_read_timeout (float): Seconds to wait for data before a transfer
+        is considered stalled. The default value is 60.
+      retry_policy (Optional[RetryPolicy]): Policy used to retry transfers
+        failing with a retryable status code, a connection error or an
+        incomplete body. Retries resume from the bytes already written.
+        The default value None disables retries.
+    """
+    self.ssl_context = ssl_context
+    self.connector_limit = connector_limit
+    self.connector_limit_per_host = connector_limit_per_host
+    self.keepalive_timeout = keepalive_timeout
+    self.dns_cache_ttl = dns_cache_ttl
+    self.chunk_size = chunk_size
+    self.sock_read_timeout = sock_read_timeout
+    self.retry_policy = retry_policy
+
+    self.__session: Optional[aiohttp.ClientSession] = None
+    self.__closer: Optional[LoopCloser] = None
+
+  def get_session(self) -> aiohttp.ClientSession:
+    """
+    Return the pooled CDN session, creating it on first use or when the
+    event loop changed. Each session is closed with its loop, see
+    `LoopCloser`.
+    """
+    loop = asyncio.get_running_loop()
+
+    if (
+      self.__session is None
+      or self.__session.closed
+      or self.__closer.loop is not loop
+    ):
+      if self.__closer is not None:
+        self.__closer.discard()
+
+      connector = aiohttp.TCPConnector(
+        limit=self.connector_limit,
+        limit_per_host=self.connector_limit_per_host,
+        keepalive_timeout=self.keepalive_timeout,
+        ttl_dns_cache=self.dns_cache_ttl,
+        use_dns_cache=True,
+        ssl=self.ssl_context
+      )
+      self.__session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+          total=None,
+          sock_read=self.sock_read_timeout
+        )
+      )
+      self.__closer = LoopCloser(self.__session.close, 'CDN session')
+
+    return self.__session
+
+  async def aclose(self):
+    """
+    Close the CDN session and release all open connections.
+    """
+    closer = self.__closer
+    self.__session = None
+    self.__closer = None
+
+    if closer is not None:
+      await closer.aclose()
+
+  async def save(
+    self,
+    url: str,
+    path: Union[str, os.PathLike],
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    resolve: Optional[UrlResolver] = None,
+    segments: int = 1
+  ) -> int:
+    """
+    Download a media URL to a file, resuming a previous partial download.
+
+    The body is streamed to a `<path>.part` file next to the destination,
+    which is renamed to `path` once its length has been checked against
+    the size announced by the server, so `path` never holds a partial file.
+    The `.part` file is kept when the transfer fails, and the next call
+    requests only the missing bytes with a Range header. If the server
+    ignores the range, the file is downloaded again from the start.
+
+    With `segments` > 1, a new download is split into that many byte ranges
+    fetched concurrently, each written in place into the preallocated
+    `.part` file. Segments are retried on their own according to the retry
+    policy, but a segmented `.part` file has holes, so it is removed rather
+    than kept when the download fails. If the server does not honor Range
+    requests, the file is downloaded as a single stream. Segmented mode
+    needs `os.pwrite` and is ignored on platforms without it.
+
+    Args:
+      url (str): Media URL, e.g. the `play` URL returned by `download_video`.
+      path (Union[str, os.PathLike]): Destination file path.
+      chunk_size (Optional[int]): Number of bytes read and written at a time.
+        Defaults to the downloader's chunk size.
+      progress (Optional[Callable[[int, Optional[int]], None]]): Called after
+        each chunk with the number of bytes written so far and the total
+        size, or None if the server did not send it.
+      resolve (Optional[Callable[[], Awaitable[str]]]): Coroutine function
+        returning a fresh media URL. It is called once if the CDN rejects
+        `url` as expired, and the download resumes from the new URL.
+      segments (int): Number of concurrent Range requests used for a new
+        download. Files are not split into segments smaller than 1 MiB.
+        The default value 1 downloads over a single connection.
+
+    Returns:
+      int: Size of the downloaded file.
+
+    Raises:
+      TikflyAPIError: If the CDN returns an error or the transfer fails.
+    """
+    path = os.fspath(path)
+    part_path = f'{path}.part'
+    chunk_size = chunk_size or self.chunk_size
+    segmented = segments > 1 and hasattr(os, 'pwrite')
+    attempt = 1
+    resolved = False
+
+    while True:
+      try:
+        if segmented and await asyncio.to_thread(_file_size, part_path) == 0:
+          size = await self.__transfer_segments(
+            url,
+            part_path,
+            chunk_size,
+            progress,
+            segments
+          )
+        else:
+          size = await self.__transfer(url, part_path, chunk_size, progress)
+        break
+      except TikflyAPIError as err:
+        if (
+          resolve is not None
+          and not resolved
+          and err.status_code in EXPIRED_STATUSES
+        ):
+          url = await resolve()
+          resolved = True
+          continue
+
+        delay = self.__retry_delay(err, attempt)
+        if delay is None:
+          raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    await asyncio.to_thread(os.replace, part_path, path)
+    return size
+
+  async def request(
+    self,
+    url: str,
+    resolve: Optional[UrlResolver] = None,
+    headers: Optional[dict] = None
+  ) -> aiohttp.ClientResponse:
+    """
+    Send a GET request for a media URL and return the open response,
+    with its body not yet read.
+
+    Failures before the body are retried according to the retry policy,
+    and `resolve` is called once to get a fresh URL if the CDN rejects
+    `url` as expired. The caller must release the response.
+
+    Args:
+      url (str): Media URL, e.g. the `play` URL returned by `download_video`.
+      resolve (Optional[Callable[[], Awaitable[str]]]): Coroutine function
+        returning a fresh media URL.
+      headers (Optional[dict]): Additional request headers, e.g. Range.
+
+    Returns:
+      aiohttp.ClientResponse: The response, with a successful status.
+
+    Raises:
+      TikflyAPIError: If the CDN returns an error or the request fails.
+    """
+    session = self.get_session()
+    attempt = 1
+    resolved = False
+
+    while True:
+      try:
+        try:
+          res = await session.get(url, headers=headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+          raise TikflyAPIError(
+            message=f'Media download failed: {err}',
+            retryable=True
+          ) from err
+
+        try:
+          self.__check_response(res)
+        except TikflyAPIError:
+          res.release()
+          raise
+        return res
+
+      except TikflyAPIError as err:
+        if (
+          resolve is not None
+          and not resolved
+          and err.status_code in EXPIRED_STATUSES
+        ):
+          url = await resolve()
+          resolved = True
+          continue
+
+        delay = self.__retry_delay(err, attempt)
+        if delay is None:
+          raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+  async def __transfer(
+    self,
+    url: str,
+    part_path: str,
+    chunk_size: int,
+    progress: Optional[ProgressCallback]
+  ) -> int:
+    """
+    Append the missing bytes of `url` to `part_path`.
+
+    Returns:
+      int: Size of the complete file.
+
+    Raises:
+      TikflyAPIError: If the request fails or ends before the announced size.
+    """
+    session = self.get_session()
+
+    while True:
+      offset = await asyncio.to_thread(_file_size, part_path)
+      headers = {'Range': f'bytes={offset}-'} if offset else None
+
+      try:
+        async with session.get(url, headers=headers) as res:
+          if res.status == 416 and offset:
+            _, total = parse_content_range(res.headers.get('Content-Range'))
+            if total == offset:
+              return offset
+            # The partial file does not match the resource, start over.
+            await asyncio.to_thread(os.remove, part_path)
+            continue
+
+          self.__check_response(res)
+
+          total = res.content_length
+          if res.status == 206:
+            start, total = parse_content_range(res.headers.get('Content-Range'))
+            if start != offset:
+              await asyncio.to_thread(os.remove, part_path)
+              continue
+          else:
+            offset = 0
+
+          written = await self.__write_body(
+            res,
+            part_path,
+            offset,
+            total,
+            chunk_size,
+            progress
+          )
+      except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        raise TikflyAPIError(
+          message=f'Media download failed: {err}',
+          retryable=True
+        ) from err
+
+      if total is not None and written != total:
+        if written > total:
+          await asyncio.to_thread(os.remove, part_path)
+        raise TikflyAPIError(
+          message=f'Media download incomplete: {written} of {total} bytes',
+          retryable=True
+        )
+      return written
+
+  async def __transfer_segments(
+    self,
+    url: str,
+    part_path: str,
+    chunk_size: int,
+    progress: Optional[ProgressCallback],
+    segments: int
+  ) -> int:
+    """
+    Download `url` to `part_path` with concurrent Range requests.
+
+    The first request asks for the whole file from byte 0. Its
+    Content-Range gives the file size, then it is read up to the end of
+    the first segment while the other segments are requested. If it comes
+    back with a 200 instead, ranges are not supported and it is written
+    as a single stream.
+
+    Returns:
+      int: Size of the complete file.
+
+    Raises:
+      TikflyAPIError: If a segment fails. The partial file is removed.
+    """
+    session = self.get_session()
+    fd = None
+    tasks = []
+    written = 0
+    total = None
+
+    def add(count: int):
+      nonlocal written
+      written += count
+      if progress is not None:
+        progress(written, total)
+
+    try:
+      async with session.get(url, headers={'Range': 'bytes=0-'}) as res:
+        self.__check_response(res)
+
+        start, total = parse_content_range(res.headers.get('Content-Range'))
+        if res.status != 206 or start != 0 or not total:
+          total = res.content_length
+          size = await self.__write_body(
+            res,
+            part_path,
+            0,
+            total,
+            chunk_size,
+            progress
+          )
+          if total is not None and size != total:
+            raise TikflyAPIError(
+              message=f'Media download incomplete: {size} of {total} bytes',
+              retryable=True
+            )
+          return size
+
+        segments = max(1, min(segments, -(-total // MIN_SEGMENT_SIZE)))
+        segment_size = -(-total // segments)
+        bounds = [
+          (offset, min(offset + segment_size, total) - 1)
+          for offset in range(0, total, segment_size)
+        ]
+
+        fd = await asyncio.to_thread(_open_preallocated, part_path, total)
+
+        tasks = [
+          asyncio.create_task(
+            self.__fetch_segment(session, url, fd, first, last, chunk_size, add)
+          )
+          for first, last in bounds[1:]
+        ]
+
+        first, last = bounds[0]
+        await self.__fetch_segment(
+          session,
+          url,
+          fd,
+          first,
+          last,
+          chunk_size,
+          add,
+          res=res
+        )
+
+      await asyncio.gather(*tasks)
+
+    except BaseException as err:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+      if fd is not None:
+        await asyncio.to_thread(os.close, fd)
+        fd = None
+      await asyncio.to_thread(_remove, part_path)
+
+      if isinstance(err, (aiohttp.ClientError, asyncio.TimeoutError)):
+        raise TikflyAPIError(
+          message=f'Media download failed: {err}',
+          retryable=True
+        ) from err
+      raise
+
+    finally:
+      if fd is not None:
+        await asyncio.to_thread(os.close, fd)
+
+    return total
+
+  async def __fetch_segment(
+    self,
+    session: aiohttp.ClientSession,
+    url: str,
+    fd: int,
+    first: int,
+    last: int,
+    chunk_size: int,
+    add: Callable[[int], None],
+    res: Optional[aiohttp.ClientResponse] = None
+  ):
+    """
+    Download bytes `first` to `last` of `url` into `fd`, resuming the
+    range from the last written byte when a retryable failure occurs.
+    The body of `res`, if given, is read first instead of sending a request.
+    """
+    position = first
+    attempt = 1
+
+    def advance(count: int):
+      nonlocal position
+      position += count
+      add(count)
+
+    while position <= last:
+      request = (
+        nullcontext(res) if res is not None
+        else session.get(url, headers={'Range': f'bytes={position}-{last}'})
+      )
+      res = None
+
+      try:
+        try:
+          async with request as current:
+            self.__check_response(current)
+            if current.status != 206:
+              raise TikflyAPIError(
+                message='Media server stopped honoring Range requests'
+              )
+            await self.__write_range(
+              current,
+              fd,
+              position,
+              last,
+              chunk_size,
+              advance
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+          raise TikflyAPIError(
+            message=f'Media download failed: {err}',
+            retryable=True
+          ) from err
+
+        if position <= last:
+          raise TikflyAPIError(
+            message=f'Media segment incomplete: stopped at byte {position} of {last + 1}',
+            retryable=True
+          )
+      except TikflyAPIError as err:
+        delay = self.__retry_delay(err, attempt)
+        if delay is None:
+          raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+  @staticmethod
+  async def __write_range(
+    res: aiohttp.ClientResponse,
+    fd: int,
+    position: int,
+    last: int,
+    chunk_size: int,
+    advance: Callable[[int], None]
+  ):
+    """
+    Write a response body into `fd` from `position`, stopping after byte
+    `last` even if the body goes on. `advance` is called with the size of
+    each chunk once it is written.
+    """
+    async for chunk in res.content.iter_chunked(chunk_size):
+      remaining = last + 1 - position
+      if len(chunk) > remaining:
+        chunk = chunk[:remaining]
+
+      await asyncio.to_thread(_pwrite, fd, chunk, position)
+      position += len(chunk)
+      advance(len(chunk))
+
+      if position > last:
+        break
+
+  def __retry_delay(self, err: TikflyAPIError, attempt: int) -> Optional[float]:
+    """
+    Get the delay before retrying a failed attempt, or None if the error
+    must be raised.
+    """
+    if (
+      not err.retryable
+      or self.retry_policy is None
+      or attempt >= self.retry_policy.max_attempts
+    ):
+      return None
+    return self.retry_policy.get_delay(attempt, err.retry_after)
+
+  def __check_response(self, res: aiohttp.ClientResponse):
+    if res.status < 400:
+      return
+
+    retry_statuses = (
+      self.retry_policy.retry_statuses
+      if self.retry_policy is not None else DEFAULT_RETRY_STATUSES
+    )
+    raise TikflyAPIError(
+      message=f'Media download failed: HTTP {res.status}',
+      status_code=res.status,
+      retryable=res.status in retry_statuses,
+      retry_after=RetryPolicy.parse_retry_after(res.headers.get('Retry-After'))
+    )
+
+  @staticmethod
+  async def __write_body(
+    res: aiohttp.ClientResponse,
+    part_path: str,
+    offset: int,
+    total: Optional[int],
+    chunk_size: int,
+    progress: Optional[ProgressCallback]
+  ) -> int:
+    """
+    Write a response body to `part_path`, appending from `offset` or
+    truncating the file when `offset` is 0.
+
+    Returns:
+      int: Size of the file once the body has been written.
+    """
+    written = offset
+    file = await asyncio.to_thread(open, part_path, 'ab' if offset else 'wb')
+    try:
+      async for chunk in res.content.iter_chunked(chunk_size):
+        await asyncio.to_thread(file.write, chunk)
+        written += len(chunk)
+        if progress is not None:
+          progress(written, total)
+    finally:
+      await asyncio.to_thread(file.close)
+    return written
+
+def _file_size(path: str) -> int:
+  try:
+    return os.path.getsize(path)
+  except FileNotFoundError:
+    return 0
+
+def _remove(path: str):
+  try:
+    os.remove(path)
+  except FileNotFoundError:
+    pass
+
+def _open_preallocated(path: str, size: int) -> int:
+  """
+  Create `path` with `size` bytes reserved and return its descriptor.
+  """
+  fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+  try:
+    if hasattr(os, 'posix_fallocate'):
+      os.posix_fallocate(fd, 0, size)
+    else:
+      os.ftruncate(fd, size)
+  except OSError:
+    os.ftruncate(fd, size)
+  return fd
+
+def _pwrite(fd: int, data: bytes, position: int):
+  view = memoryview(data)
+  while view:
+    count = os.pwrite(fd, view, position)
+    view = view[count:]
+    position += count
@@ -0,0 +1,78 @@
+import asyncio
+import aiohttp
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from .exceptions.TikflyApiError import TikflyAPIError
+
+class MediaStream():
+  def __init__(
+    self,
+    open_response: Callable[[], Awaitable[aiohttp.ClientResponse]],
+    chunk_size: int
+  ):
+    """
+    Body of a media file, read chunk by chunk from the CDN.
+
+    The request is sent when entering the `async with` block, which makes
+    `content_length` and `content_type` available, and the connection is
+    given back to the pool when leaving it. Iterating over the stream with
+    `async for` yields the body in chunks of `chunk_size` bytes (the last
+    one may be shorter), so it can be piped to any sink without a
+    temporary file or a full in-memory copy:
+
+      async with tikfly.stream_video(video_url) as stream:
+        async for chunk in stream:
+          await upload.write(chunk)
+
+    Args:
+      open_response (Callable[[], Awaitable[aiohttp.ClientResponse]]):
+        Coroutine function sending the request and returning the response.
+      chunk_size (int): Number of bytes per chunk.
+    """
+    self.chunk_size = chunk_size
+    self.content_length: Optional[int] = None
+    self.content_type: Optional[str] = None
+    self.url: Optional[str] = None
+
+    self.__open_response = open_response
+    self.__response: Optional[aiohttp.ClientResponse] = None
+
+  async def __aenter__(self):
+    if self.__response is not None:
+      raise RuntimeError('MediaStream is already open')
+
+    res = await self.__open_response()
+    self.__response = res
+    self.content_length = res.content_length
+    self.content_type = res.content_type
+    self.url = str(res.url)
+    return self
+
+  async def __aexit__(self, exc_type, exc, tb):
+    res = self.__response
+    self.__response = None
+    if res is not None:
+      res.release()
+
+  def __aiter__(self) -> AsyncIterator[bytes]:
+    if self.__response is None:
+      raise RuntimeError('MediaStream must be opened with "async with" before iterating')
+    return self.__iterate()
+
+  async def __iterate(self) -> AsyncIterator[bytes]:
+    content = self.__response.content
+
+    try:
+      while True:
+        try:
+          chunk = await content.readexactly(self.chunk_size)
+        except asyncio.IncompleteReadError as err:
+          if err.partial:
+            yield err.partial
+          return
+        yield chunk
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+      raise TikflyAPIError(
+        message=f'Media download failed: {err}',
+        retryable=True
+      ) from err
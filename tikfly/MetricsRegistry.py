@@ -0,0 +1,188 @@
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class EndpointStats():
+  __slots__ = (
+    'requests',
+    'errors',
+    'latency_counts',
+    'latency_sum',
+    'response_bytes',
+    'decode_count',
+    'decode_sum'
+  )
+
+  def __init__(self, bucket_count: int):
+    self.requests = 0
+    self.errors: Dict[str, int] = {}
+    # One count per bucket, plus the +Inf bucket; not cumulative.
+    self.latency_counts = [0] * (bucket_count + 1)
+    self.latency_sum = 0.0
+    self.response_bytes = 0
+    self.decode_count = 0
+    self.decode_sum = 0.0
+
+class MetricsRegistry():
+  def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = 'tikfly'):
+    """
+    Per-endpoint metrics of a TikflyApi instance.
+
+    Records, for each endpoint path (e.g. "/user/posts"), the number of
+    requests sent, errors by HTTP status ("network" when no response was
+    received), a request latency histogram, response body bytes and the
+    time spent decoding responses. Responses served from the cache are not
+    requests and are not recorded, but their decode time is.
+
+    Recording is a few integer additions and a bisect per request, with
+    no locking or allocation once an endpoint has been seen, so it can be
+    left enabled in production.
+
+    Args:
+      buckets (Sequence[float]): Upper bounds of the latency histogram
+        buckets, in seconds.
+      prefix (str): Prefix of the Prometheus metric names.
+    """
+    self.buckets = tuple(sorted(buckets))
+    self.prefix = prefix
+    self.__endpoints: Dict[str, EndpointStats] = {}
+
+  def __stats(self, endpoint: str) -> EndpointStats:
+    stats = self.__endpoints.get(endpoint)
+    if stats is None:
+      stats = self.__endpoints[endpoint] = EndpointStats(len(self.buckets))
+    return stats
+
+  def record_request(
+    self,
+    endpoint: str,
+    status: Optional[int],
+    latency: float,
+    size: int = 0
+  ):
+    """
+    Record a request sent to the API.
+
+    Args:
+      endpoint (str): Endpoint path, e.g. "/user/posts".
+      status (Optional[int]): HTTP status code, or None if the request
+        failed without a complete response.
+      latency (float): Seconds from sending the request to reading the body.
+      size (int): Size of the response body in bytes.
+    """
+    stats = self.__stats(endpoint)
+    stats.requests += 1
+    stats.latency_counts[bisect_left(self.buckets, latency)] += 1
+    stats.latency_sum += latency
+    stats.response_bytes += size
+
+    if status is None or status >= 400:
+      key = str(status) if status is not None else 'network'
+      stats.errors[key] = stats.errors.get(key, 0) + 1
+
+  def record_decode(self, endpoint: str, seconds: float):
+    """
+    Record the time spent decoding a response body.
+
+    Args:
+      endpoint (str): Endpoint path, e.g. "/user/posts".
+      seconds (float): Decode time in seconds.
+    """
+    stats = self.__stats(endpoint)
+    stats.decode_count += 1
+    stats.decode_sum += seconds
+
+  def reset(self):
+    """
+    Discard all recorded metrics.
+    """
+    self.__endpoints.clear()
+
+  def snapshot(self) -> dict:
+    """
+    Get a copy of the recorded metrics.
+
+    Returns:
+      dict: Metrics keyed by endpoint path. Each entry holds `requests`,
+      `errors` (counts by status), `latency` (`count`, `sum` and cumulative
+      `buckets` keyed by upper bound, including "+Inf"), `response_bytes`
+      and `decode` (`count` and `sum`).
+    """
+    snapshot = {}
+
+    for endpoint, stats in self.__endpoints.items():
+      buckets = {}
+      cumulative = 0
+      for bound, count in zip(self.buckets + ('+Inf',), stats.latency_counts):
+        cumulative += count
+        buckets[bound] = cumulative
+
+      snapshot[endpoint] = {
+        'requests': stats.requests,
+        'errors': dict(stats.errors),
+        'latency': {
+          'count': stats.requests,
+          'sum': stats.latency_sum,
+          'buckets': buckets
+        },
+        'response_bytes': stats.response_bytes,
+        'decode': {
+          'count': stats.decode_count,
+          'sum': stats.decode_sum
+        }
+      }
+
+    return snapshot
+
+  def render_prometheus(self) -> str:
+    """
+    Render the recorded metrics in the Prometheus text exposition format.
+
+    Returns:
+      str: The metrics, ready to be served on a /metrics endpoint.
+    """
+    prefix = self.prefix
+    snapshot = self.snapshot()
+    lines = []
+
+    def family(name: str, kind: str, help_text: str):
+      lines.append(f'# HELP {prefix}_{name} {help_text}')
+      lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+    family('requests_total', 'counter', 'Requests sent to the Tikfly API.')
+    for endpoint, data in snapshot.items():
+      lines.append(f'{prefix}_requests_total{{endpoint="{_escape(endpoint)}"}} {data["requests"]}')
+
+    family('request_errors_total', 'counter', 'Failed requests by HTTP status.')
+    for endpoint, data in snapshot.items():
+      for status, count in data['errors'].items():
+        lines.append(
+          f'{prefix}_request_errors_total{{endpoint="{_escape(endpoint)}",status="{status}"}} {count}'
+        )
+
+    family('request_duration_seconds', 'histogram', 'Request latency in seconds.')
+    for endpoint, data in snapshot.items():
+      label = f'endpoint="{_escape(endpoint)}"'
+      latency = data['latency']
+      for bound, count in latency['buckets'].items():
+        lines.append(f'{prefix}_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+      lines.append(f'{prefix}_request_duration_seconds_sum{{{label}}} {latency["sum"]}')
+      lines.append(f'{prefix}_request_duration_seconds_count{{{label}}} {latency["count"]}')
+
+    family('response_bytes_total', 'counter', 'Response body bytes received.')
+    for endpoint, data in snapshot.items():
+      lines.append(
+        f'{prefix}_response_bytes_total{{endpoint="{_escape(endpoint)}"}} {data["response_bytes"]}'
+      )
+
+    family('decode_duration_seconds', 'summary', 'Time spent decoding responses in seconds.')
+    for endpoint, data in snapshot.items():
+      label = f'endpoint="{_escape(endpoint)}"'
+      lines.append(f'{prefix}_decode_duration_seconds_sum{{{label}}} {data["decode"]["sum"]}')
+      lines.append(f'{prefix}_decode_duration_seconds_count{{{label}}} {data["decode"]["count"]}')
+
+    return '\n'.join(lines) + '\n'
+
+def _escape(value: str) -> str:
+  return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,72 @@
+import re
+from typing import Any, Iterable, Optional
+
+MISSING = object()
+
+INDEX = re.compile(r'-?[0-9]+')
+
+class Projection():
+  def __init__(self, paths: Iterable[str]):
+    """
+    Extract a fixed set of dotted paths from decoded JSON objects.
+
+    Each path is split once up front. Applying the projection to an item
+    walks only the requested paths and returns a flat dict keyed by path,
+    so the rest of the item is never converted. Integer segments index
+    into lists (e.g. "video.bitrateInfo.0.Bitrate") and are looked up as
+    keys in objects. Paths missing from an item are set to None.
+
+    Args:
+      paths (Iterable[str]): Dotted paths, e.g. ["id", "stats.playCount"].
+
+    Raises:
+      ValueError: If no path is given, a path has an empty segment or a
+        segment starting with "-" is not a negative index.
+    """
+    self.paths = tuple(paths)
+    if not self.paths or not all(self.paths):
+      raise ValueError('paths must be a non-empty list of non-empty paths')
+
+    # Each segment is kept as (key, index): the key for objects and, for
+    # integer segments, the index for lists.
+    self.__steps = [
+      (path, tuple(
+        (segment, self.__parse_index(segment, path))
+        for segment in path.split('.')
+      ))
+      for path in self.paths
+    ]
+
+  @staticmethod
+  def __parse_index(segment: str, path: str) -> Optional[int]:
+    """
+    Get the list index of an integer segment, or None for other segments.
+    """
+    if not segment:
+      raise ValueError(f'Empty segment in field path {path!r}')
+    if INDEX.fullmatch(segment):
+      return int(segment)
+    if segment.startswith('-'):
+      raise ValueError(f'Invalid index {segment!r} in field path {path!r}')
+    return None
+
+  def __call__(self, item: Any) -> dict:
+    record = {}
+
+    for path, segments in self.__steps:
+      value = item
+      for key, index in segments:
+        if isinstance(value, dict):
+          value = value.get(key, MISSING)
+        elif isinstance(value, list) and index is not None:
+          value = value[index] if -len(value) <= index < len(value) else MISSING
+        else:
+          value = MISSING
+
+        if value is MISSING:
+          value = None
+          break
+
+      record[path] = value
+
+    return record
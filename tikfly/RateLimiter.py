@@ -0,0 +1,166 @@
+import math
+import time
+import asyncio
+from typing import Optional, Mapping
+
+RATE_LIMIT_HEADER_PREFIX = 'x-ratelimit-'
+EPOCH_THRESHOLD = 1_000_000_000
+
+class RateLimiter():
+  def __init__(
+    self,
+    rate: float,
+    burst: Optional[int] = None,
+    max_reset_wait: float = 60.0
+  ):
+    """
+    Async token-bucket rate limiter.
+
+    Tokens are refilled at `rate` per second up to `burst`. Each request
+    takes one token and waits when the bucket is empty. Callers are served
+    in arrival order: a caller that finds the bucket empty reserves the
+    next token and sleeps until it is refilled.
+
+    The bucket also adapts to the `x-ratelimit-*-remaining` and
+    `x-ratelimit-*-reset` headers returned by RapidAPI: the bucket never holds more
+    tokens than the server says remain, the refill rate is lowered to
+    spread the remaining quota over the current window, and requests are
+    paused until the window resets once the quota is exhausted. The bucket
+    is full again when the window resets, so at most `burst` requests are
+    sent at that moment and the others follow at the regular pace. Windows
+    resetting later than `max_reset_wait` seconds (e.g. monthly plan quotas)
+    are ignored so a long quota period never stalls the client.
+
+    Args:
+      rate (float): Sustained number of requests per second.
+      burst (Optional[int]): Maximum number of requests that can be sent
+        at once. Defaults to the rate rounded up, with a minimum of 1.
+      max_reset_wait (float): Longest rate limit window, in seconds,
+        the limiter adapts to. The default value is 60.
+
+    Raises:
+      ValueError: If rate or burst is not positive.
+    """
+    if rate <= 0:
+      raise ValueError('rate must be greater than 0')
+    if burst is not None and burst < 1:
+      raise ValueError('burst must be at least 1')
+
+    self.rate = rate
+    self.burst = burst or max(1, math.ceil(rate))
+    self.max_reset_wait = max_reset_wait
+
+    self.tokens = float(self.burst)
+    self.updated_at = time.monotonic()
+    self.blocked_until = 0.0
+    self.blocks = 0
+    self.window_rate: Optional[float] = None
+    self.window_until = 0.0
+
+  def __current_rate(self, now: float) -> float:
+    if self.window_rate is not None and now < self.window_until:
+      return min(self.rate, self.window_rate)
+    return self.rate
+
+  def __refill(self, now: float):
+    # While requests are paused, updated_at is the end of the pause and
+    # nothing accrues before it
+    elapsed = now - self.updated_at
+    if elapsed > 0:
+      self.tokens = min(
+        float(self.burst),
+        self.tokens + elapsed * self.__current_rate(now)
+      )
+      self.updated_at = now
+
+  def __block(self, now: float, until: float):
+    """
+    Pause requests until `until`, when the quota window resets.
+    """
+    if until <= self.blocked_until:
+      return
+
+    if now >= self.blocked_until:
+      # The quota is restored when the window resets, so the bucket is full
+      # then. Callers already waiting lose their reservation and queue again.
+      self.tokens = float(self.burst)
+      self.blocks += 1
+
+    self.blocked_until = until
+    self.updated_at = until
+
+  async def acquire(self):
+    """
+    Wait until a request may be sent and take one token.
+    """
+    while True:
+      now = time.monotonic()
+      self.__refill(now)
+
+      self.tokens -= 1
+      wait = max(self.updated_at - now, 0.0)
+      if self.tokens < 0:
+        wait += -self.tokens / self.__current_rate(max(now, self.updated_at))
+
+      if wait <= 0:
+        return
+
+      blocks = self.blocks
+      await asyncio.sleep(wait)
+
+      if self.blocks == blocks:
+        return
+
+  def update_from_headers(self, headers: Mapping[str, str]):
+    """
+    Adapt the bucket to the rate limit headers of a response.
+
+    Args:
+      headers (Mapping[str, str]): Response headers.
+    """
+    now = time.monotonic()
+    self.__refill(now)
+
+    lowered = {k.lower(): v for k, v in headers.items()}
+
+    for key, value in lowered.items():
+      if not key.startswith(RATE_LIMIT_HEADER_PREFIX) or not key.endswith('-remaining'):
+        continue
+
+      prefix = key[:-len('remaining')]
+      remaining = self.__parse_number(value)
+      reset = self.__parse_reset(lowered.get(f'{prefix}reset'))
+
+      if remaining is None or reset is None or reset > self.max_reset_wait:
+        continue
+
+      if remaining <= 0 and reset > 0:
+        self.__block(now, now + reset)
+        continue
+
+      self.tokens = min(self.tokens, remaining)
+
+      if reset > 0:
+        self.window_rate = remaining / reset
+        self.window_until = now + reset
+
+  @staticmethod
+  def __parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+      return None
+    try:
+      return float(value)
+    except ValueError:
+      return None
+
+  def __parse_reset(self, value: Optional[str]) -> Optional[float]:
+    """
+    Parse a reset header as seconds from now. Both relative seconds and
+    absolute epoch timestamps are accepted.
+    """
+    reset = self.__parse_number(value)
+    if reset is None:
+      return None
+    if reset >= EPOCH_THRESHOLD:
+      reset -= time.time()
+    return max(reset, 0.0)
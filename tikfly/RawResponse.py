@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
+from .RequestTiming import RequestTiming
+
+@dataclass(slots=True)
+class RawResponse:
+  """
+  Undecoded response of the Tikfly API.
+
+  Args:
+    status (int): HTTP status code.
+    headers (Mapping[str, str]): Response headers. Empty for responses
+      served from the cache.
+    body (bytes): Response body, exactly as received.
+    url (str): Requested URL, including the query string.
+    from_cache (bool): Whether the response was served from the cache.
+    timing (Optional[RequestTiming]): Phase timing of the request, when the
+      instance was created with `profile=True`.
+  """
+  status: int
+  body: bytes
+  url: str
+  headers: Mapping[str, str] = field(default_factory=dict)
+  from_cache: bool = False
+  timing: Optional[RequestTiming] = None
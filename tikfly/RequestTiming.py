@@ -0,0 +1,112 @@
+import time
+import aiohttp
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(slots=True)
+class RequestTiming:
+  """
+  Phase-level timing of an API call, in seconds.
+
+  Args:
+    endpoint (str): Endpoint path, e.g. "/user/posts".
+    status (Optional[int]): HTTP status code of the response.
+    queue (float): Time spent waiting for a free connection in the pool.
+    dns (float): Time spent resolving the host name.
+    connect (float): Time spent opening the connection, including the TLS
+      handshake (aiohttp does not time the handshake separately).
+    ttfb (float): Time from sending the request to receiving the response
+      headers (time to first byte).
+    transfer (float): Time spent reading the response body.
+    decode (float): Time spent decoding the body into objects.
+    total (float): Duration of the whole call, including retries, rate
+      limiting and decoding.
+    reused_connection (bool): Whether a pooled connection was reused.
+    from_cache (bool): Whether the response was served from the cache, in
+      which case no network phase is timed.
+  """
+  endpoint: str
+  status: Optional[int] = None
+  queue: float = 0.0
+  dns: float = 0.0
+  connect: float = 0.0
+  ttfb: float = 0.0
+  transfer: float = 0.0
+  decode: float = 0.0
+  total: float = 0.0
+  reused_connection: bool = False
+  from_cache: bool = False
+
+def _timing(params_ctx) -> Optional[RequestTiming]:
+  request_ctx = params_ctx.trace_request_ctx
+  return request_ctx.get('timing') if request_ctx else None
+
+async def _on_request_start(session, ctx, params):
+  ctx.request_start = time.perf_counter()
+  ctx.dns = 0.0
+  ctx.headers_sent = None
+
+async def _on_queued_start(session, ctx, params):
+  ctx.queued_at = time.perf_counter()
+
+async def _on_queued_end(session, ctx, params):
+  timing = _timing(ctx)
+  if timing is not None:
+    timing.queue += time.perf_counter() - ctx.queued_at
+
+async def _on_dns_start(session, ctx, params):
+  ctx.dns_at = time.perf_counter()
+
+async def _on_dns_end(session, ctx, params):
+  elapsed = time.perf_counter() - ctx.dns_at
+  ctx.dns += elapsed
+  timing = _timing(ctx)
+  if timing is not None:
+    timing.dns += elapsed
+
+async def _on_create_start(session, ctx, params):
+  ctx.create_at = time.perf_counter()
+  ctx.dns_before_create = ctx.dns
+
+async def _on_create_end(session, ctx, params):
+  timing = _timing(ctx)
+  if timing is not None:
+    elapsed = time.perf_counter() - ctx.create_at
+    # Host resolution runs inside connection creation.
+    timing.connect += max(0.0, elapsed - (ctx.dns - ctx.dns_before_create))
+
+async def _on_reuseconn(session, ctx, params):
+  timing = _timing(ctx)
+  if timing is not None:
+    timing.reused_connection = True
+
+async def _on_headers_sent(session, ctx, params):
+  ctx.headers_sent = time.perf_counter()
+
+async def _on_request_end(session, ctx, params):
+  timing = _timing(ctx)
+  if timing is not None:
+    sent = ctx.headers_sent if ctx.headers_sent is not None else ctx.request_start
+    timing.ttfb = time.perf_counter() - sent
+    timing.status = params.response.status
+
+def create_trace_config() -> aiohttp.TraceConfig:
+  """
+  Build the aiohttp TraceConfig filling the RequestTiming passed to a
+  request as `trace_request_ctx={'timing': timing}`.
+
+  Returns:
+    aiohttp.TraceConfig: Trace config to pass to the ClientSession.
+  """
+  trace_config = aiohttp.TraceConfig()
+  trace_config.on_request_start.append(_on_request_start)
+  trace_config.on_connection_queued_start.append(_on_queued_start)
+  trace_config.on_connection_queued_end.append(_on_queued_end)
+  trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+  trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+  trace_config.on_connection_create_start.append(_on_create_start)
+  trace_config.on_connection_create_end.append(_on_create_end)
+  trace_config.on_connection_reuseconn.append(_on_reuseconn)
+  trace_config.on_request_headers_sent.append(_on_headers_sent)
+  trace_config.on_request_end.append(_on_request_end)
+  return trace_config
@@ -0,0 +1,87 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+@dataclass
+class RetryPolicy:
+  """
+  Retry policy for Tikfly API requests.
+
+  Requests failing with a retryable status code or a connection error are
+  retried up to `max_attempts` times in total. The delay before retry n is
+  `backoff_base * backoff_factor ** (n - 1)`, capped at `backoff_max`, and
+  with `jitter` enabled a random value between 0 and that delay is used
+  (full jitter). When the server sends a `Retry-After` header and
+  `respect_retry_after` is enabled, its value is used instead, capped at
+  `max_retry_after`.
+
+  Args:
+    max_attempts (int): Total number of attempts, including the first one.
+      The default value is 3.
+    backoff_base (float): Delay in seconds before the first retry.
+    backoff_factor (float): Multiplier applied to the delay on each retry.
+    backoff_max (float): Maximum delay in seconds between two attempts.
+    jitter (bool): Randomize delays with full jitter.
+    retry_statuses (FrozenSet[int]): HTTP status codes that are retried.
+    respect_retry_after (bool): Honor the `Retry-After` response header.
+    max_retry_after (float): Maximum delay in seconds taken from `Retry-After`.
+  """
+  max_attempts: int = 3
+  backoff_base: float = 0.5
+  backoff_factor: float = 2.0
+  backoff_max: float = 30.0
+  jitter: bool = True
+  retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+  respect_retry_after: bool = True
+  max_retry_after: float = 120.0
+
+  def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Get the delay in seconds before the next attempt.
+
+    Args:
+      attempt (int): Number of the attempt that just failed, starting at 1.
+      retry_after (Optional[float]): Delay requested by the server, if any.
+
+    Returns:
+      float: Seconds to wait before retrying.
+    """
+    if retry_after is not None and self.respect_retry_after:
+      return min(retry_after, self.max_retry_after)
+
+    delay = min(
+      self.backoff_max,
+      self.backoff_base * self.backoff_factor ** (attempt - 1)
+    )
+    if self.jitter:
+      delay = random.uniform(0, delay)
+    return delay
+
+  @staticmethod
+  def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header given either as seconds or as an HTTP date.
+
+    Returns:
+      Optional[float]: Seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+      return None
+
+    try:
+      return max(float(value), 0.0)
+    except ValueError:
+      pass
+
+    try:
+      date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+      return None
+
+    if date.tzinfo is None:
+      date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
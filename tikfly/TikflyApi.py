@@ -1,9 +1,31 @@
+import os
+import re
 import ssl
+import time
+import asyncio
 import aiohttp
+import dataclasses
 import certifi
-from typing import Literal, Any
+from contextlib import aclosing
+from typing import Literal, Any, Optional, AsyncIterator, Dict, Iterable, Mapping, Tuple, Union, Callable
 from types import SimpleNamespace
-
+from urllib.parse import urlencode
+
+from .RawResponse import RawResponse
+from .RequestTiming import RequestTiming
+from .Projection import Projection
+from .MediaDownloader import MediaDownloader, ProgressCallback
+from .DownloadBatch import DownloadBatch, DownloadResult
+from .MediaStream import MediaStream
+from .RateLimiter import RateLimiter
+from .MetricsRegistry import MetricsRegistry
+from .LazyNamespace import to_lazy_namespace
+from .JsonBackend import get_json_loads, TypedJsonDecoder, NOT_DECODED
+from .JsonStream import JsonArrayStream
+from .transports import BaseTransport, AiohttpTransport
+from .schemas.SchemaDecoder import decode as decode_schema
+from .RetryPolicy import RetryPolicy, DEFAULT_RETRY_STATUSES
+from .cache import BaseCache
 from .exceptions.TikflyApiError import TikflyAPIError
 
 from .schemas import UserInfoResponse
@@ -28,25 +50,123 @@ from .schemas import ChallengeInfoResponse
 
 from .schemas import DownloadVideoResponse, DownloadMusicResponse
 
+from .schemas.CommentSchema import Comment
+from .schemas.UserPostSchema import VideoItem
+from .schemas.UserStorySchema import Item as StoryItem
+from .schemas.SearchLiveSchema import LiveDataItem
+from .schemas.UserFollowerSchema import UserListItem
+from .schemas.UserFollowingSchema import UserListItem as FollowingListItem
+from .schemas.UserPlaylistSchema import PlayListItem
+from .schemas.SearchVideoSchema import SearchItem as SearchVideoItem
+from .schemas.SearchGeneralSchema import SearchItem as SearchGeneralItem
+from .schemas.SearchAccountSchema import UserListItem as SearchAccountItem
+
+HAS_MORE_KEYS = ('hasMore', 'has_more')
+VIDEO_ID = re.compile(r'/(?:video|photo)/(\d+)')
+DECODE_MODES = ('namespace', 'lazy', 'schema')
+
 class TikflyApi():
   def __init__(
     self,
     x_rapidapi_key: str,
-    host: str = 'tiktok-api23.p.rapidapi.com'
+    host: str = 'tiktok-api23.p.rapidapi.com',
+    connector_limit: int = 100,
+    connector_limit_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    dns_cache_ttl: Optional[int] = 300,
+    rate_limit: Optional[float] = None,
+    rate_limit_burst: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    cache: Optional[BaseCache] = None,
+    coalesce_requests: bool = True,
+    decode_mode: Literal['namespace', 'lazy', 'schema'] = 'namespace',
+    json_loads: Optional[Callable[[bytes], Any]] = None,
+    metrics: Optional[MetricsRegistry] = None,
+    profile: bool = False,
+    slow_request_threshold: float = 1.0,
+    on_slow_request: Optional[Callable[[RequestTiming], None]] = None,
+    transport: Optional[BaseTransport] = None
   ):
     """
     Initialize the TikflyApi instance.
 
+    API requests are sent through a transport. By default it is an
+    AiohttpTransport owning a single pooled HTTP session which is created
+    on the first request and reused by every following call, so
+    connections are kept alive between requests. Use the instance as an
+    async context manager (`async with TikflyApi(...) as api:`) or call
+    `aclose()` when done.
+
     Args:
       x_rapidapi_key (str): The API key for accessing the Tikfly API.
+      host (str): RapidAPI host of the Tikfly API.
+      connector_limit (int): Maximum number of simultaneous connections
+        in the pool. Use 0 for no limit. The default value is 100.
+      connector_limit_per_host (int): Maximum number of simultaneous
+        connections to the same host. Use 0 for no limit (default).
+      keepalive_timeout (float): Seconds an idle connection is kept open
+        for reuse. The default value is 30.
+      dns_cache_ttl (Optional[int]): Seconds resolved DNS entries are cached.
+        Use None to cache forever. The default value is 300.
+      rate_limit (Optional[float]): Maximum number of requests per second.
+        When set, requests are paced by a client-side token bucket that
+        also adapts to the RapidAPI `x-ratelimit-*` response headers.
+        The default value None disables client-side rate limiting.
+      rate_limit_burst (Optional[int]): Maximum number of requests sent
+        at once when rate_limit is set. Defaults to the rate rounded up.
+      retry_policy (Optional[RetryPolicy]): Policy used to retry requests
+        failing with a retryable status code or a connection error.
+        The default value None disables retries.
+      cache (Optional[BaseCache]): Response cache, e.g. a MemoryCache.
+        Responses are cached per endpoint path and params, using the
+        cache's TTL for that endpoint. The default value None disables caching.
+        The cache is closed by `aclose()`.
+      coalesce_requests (bool): Share a single in-flight request between
+        concurrent identical calls (same URL and params). Every caller
+        gets the result or the error of that request. Enabled by default.
+      decode_mode (Literal['namespace', 'lazy', 'schema']): How responses are converted.
+        - "namespace": The whole response is converted to nested
+          SimpleNamespace objects up front (default).
+        - "lazy": Responses are wrapped in LazyNamespace objects that
+          convert nested objects only when their attribute is first read.
+        - "schema": Responses are decoded into the slotted dataclasses of
+          `tikfly.schemas` (e.g. UserPostResponse). Fields missing from the
+          response are set to None and undeclared fields are dropped.
+          Endpoints without a schema fall back to "namespace".
+      json_loads (Optional[Callable[[bytes], Any]]): Function used to decode
+        JSON response bodies. Defaults to orjson or msgspec when installed,
+        and to the standard library json module otherwise. When msgspec is
+        installed and no custom function is given, the "schema" decode mode
+        decodes bodies straight into the schema dataclasses.
+      metrics (Optional[MetricsRegistry]): Registry recording per-endpoint
+        request counts, errors, latency, response bytes and decode time.
+        The default value None disables metrics.
+      profile (bool): Time each call phase by phase (connection pool wait,
+        DNS, connect and TLS, time to first byte, body transfer and decode)
+        with aiohttp trace hooks. Raw responses carry the breakdown in
+        their `timing` attribute. Disabled by default.
+      slow_request_threshold (float): Duration in seconds from which a
+        profiled call is reported to on_slow_request. The default value
+        is 1. Use 0 to report every call.
+      on_slow_request (Optional[Callable[[RequestTiming], None]]): Called
+        with the RequestTiming of each profiled call slower than
+        slow_request_threshold. Setting it enables profiling.
+      transport (Optional[BaseTransport]): Transport sending the API
+        requests, e.g. a RecordingTransport or a ReplayTransport from
+        `tikfly.transports`. Defaults to an AiohttpTransport built from the
+        connection pool settings above. Media downloads from the CDN do not
+        go through the transport. It is closed by `aclose()`.
 
     Raises:
-      ValueError: If the x_rapidapi_key is not provided.
+      ValueError: If the x_rapidapi_key is not provided or decode_mode is invalid.
     """
     if not x_rapidapi_key:
       print(self.__get_api_key_tutorial())
       raise ValueError('x_rapidapi_key is required')
 
+    if decode_mode not in DECODE_MODES:
+      raise ValueError(f'decode_mode must be one of {DECODE_MODES}')
+
     self.x_rapidapi_key = x_rapidapi_key
     self.host = host
     self.base_api_url = f'https://{self.host}/api'
@@ -55,6 +175,95 @@ class TikflyApi():
       'x-rapidapi-host': self.host
     }
 
+    self.connector_limit = connector_limit
+    self.connector_limit_per_host = connector_limit_per_host
+    self.keepalive_timeout = keepalive_timeout
+    self.dns_cache_ttl = dns_cache_ttl
+    self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+    self.rate_limiter = (
+      RateLimiter(rate_limit, burst=rate_limit_burst)
+      if rate_limit is not None else None
+    )
+    self.retry_policy = retry_policy
+    self.cache = cache
+    self.coalesce_requests = coalesce_requests
+    self.decode_mode = decode_mode
+    self.json_loads = json_loads or get_json_loads()
+    self.metrics = metrics
+    self.profile = profile or on_slow_request is not None
+    self.slow_request_threshold = slow_request_threshold
+    self.on_slow_request = on_slow_request
+    self.typed_decoder = (
+      TypedJsonDecoder()
+      if json_loads is None and TypedJsonDecoder.available() else None
+    )
+    self.transport = transport if transport is not None else AiohttpTransport(
+      self.ssl_context,
+      connector_limit=connector_limit,
+      connector_limit_per_host=connector_limit_per_host,
+      keepalive_timeout=keepalive_timeout,
+      dns_cache_ttl=dns_cache_ttl,
+      profile=self.profile
+    )
+    self.downloader = MediaDownloader(
+      self.ssl_context,
+      connector_limit=connector_limit,
+      connector_limit_per_host=connector_limit_per_host,
+      keepalive_timeout=keepalive_timeout,
+      dns_cache_ttl=dns_cache_ttl,
+      retry_policy=retry_policy
+    )
+
+    self.__in_flight: dict = {}
+    self.__tasks: set = set()
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exc_type, exc, tb):
+    await self.aclose()
+
+  async def aclose(self):
+    """
+    Close the transport, the media session and the cache, releasing all
+    open connections.
+
+    Background tasks still running (shared requests, prefetching and bulk
+    workers of iterators that were not fully consumed) are cancelled, and
+    calls or iterators waiting on them raise a TikflyAPIError. The
+    instance can still be used afterwards; a new session is created on
+    the next request and the cache reopens its resources when accessed.
+    """
+    tasks = list(self.__tasks)
+    for task in tasks:
+      task.cancel()
+    if tasks:
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+    try:
+      await self.transport.aclose()
+    finally:
+      await self.downloader.aclose()
+      if self.cache is not None:
+        self.cache.close()
+
+  def __spawn(self, coro) -> asyncio.Task:
+    """
+    Start a background task that is cancelled on `aclose()`.
+    """
+    task = asyncio.create_task(coro)
+    self.__tasks.add(task)
+    task.add_done_callback(self.__tasks.discard)
+    return task
+
+  @staticmethod
+  def __closed_error() -> TikflyAPIError:
+    """
+    Error given to a consumer whose background task was cancelled,
+    usually by `aclose()`.
+    """
+    return TikflyAPIError(message='Tikfly API client was closed while the request was running')
+
   @staticmethod
   def __get_api_key_tutorial():
     """
@@ -79,10 +288,10 @@ class TikflyApi():
       return [self.__to_namespace(v) for v in obj]
     return obj
   
-  def __wrap_namespace(self, *dicts, **named):
+  def __wrap_namespace(self, *dicts, schema: Optional[type] = None, **named):
     """
     Merge multiple dicts and named fields,
-    then convert to SimpleNamespace (deep).
+    then convert them like any other response.
     """
     merged = {}
 
@@ -92,58 +301,691 @@ class TikflyApi():
 
     merged.update(named)
 
-    return self.__to_namespace(merged)
+    return self.__dict_to_obj(merged, schema)
   
-  def __dict_to_obj(self, data: Any):
-    if isinstance(data, dict):
-      return SimpleNamespace(**{
-        k: self.__dict_to_obj(v)
-        for k, v in data.items()
-      })
+  def __dict_to_obj(self, data: Any, schema: Optional[type] = None):
+    if self.decode_mode == 'schema' and schema is not None:
+      return decode_schema(schema, data)
+    if self.decode_mode == 'lazy':
+      return to_lazy_namespace(data)
+    return self.__to_namespace(data)
+
+  def __check_response(self, status: int, headers: Mapping[str, str], body: bytes):
+    """
+    Feed the rate limit headers of a response to the rate limiter and
+    raise if its status is an error.
+    """
+    if self.rate_limiter is not None:
+      self.rate_limiter.update_from_headers(headers)
+
+    if status >= 400:
+      text = body.decode('utf-8', errors='replace')
+      retry_statuses = (
+        self.retry_policy.retry_statuses
+        if self.retry_policy is not None else DEFAULT_RETRY_STATUSES
+      )
+      raise TikflyAPIError(
+        message=f'Tikfly API HTTP error occurred: {status} - {text}',
+        status_code=status,
+        response=text,
+        retryable=status in retry_statuses,
+        retry_after=RetryPolicy.parse_retry_after(
+          headers.get('Retry-After')
+        )
+      )
 
-    if isinstance(data, list):
-      return [self.__dict_to_obj(i) for i in data]
+  async def __send_request(self, url: str, params: dict) -> RawResponse:
+    """
+    Send a single GET request and return the undecoded response.
 
-    return data
+    Raises:
+      TikflyAPIError: If the request fails. Errors from retryable status
+        codes, connection failures and timeouts are flagged as retryable.
+    """
+    if self.rate_limiter is not None:
+      await self.rate_limiter.acquire()
+
+    status = None
+    body = b''
+    timing = RequestTiming(url[len(self.base_api_url):]) if self.profile else None
+    start = time.perf_counter()
+
+    try:
+      response = await self.transport.send(url, params, self.headers, timing)
+      status = response.status
+      body = response.body
+      self.__check_response(response.status, response.headers, body)
+      return response
+    except TikflyAPIError:
+      raise
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+      status = None
+      raise TikflyAPIError(
+        message=f'Tikfly API client error: {err}',
+        retryable=True
+      ) from err
+
+    except Exception as err:
+      status = None
+      raise TikflyAPIError(
+        message=f'Unexpected error: {err}'
+      ) from err
+
+    finally:
+      if self.metrics is not None:
+        self.metrics.record_request(
+          url[len(self.base_api_url):],
+          status,
+          time.perf_counter() - start,
+          len(body)
+        )
+
+  def __retry_delay(self, err: TikflyAPIError, attempt: int) -> Optional[float]:
+    """
+    Get the delay before retrying a failed attempt, or None if the error
+    must be raised.
+    """
+    if (
+      not err.retryable
+      or self.retry_policy is None
+      or attempt >= self.retry_policy.max_attempts
+    ):
+      return None
+    return self.retry_policy.get_delay(attempt, err.retry_after)
+
+  async def __fetch(self, url: str, params: dict) -> RawResponse:
+    """
+    Send a request, retrying retryable failures according to the retry policy.
+    """
+    attempt = 1
+
+    while True:
+      try:
+        return await self.__send_request(url, params)
+      except TikflyAPIError as err:
+        delay = self.__retry_delay(err, attempt)
+        if delay is None:
+          raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+  async def __fetch_and_store(
+    self,
+    url: str,
+    params: dict,
+    endpoint: str,
+    use_cache: bool
+  ) -> RawResponse:
+    response = await self.__fetch(url, params)
+    if use_cache:
+      await self.cache.set(endpoint, params, response.body)
+    return response
+
+  async def __fetch_shared(
+    self,
+    url: str,
+    params: dict,
+    endpoint: str,
+    use_cache: bool
+  ) -> RawResponse:
+    """
+    Fetch a response, joining an identical request already in flight.
+
+    The request runs in its own task and each caller awaits it through
+    `asyncio.shield`, so a cancelled caller does not cancel the request
+    for the others. If the request itself is cancelled by `aclose()`, its
+    callers get a TikflyAPIError.
+    """
+    key = BaseCache.make_key(url, params)
+    task = self.__in_flight.get(key)
+
+    if task is None:
+      task = self.__spawn(
+        self.__fetch_and_store(url, params, endpoint, use_cache)
+      )
+      self.__in_flight[key] = task
+
+      def forget(done):
+        if self.__in_flight.get(key) is done:
+          del self.__in_flight[key]
+        if not done.cancelled():
+          done.exception()
+
+      task.add_done_callback(forget)
+
+    try:
+      return await asyncio.shield(task)
+    except asyncio.CancelledError:
+      # The shared request was cancelled rather than this caller.
+      if task.cancelled():
+        raise self.__closed_error() from None
+      raise
+
+  async def __get_response(self, url: str, params: dict) -> RawResponse:
+    """
+    Get the undecoded response of a request, from the cache when possible.
+    """
+    endpoint = url[len(self.base_api_url):]
+    use_cache = self.cache is not None and self.cache.get_ttl(endpoint) > 0
+
+    if use_cache:
+      body = await self.cache.get(endpoint, params)
+      if body is not None:
+        return RawResponse(
+          status=200,
+          body=body,
+          url=f'{url}?{urlencode(params)}',
+          from_cache=True
+        )
+
+    if self.coalesce_requests:
+      return await self.__fetch_shared(url, params, endpoint, use_cache)
+    return await self.__fetch_and_store(url, params, endpoint, use_cache)
 
   async def __get_request(
     self,
     url: str,
     params: dict,
-    to_dict: bool = True
+    to_dict: bool = True,
+    schema: Optional[type] = None,
+    raw: bool = False
   ):
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    call_start = time.perf_counter()
+    response = await self.__get_response(url, params)
+    if raw:
+      if self.profile:
+        timing = self.__report_timing(url, response, call_start, 0.0)
+        response = dataclasses.replace(response, timing=timing)
+      return response
+
+    if self.metrics is None and not self.profile:
+      return self.__decode(response.body, to_dict, schema)
+
+    start = time.perf_counter()
+    try:
+      return self.__decode(response.body, to_dict, schema)
+    finally:
+      decode = time.perf_counter() - start
+      if self.metrics is not None:
+        self.metrics.record_decode(url[len(self.base_api_url):], decode)
+      if self.profile:
+        self.__report_timing(url, response, call_start, decode)
+
+  def __report_timing(
+    self,
+    url: str,
+    response: RawResponse,
+    call_start: float,
+    decode: float
+  ) -> RequestTiming:
+    """
+    Complete the timing of a profiled call and pass it to on_slow_request
+    if the call was slower than the threshold.
+
+    A coalesced response is shared by several callers, so each one works
+    on its own copy of the network timing.
+    """
+    if response.timing is not None:
+      timing = dataclasses.replace(response.timing)
+    else:
+      timing = RequestTiming(
+        url[len(self.base_api_url):],
+        status=response.status,
+        from_cache=response.from_cache
+      )
+
+    timing.decode = decode
+    timing.total = time.perf_counter() - call_start
+
+    if (
+      self.on_slow_request is not None
+      and timing.total >= self.slow_request_threshold
+    ):
+      self.on_slow_request(timing)
+    return timing
 
+  def __decode(self, body: bytes, to_dict: bool, schema: Optional[type]):
+    """
+    Decode a response body into objects (or plain JSON if not `to_dict`).
+    """
     try:
-      async with aiohttp.ClientSession(
-        headers=self.headers,
-      ) as session:
-        async with session.get(url, params=params, ssl=ssl_context) as res:
-          if res.status >= 400:
-            text = await res.text()
-            raise TikflyAPIError(
-              message=f'Tikfly API HTTP error occurred: {res.status} - {text}',
-              status_code=res.status,
-              response=text
-            )
-
-          res_json = await res.json()
-
-          if to_dict:
-            return self.__dict_to_obj(res_json)
-          return res_json
-    except aiohttp.ClientError as err:
+      if to_dict and self.decode_mode == 'schema' and self.typed_decoder is not None:
+        res = self.typed_decoder.decode(body, schema)
+        if res is not NOT_DECODED:
+          return res
+
+      res_json = self.json_loads(body)
+    except ValueError as err:
       raise TikflyAPIError(
-        message=f'Tikfly API client error: {err}'
+        message=f'Tikfly API returned an invalid JSON response: {err}',
+        response=body
       ) from err
 
-    except Exception as err:
+    if to_dict:
+      return self.__dict_to_obj(res_json, schema)
+    return res_json
+
+  async def __stream_attempt(self, url: str, params: dict, parser: JsonArrayStream):
+    """
+    Send a single GET request and yield the array elements found by
+    `parser` as the body arrives.
+
+    The body is read at the consumer's pace, so the latency recorded in
+    the metrics is the time to the response headers.
+
+    Raises:
+      TikflyAPIError: If the request fails or the body is not valid JSON.
+    """
+    if self.rate_limiter is not None:
+      await self.rate_limiter.acquire()
+
+    status = None
+    size = 0
+    start = time.perf_counter()
+    latency = None
+
+    try:
+      async with self.transport.stream(url, params, self.headers) as res:
+        status = res.status
+        latency = time.perf_counter() - start
+        self.__check_response(
+          res.status,
+          res.headers,
+          await res.read() if res.status >= 400 else b''
+        )
+
+        async for chunk in res.chunks:
+          size += len(chunk)
+          for item in parser.feed(chunk):
+            yield item
+        parser.close()
+    except TikflyAPIError:
+      raise
+
+    except ValueError as err:
       raise TikflyAPIError(
-        message=f'Unexpected error: {err}'
+        message=f'Tikfly API returned an invalid JSON response: {err}'
+      ) from err
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+      status = None
+      raise TikflyAPIError(
+        message=f'Tikfly API client error: {err}',
+        retryable=True
       ) from err
+
+    finally:
+      if self.metrics is not None:
+        self.metrics.record_request(
+          url[len(self.base_api_url):],
+          status,
+          latency if latency is not None else time.perf_counter() - start,
+          size
+        )
+
+  async def __stream_page(self, url: str, params: dict, items_keys: tuple, meta: dict):
+    """
+    Request a page and yield its items as they are parsed off the socket.
+
+    The other fields of the page are stored in `meta` once the body is
+    complete. Failures are retried according to the retry policy only until
+    the first item has been yielded, so no item is ever yielded twice.
+    """
+    attempt = 1
+
+    while True:
+      parser = JsonArrayStream(items_keys, loads=self.json_loads)
+      received = False
+
+      try:
+        async with aclosing(self.__stream_attempt(url, params, parser)) as items:
+          async for item in items:
+            received = True
+            yield item
+      except TikflyAPIError as err:
+        delay = None if received else self.__retry_delay(err, attempt)
+        if delay is None:
+          raise
+        await asyncio.sleep(delay)
+        attempt += 1
+        continue
+
+      meta.update(parser.meta)
+      return
+
+  @staticmethod
+  def __page_value(page: dict, keys: tuple):
+    """
+    Look up the first non-null value of `keys` in a page, falling back
+    to the nested `data` object some endpoints wrap their results in.
+    """
+    sources = [page]
+    if isinstance(page.get('data'), dict):
+      sources.append(page['data'])
+
+    for source in sources:
+      for key in keys:
+        value = source.get(key)
+        if value is not None:
+          return value
+    return None
+
+  async def __iter_pages(
+    self,
+    url: str,
+    params: dict,
+    items_keys: tuple,
+    cursor_param: str,
+    cursor_keys: tuple,
+    has_more_keys: tuple,
+    search_id_param: Optional[str],
+    max_pages: Optional[int]
+  ):
+    """
+    Request the pages of a cursor-based endpoint one after another.
+
+    Stops when the API reports no more results, returns an empty page or
+    repeats the previous cursor, or after `max_pages` pages.
+    """
+    params = dict(params)
+    pages = 0
+
+    while max_pages is None or pages < max_pages:
+      page = await self.__get_request(url, params, to_dict=False)
+      pages += 1
+      yield page
+
+      if not self.__advance_cursor(
+        page,
+        params,
+        bool(self.__page_value(page, items_keys)),
+        cursor_param,
+        cursor_keys,
+        has_more_keys,
+        search_id_param
+      ):
+        return
+
+  async def __stream_items(
+    self,
+    url: str,
+    params: dict,
+    items_keys: tuple,
+    cursor_param: str,
+    cursor_keys: tuple,
+    has_more_keys: tuple,
+    search_id_param: Optional[str],
+    max_pages: Optional[int]
+  ):
+    """
+    Like `__iter_pages`, but parse each page incrementally and yield its
+    items one at a time as they arrive, before the page is fully received.
+    """
+    params = dict(params)
+    pages = 0
+
+    while max_pages is None or pages < max_pages:
+      page = {}
+      received = 0
+
+      async with aclosing(self.__stream_page(url, params, items_keys, page)) as items:
+        async for item in items:
+          received += 1
+          yield item
+      pages += 1
+
+      if not self.__advance_cursor(
+        page,
+        params,
+        received > 0,
+        cursor_param,
+        cursor_keys,
+        has_more_keys,
+        search_id_param
+      ):
+        return
+
+  def __advance_cursor(
+    self,
+    page: dict,
+    params: dict,
+    has_items: bool,
+    cursor_param: str,
+    cursor_keys: tuple,
+    has_more_keys: tuple,
+    search_id_param: Optional[str]
+  ) -> bool:
+    """
+    Update `params` to request the page after `page`.
+
+    Returns:
+      bool: False if there is no next page, i.e. the page is empty, the API
+      reports no more results or the cursor did not move.
+    """
+    has_more = any(self.__page_value(page, (key,)) for key in has_more_keys)
+    next_cursor = self.__page_value(page, cursor_keys)
+
+    if (
+      not has_items
+      or not has_more
+      or next_cursor is None
+      or str(next_cursor) == str(params[cursor_param])
+    ):
+      return False
+
+    params[cursor_param] = next_cursor
+
+    if search_id_param:
+      search_id = (page.get('log_pb') or {}).get('impr_id')
+      if search_id:
+        params[search_id_param] = search_id
+    return True
+
+  async def __prefetch_pages(self, pages, depth: int):
+    """
+    Consume `pages` in a background task, keeping up to `depth` pages
+    requested ahead of the consumer.
+
+    A page slot is taken before each request and given back once the
+    consumer receives the page, so the request for page N+1 is issued
+    while page N is still being processed.
+    """
+    queue = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+    done = object()
+
+    async def produce():
+      while True:
+        await slots.acquire()
+        try:
+          page = await pages.__anext__()
+        except StopAsyncIteration:
+          return
+        queue.put_nowait((page, None))
+
+    def finish(task: asyncio.Task):
+      # Runs however the producer ends, including when it is cancelled
+      # before it starts, so the consumer is never left waiting.
+      if task.cancelled():
+        queue.put_nowait((None, self.__closed_error()))
+      elif task.exception() is not None:
+        queue.put_nowait((None, task.exception()))
+      else:
+        queue.put_nowait((done, None))
+
+    task = self.__spawn(produce())
+    task.add_done_callback(finish)
+
+    try:
+      while True:
+        page, err = await queue.get()
+        if err is not None:
+          raise err
+        if page is done:
+          return
+        slots.release()
+        yield page
+    finally:
+      task.cancel()
+      await asyncio.gather(task, return_exceptions=True)
+      await pages.aclose()
+
+  async def __paginate(
+    self,
+    url: str,
+    params: dict,
+    items_keys: tuple,
+    cursor_param: str = 'cursor',
+    cursor_keys: tuple = ('cursor',),
+    has_more_keys: tuple = HAS_MORE_KEYS,
+    search_id_param: Optional[str] = None,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    item_schema: Optional[type] = None,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ):
+    """
+    Walk a cursor-based endpoint page by page and yield its items one at a time.
+
+    With `prefetch` > 0, up to that many pages are requested ahead of the
+    consumer in a background task. With `fields`, items are yielded as
+    dicts holding only those dotted paths instead of decoded objects. With
+    `stream`, each page is parsed as it arrives off the socket and its items
+    are yielded before the page is complete; streamed pages bypass the
+    response cache and request coalescing.
+    """
+    if stream and prefetch > 0:
+      raise ValueError('stream cannot be combined with prefetch')
+
+    if limit is not None and limit <= 0:
+      return
+
+    if stream:
+      items = self.__stream_items(
+        url,
+        params,
+        items_keys,
+        cursor_param,
+        cursor_keys,
+        has_more_keys,
+        search_id_param,
+        max_pages
+      )
+    else:
+      pages = self.__iter_pages(
+        url,
+        params,
+        items_keys,
+        cursor_param,
+        cursor_keys,
+        has_more_keys,
+        search_id_param,
+        max_pages
+      )
+      if prefetch > 0:
+        pages = self.__prefetch_pages(pages, prefetch)
+      items = self.__page_items(pages, items_keys)
+
+    project = Projection(fields) if fields is not None else None
+
+    yielded = 0
+    try:
+      async for item in items:
+        yield project(item) if project else self.__dict_to_obj(item, item_schema)
+        yielded += 1
+        if limit is not None and yielded >= limit:
+          return
+    finally:
+      await items.aclose()
+
+  async def __page_items(self, pages, items_keys: tuple):
+    """
+    Yield the items of each page of `pages`.
+    """
+    try:
+      async for page in pages:
+        for item in self.__page_value(page, items_keys) or []:
+          yield item
+    finally:
+      await pages.aclose()
+
+  async def __run_many(
+    self,
+    keys: Iterable,
+    fetch,
+    concurrency: int
+  ):
+    """
+    Run `fetch(key)` for every key with at most `concurrency` calls in
+    flight and yield `(key, result_or_error)` pairs as they complete.
+
+    Keys are pulled from the iterable lazily, so large or unbounded
+    iterables are not materialized up front.
+    """
+    if concurrency < 1:
+      raise ValueError('concurrency must be at least 1')
+
+    keys = iter(keys)
+    queue = asyncio.Queue()
+    # Bounds the results waiting for the consumer. A slot is given back
+    # when the consumer receives a result.
+    slots = asyncio.Semaphore(concurrency)
+    done = object()
+
+    async def worker():
+      for key in keys:
+        try:
+          result = await fetch(key)
+        except Exception as err:
+          result = err
+        await slots.acquire()
+        queue.put_nowait((key, result))
+
+    def finish(task: asyncio.Task):
+      # Runs however the worker ends, including when it is cancelled
+      # before it starts, so the consumer is never left waiting.
+      if task.cancelled():
+        queue.put_nowait((done, self.__closed_error()))
+      else:
+        queue.put_nowait((done, task.exception()))
+
+    workers = [self.__spawn(worker()) for _ in range(concurrency)]
+    for task in workers:
+      task.add_done_callback(finish)
+    running = len(workers)
+
+    try:
+      while running:
+        key, result = await queue.get()
+        if key is done:
+          if result is not None:
+            raise result
+          running -= 1
+          continue
+        slots.release()
+        yield key, result
+    finally:
+      for task in workers:
+        task.cancel()
+      await asyncio.gather(*workers, return_exceptions=True)
+
+  @staticmethod
+  def __user_posts_path(sort_by: str) -> str:
+    if sort_by == 'popular':
+      return 'popular-posts'
+    if sort_by == 'oldest':
+      return 'oldest-posts'
+    return 'posts'
     
   # User Endpoints
-  async def get_user_info(self, unique_id: str) -> UserInfoResponse:
+  async def get_user_info(
+    self,
+    unique_id: str,
+    raw: bool = False
+  ) -> Union[UserInfoResponse, RawResponse]:
     """
     Get public user profile information by TikTok uniqueId.
 
@@ -152,6 +994,8 @@ class TikflyApi():
 
     Args:
       unique_id (str): TikTok username (e.g. "taylorswift").
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserInfoResponse: An object containing userInfo and statusCode.
@@ -164,14 +1008,44 @@ class TikflyApi():
       'uniqueId': unique_id
     }
 
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserInfoResponse, raw=raw)
+
+  async def get_user_info_many(
+    self,
+    unique_ids: Iterable[str],
+    concurrency: int = 10
+  ) -> AsyncIterator[Tuple[str, Union[UserInfoResponse, Exception]]]:
+    """
+    Get public user profile information for many TikTok uniqueIds.
+
+    Requests run concurrently, with at most `concurrency` in flight, and
+    results are yielded in completion order. A failed lookup does not
+    abort the batch; its exception is yielded in place of the result.
+
+    Args:
+      unique_ids (Iterable[str]): TikTok usernames (e.g. "taylorswift").
+      concurrency (int): Maximum number of requests in flight.
+        The default value is 10.
+
+    Yields:
+      Tuple[str, Union[UserInfoResponse, Exception]]: The uniqueId and
+      either its UserInfoResponse or the error raised for it.
+
+    Raises:
+      ValueError: If concurrency is lower than 1.
+    """
+    async for key, result in self.__run_many(
+      unique_ids, self.get_user_info, concurrency
+    ):
+      yield key, result
   
   async def get_user_followers(
     self,
     sec_uid: str,
     count: int = 30,
-    min_cursor: int = 0
-  ) -> UserFollowerResponse:
+    min_cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserFollowerResponse, RawResponse]:
     """
     Get the list of followers for a TikTok user by secUid.
 
@@ -185,6 +1059,8 @@ class TikflyApi():
       min_cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the minCursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserFollowersResponse: An object containing follower list data and pagination info.
@@ -198,14 +1074,15 @@ class TikflyApi():
       'count': count,
       'minCursor': min_cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserFollowerResponse, raw=raw)
   
   async def get_user_following(
     self,
     sec_uid: str,
     count: int = 30,
-    min_cursor: int = 0
-  ) -> UserFollowingResponse:
+    min_cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserFollowingResponse, RawResponse]:
     """
     Get the list of following for a TikTok user by secUid.
 
@@ -219,6 +1096,8 @@ class TikflyApi():
       min_cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the minCursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserFollowingResponse: An object containing following list data and pagination info.
@@ -232,15 +1111,16 @@ class TikflyApi():
       'count': count,
       'minCursor': min_cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserFollowingResponse, raw=raw)
   
   async def get_user_posts(
     self,
     sec_uid: str,
     count: int = 15,
     cursor: int = 0,
-    sort_by: Literal['latest', 'popular', 'oldest'] = 'latest'
-  ) -> UserPostResponse:
+    sort_by: Literal['latest', 'popular', 'oldest'] = 'latest',
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get a list of posts for a TikTok user by secUid.
 
@@ -259,6 +1139,8 @@ class TikflyApi():
         - "latest": Most recent posts (default).
         - "popular": Posts with highest engagement.
         - "oldest": Oldest published posts.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing post list data and pagination info.
@@ -266,23 +1148,20 @@ class TikflyApi():
     Raises:
       TikflyAPIError: If the API request fails or returnss an error response.
     """
-    if sort_by == 'popular':
-      type = 'popular-posts'
-    elif sort_by == 'oldest':
-      type = 'oldest-posts'
-    else:
-      type = 'posts'
- 
-    url = f'{self.base_api_url}/user/{type}'
+    url = f'{self.base_api_url}/user/{self.__user_posts_path(sort_by)}'
     params = {
       'secUid': sec_uid,
       'count': count,
       'cursor': cursor
     }
 
-    res = await self.__get_request(url, params, to_dict=False)
+    res = await self.__get_request(url, params, to_dict=False, raw=raw)
+
+    if raw:
+      return res
 
     data = self.__wrap_namespace(
+      schema=UserPostResponse,
       cursor=res.get('data', {}).get('cursor') or res.get('cursor'),
       hasMore=res.get('data', {}).get('hasMore') or res.get('hasMore'),
       itemList=res.get('data', {}).get('itemList') or res.get('itemList')
@@ -294,8 +1173,9 @@ class TikflyApi():
     self,
     sec_uid: str,
     count: int = 30,
-    cursor: int = 0
-  ) -> UserPostResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get a list of posts liked by a TikTok user by secUid.
 
@@ -309,6 +1189,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing liked post data and pagination info.
@@ -322,14 +1204,15 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
   
   async def get_user_playlist(
     self,
     sec_uid: str,
     count: int = 20,
-    cursor: int = 0
-  ) -> UserPlaylistResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPlaylistResponse, RawResponse]:
     """
     Get the list of playlists for a TikTok user by secUid.
 
@@ -343,6 +1226,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPlaylistResponse: An object containing playlist data and pagination info.
@@ -356,14 +1241,15 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPlaylistResponse, raw=raw)
   
   async def get_user_repost(
     self,
     sec_uid: str,
     count: int = 30,
-    cursor: int = 0
-  ) -> UserPostResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get the list of reposted posts for a TikTok user by secUid.
 
@@ -377,6 +1263,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing reposted post data and pagination info.
@@ -390,13 +1278,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
   
   async def get_user_story(
     self,
     user_id: str,
-    max_cursor: str = '0'
-  ) -> UserStoryResponse:
+    max_cursor: str = '0',
+    raw: bool = False
+  ) -> Union[UserStoryResponse, RawResponse]:
     """
     Get the list of stories for a TikTok user by userId.
 
@@ -408,6 +1297,8 @@ class TikflyApi():
       max_cursor (str): Cursor used for pagination.
         Use "0" for the first request. For subsequent requests,
         use the maxCursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserStoryResponse: An object containing story data and pagination info.
@@ -420,15 +1311,16 @@ class TikflyApi():
       'userId': user_id,
       'maxCursor': max_cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserStoryResponse, raw=raw)
   
   # Search Endpoints
   async def search_general(
     self,
     keyword: str,
     cursor: int = 0,
-    search_id: str = '0'
-  ) -> SearchGeneralResponse:
+    search_id: str = '0',
+    raw: bool = False
+  ) -> Union[SearchGeneralResponse, RawResponse]:
     """
     Perform a general search on TikTok using a keyword.
 
@@ -449,6 +1341,8 @@ class TikflyApi():
         (from log_pb.impr_id).
         In search endpoints, both cursor and search_id must be provided
         when pagination is used.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       SearchGeneralResponse: An object containing search results and pagination info.
@@ -462,14 +1356,15 @@ class TikflyApi():
       'cursor': cursor,
       'search_id': search_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=SearchGeneralResponse, raw=raw)
   
   async def search_videos(
     self,
     keyword: str,
     cursor: int = 0,
-    search_id: str = '0'
-  ) -> SearchVideoResponse:
+    search_id: str = '0',
+    raw: bool = False
+  ) -> Union[SearchVideoResponse, RawResponse]:
     """
     Search TikTok videos using a keyword.
 
@@ -490,6 +1385,8 @@ class TikflyApi():
         (from log_pb.impr_id).
         In search endpoints, both cursor and search_id must be provided
         when pagination is used.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       SearchVideoResponse: An object containing video search results and pagination info.
@@ -503,14 +1400,15 @@ class TikflyApi():
       'cursor': cursor,
       'search_id': search_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=SearchVideoResponse, raw=raw)
   
   async def search_accounts(
     self,
     keyword: str,
     cursor: int = 0,
-    search_id: str = '0'
-  ) -> SearchAccountResponse:
+    search_id: str = '0',
+    raw: bool = False
+  ) -> Union[SearchAccountResponse, RawResponse]:
     """
     Search TikTok accounts using a keyword.
 
@@ -531,6 +1429,8 @@ class TikflyApi():
         (from log_pb.impr_id).
         In search endpoints, both cursor and search_id must be provided
         when pagination is used.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       SearchAccountResponse: An object containing account search results and pagination info.
@@ -544,14 +1444,15 @@ class TikflyApi():
       'cursor': cursor,
       'search_id': search_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=SearchAccountResponse, raw=raw)
   
   async def search_live(
     self,
     keyword: str,
     cursor: int = 0,
-    search_id: str = '0'
-  ) -> SearchLiveResponse:
+    search_id: str = '0',
+    raw: bool = False
+  ) -> Union[SearchLiveResponse, RawResponse]:
     """
     Search TikTok live streams using a keyword.
 
@@ -572,6 +1473,8 @@ class TikflyApi():
         (from log_pb.impr_id).
         In search endpoints, both cursor and search_id must be provided
         when pagination is used.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       SearchLiveResponse: An object containing live stream search results and pagination info.
@@ -585,13 +1488,14 @@ class TikflyApi():
       'cursor': cursor,
       'search_id': search_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=SearchLiveResponse, raw=raw)
   
   # Post Endpoints
   async def get_post_detail(
     self,
-    video_id: str
-  ) -> PostDetailResponse:
+    video_id: str,
+    raw: bool = False
+  ) -> Union[PostDetailResponse, RawResponse]:
     """
     Get detailed information of a TikTok post by video ID.
 
@@ -601,6 +1505,8 @@ class TikflyApi():
 
     Args:
       video_id (str): TikTok video ID (e.g. "7572198435487501598").
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       PostDetailResponse: An object containing itemInfo and statusCode.
@@ -612,14 +1518,45 @@ class TikflyApi():
     params = {
       'videoId': video_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=PostDetailResponse, raw=raw)
+  
+
+  async def get_post_detail_many(
+    self,
+    video_ids: Iterable[str],
+    concurrency: int = 10
+  ) -> AsyncIterator[Tuple[str, Union[PostDetailResponse, Exception]]]:
+    """
+    Get detailed information for many TikTok posts by video ID.
+
+    Requests run concurrently, with at most `concurrency` in flight, and
+    results are yielded in completion order. A failed lookup does not
+    abort the batch; its exception is yielded in place of the result.
+
+    Args:
+      video_ids (Iterable[str]): TikTok video IDs (e.g. "7572198435487501598").
+      concurrency (int): Maximum number of requests in flight.
+        The default value is 10.
+
+    Yields:
+      Tuple[str, Union[PostDetailResponse, Exception]]: The video ID and
+      either its PostDetailResponse or the error raised for it.
+
+    Raises:
+      ValueError: If concurrency is lower than 1.
+    """
+    async for key, result in self.__run_many(
+      video_ids, self.get_post_detail, concurrency
+    ):
+      yield key, result
   
   async def get_post_comments(
     self,
     video_id: str,
     count: int = 50,
-    cursor: int = 0
-  ) -> CommentListResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[CommentListResponse, RawResponse]:
     """
     Get comments of a TikTok post by video ID.
 
@@ -634,6 +1571,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       CommentListResponse: An object containing comments data and pagination info.
@@ -647,15 +1586,16 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=CommentListResponse, raw=raw)
   
   async def get_post_replies_comment(
     self,
     video_id: str,
     comment_id: str,
     count: int = 6,
-    cursor: int = 0
-  ) -> CommentListResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[CommentListResponse, RawResponse]:
     """
     Get reply comments of a specific TikTok comment.
 
@@ -671,6 +1611,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       CommentListResponse: An object containing reply comments data
@@ -686,13 +1628,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=CommentListResponse, raw=raw)
   
   # Hashtag Endpoints
   async def get_hashtag_info(
     self,
-    hashtag: str
-  ) -> ChallengeInfoResponse:
+    hashtag: str,
+    raw: bool = False
+  ) -> Union[ChallengeInfoResponse, RawResponse]:
     """
     Get hashtag (challenge) information by hashtag name.
 
@@ -702,6 +1645,8 @@ class TikflyApi():
     Args:
       hashtag (str): Hashtag name without the "#" prefix
         (e.g. "fyp").
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       ChallengeInfoResponse: An object containing hashtag information
@@ -714,14 +1659,15 @@ class TikflyApi():
     params = {
       'challengeName': hashtag
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=ChallengeInfoResponse, raw=raw)
   
   async def get_hashtag_posts(
     self,
     hashtag_id: str,
     count: int = 30,
-    cursor: int = 0
-  ) -> UserPostResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get posts associated with a specific TikTok hashtag (challenge).
 
@@ -736,6 +1682,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing hashtag posts data
@@ -750,13 +1698,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
   
   # Music Endpoints
   async def get_music_info(
     self,
-    music_id: str
-  ) -> MusicInfoResponse:
+    music_id: str,
+    raw: bool = False
+  ) -> Union[MusicInfoResponse, RawResponse]:
     """
     Get music (sound) information by music ID.
 
@@ -766,6 +1715,8 @@ class TikflyApi():
 
     Args:
       music_id (str): TikTok music (sound) ID.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       MusicInfoResponse: An object containing music information
@@ -778,14 +1729,15 @@ class TikflyApi():
     params = {
       'musicId': music_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=MusicInfoResponse, raw=raw)
   
   async def get_music_posts(
     self,
     music_id: str,
     count: int = 30,
-    cursor: int = 0
-  ) -> UserPostResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get posts associated with a specific TikTok music (sound).
 
@@ -800,6 +1752,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing music posts data
@@ -814,13 +1768,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
   
   # Place Endpoints
   async def get_place_info(
     self,
-    place_id: str
-  ) -> PlaceInfoResponse:
+    place_id: str,
+    raw: bool = False
+  ) -> Union[PlaceInfoResponse, RawResponse]:
     """
     Get place (location) information by place ID.
 
@@ -830,6 +1785,8 @@ class TikflyApi():
 
     Args:
       place_id (str): TikTok place (location) ID.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       PlaceInfoResponse: An object containing place information
@@ -842,14 +1799,15 @@ class TikflyApi():
     params = {
       'placeId': place_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=PlaceInfoResponse, raw=raw)
   
   async def get_place_posts(
     self,
     place_id: str,
     count: int = 30,
-    cursor: int = 0
-  ) -> UserPostResponse:
+    cursor: int = 0,
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get posts associated with a specific TikTok place (location).
 
@@ -864,6 +1822,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing place posts data
@@ -878,13 +1838,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
 
   # Effect Endpoints
   async def get_effect_info(
     self,
-    effect_id: str
-  ) -> EffectInfoResponse:
+    effect_id: str,
+    raw: bool = False
+  ) -> Union[EffectInfoResponse, RawResponse]:
     """
     Get effect (sticker) information by effect ID.
 
@@ -894,6 +1855,8 @@ class TikflyApi():
 
     Args:
       effect_id (str): TikTok effect (sticker) ID.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       EffectInfoResponse: An object containing effect information
@@ -906,13 +1869,14 @@ class TikflyApi():
     params = {
       'effectId': effect_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=EffectInfoResponse, raw=raw)
   
   async def get_effect_posts(
     self,
     effect_id: str,
     count: int = 30,
-    cursor: int = 0
+    cursor: int = 0,
+    raw: bool = False
   ):
     """
     Get posts associated with a specific TikTok effect (sticker).
@@ -928,6 +1892,8 @@ class TikflyApi():
       cursor (int): Cursor used for pagination.
         Use 0 for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       EffectPostsResponse: An object containing effect posts data
@@ -942,12 +1908,13 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, raw=raw)
   
   # Collection Endpoints
   async def get_collection_info(
     self,
-    collection_id: str
+    collection_id: str,
+    raw: bool = False
   ):
     """
     Get collection information by collection ID.
@@ -958,6 +1925,8 @@ class TikflyApi():
 
     Args:
       collection_id (str): TikTok collection ID.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       CollectionInfoResponse: An object containing collection information
@@ -970,14 +1939,15 @@ class TikflyApi():
     params = {
       'collectionId': collection_id
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, raw=raw)
   
   async def get_collection_posts(
     self,
     collection_id: str,
     count: int = 30,
-    cursor: str = '0'
-  ) -> UserPostResponse:
+    cursor: str = '0',
+    raw: bool = False
+  ) -> Union[UserPostResponse, RawResponse]:
     """
     Get posts associated with a specific TikTok collection.
 
@@ -992,6 +1962,8 @@ class TikflyApi():
       cursor (str): Cursor used for pagination.
         Use "0" for the first request. For subsequent requests,
         use the cursor value returned from the previous response.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       UserPostResponse: An object containing collection posts data
@@ -1006,13 +1978,14 @@ class TikflyApi():
       'count': count,
       'cursor': cursor
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=UserPostResponse, raw=raw)
   
   # Download Endpoints
   async def download_video(
     self,
-    video_url: str
-  ) -> DownloadVideoResponse:
+    video_url: str,
+    raw: bool = False
+  ) -> Union[DownloadVideoResponse, RawResponse]:
     """
     Download a TikTok video by video URL.
 
@@ -1020,6 +1993,8 @@ class TikflyApi():
 
     Args:
       video_url (str): Full TikTok video URL.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       DownloadVideoResponse: An object containing download URL.
@@ -1031,12 +2006,13 @@ class TikflyApi():
     params = {
       'url': video_url
     }
-    return await self.__get_request(url, params)
+    return await self.__get_request(url, params, schema=DownloadVideoResponse, raw=raw)
   
   async def download_music(
     self,
-    video_url: str
-  ) -> DownloadMusicResponse:
+    video_url: str,
+    raw: bool = False
+  ) -> Union[DownloadMusicResponse, RawResponse]:
     """
     Download music (audio) from a TikTok video URL.
 
@@ -1045,6 +2021,8 @@ class TikflyApi():
 
     Args:
       video_url (str): Full TikTok video URL.
+      raw (bool): If True, return a RawResponse with the undecoded body
+        bytes, status and headers instead of a decoded object.
 
     Returns:
       DownloadMusicResponse: An object containing download URL.
@@ -1056,5 +2034,1351 @@ class TikflyApi():
     params = {
       'url': video_url
     }
-    return await self.__get_request(url, params)
-  
\ No newline at end of file
+    return await self.__get_request(url, params, schema=DownloadMusicResponse, raw=raw)
+  
+  async def __resolve_media_url(
+    self,
+    kind: str,
+    video_url: str,
+    watermark: bool = False,
+    refresh: bool = False
+  ) -> str:
+    """
+    Get the CDN URL of a video or its music from the download endpoint.
+
+    With `refresh`, the response cache is bypassed (and updated), since a
+    cached URL may have expired.
+
+    Raises:
+      TikflyAPIError: If the request fails or the response has no URL.
+    """
+    url = f'{self.base_api_url}/download/{kind}'
+    params = {
+      'url': video_url
+    }
+
+    if refresh:
+      endpoint = url[len(self.base_api_url):]
+      use_cache = self.cache is not None and self.cache.get_ttl(endpoint) > 0
+      response = await self.__fetch_and_store(url, params, endpoint, use_cache)
+      try:
+        res = self.json_loads(response.body)
+      except ValueError as err:
+        raise TikflyAPIError(
+          message=f'Tikfly API returned an invalid JSON response: {err}',
+          response=response.body
+        ) from err
+    else:
+      res = await self.__get_request(url, params, to_dict=False)
+
+    key = 'play_watermark' if watermark else 'play'
+    media_url = res.get(key) if isinstance(res, dict) else None
+    if not media_url:
+      raise TikflyAPIError(
+        message=f'Tikfly API returned no {kind} download URL for {video_url}',
+        response=res
+      )
+    return media_url
+
+  async def save_video(
+    self,
+    video_url: str,
+    path: Union[str, os.PathLike],
+    watermark: bool = False,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    segments: int = 1
+  ) -> int:
+    """
+    Download a TikTok video to a file.
+
+    The download URL is resolved with `download_video`, then the video is
+    streamed to disk over the pooled CDN session. It is written to
+    `<path>.part` and renamed to `path` once its length is verified.
+
+    An interrupted download keeps its `.part` file and is resumed with a
+    Range request by the next call (or by the retry policy, if any). If
+    the signed CDN URL has expired, a fresh one is resolved transparently.
+
+    Args:
+      video_url (str): Full TikTok video URL.
+      path (Union[str, os.PathLike]): Destination file path.
+      watermark (bool): If True, download the watermarked version.
+      chunk_size (Optional[int]): Number of bytes read and written at a time.
+        The default value is 1 MiB.
+      progress (Optional[Callable[[int, Optional[int]], None]]): Called after
+        each chunk with the number of bytes written so far and the total
+        size, or None if unknown.
+      segments (int): Number of concurrent Range requests to split the
+        download into, for large files on fast links. Falls back to a
+        single stream if the CDN does not support ranges. The default
+        value 1 downloads over a single connection.
+
+    Returns:
+      int: Size of the downloaded file.
+
+    Raises:
+      TikflyAPIError: If the download URL cannot be resolved or the
+        transfer fails.
+    """
+    media_url = await self.__resolve_media_url('video', video_url, watermark)
+    return await self.downloader.save(
+      media_url,
+      path,
+      chunk_size=chunk_size,
+      progress=progress,
+      resolve=lambda: self.__resolve_media_url('video', video_url, watermark, refresh=True),
+      segments=segments
+    )
+
+  async def save_music(
+    self,
+    video_url: str,
+    path: Union[str, os.PathLike],
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    segments: int = 1
+  ) -> int:
+    """
+    Download the music (audio) of a TikTok video to a file.
+
+    The download URL is resolved with `download_music`, then the audio is
+    streamed to disk over the pooled CDN session. It is written to
+    `<path>.part` and renamed to `path` once its length is verified.
+
+    An interrupted download keeps its `.part` file and is resumed with a
+    Range request by the next call (or by the retry policy, if any). If
+    the signed CDN URL has expired, a fresh one is resolved transparently.
+
+    Args:
+      video_url (str): Full TikTok video URL.
+      path (Union[str, os.PathLike]): Destination file path.
+      chunk_size (Optional[int]): Number of bytes read and written at a time.
+        The default value is 1 MiB.
+      progress (Optional[Callable[[int, Optional[int]], None]]): Called after
+        each chunk with the number of bytes written so far and the total
+        size, or None if unknown.
+      segments (int): Number of concurrent Range requests to split the
+        download into, for large files on fast links. Falls back to a
+        single stream if the CDN does not support ranges. The default
+        value 1 downloads over a single connection.
+
+    Returns:
+      int: Size of the downloaded file.
+
+    Raises:
+      TikflyAPIError: If the download URL cannot be resolved or the
+        transfer fails.
+    """
+    media_url = await self.__resolve_media_url('music', video_url)
+    return await self.downloader.save(
+      media_url,
+      path,
+      chunk_size=chunk_size,
+      progress=progress,
+      resolve=lambda: self.__resolve_media_url('music', video_url, refresh=True),
+      segments=segments
+    )
+
+  def stream_video(
+    self,
+    video_url: str,
+    watermark: bool = False,
+    chunk_size: Optional[int] = None
+  ) -> MediaStream:
+    """
+    Stream the bytes of a TikTok video without writing it to disk.
+
+    The download URL is resolved with `download_video` and the video is
+    requested over the pooled CDN session when the returned stream is
+    entered with `async with`. Iterate over the stream to get the body
+    in chunks, e.g. to pipe it into a multipart upload:
+
+      async with tikfly.stream_video(video_url) as stream:
+        print(stream.content_length)
+        async for chunk in stream:
+          await upload.write(chunk)
+
+    Args:
+      video_url (str): Full TikTok video URL.
+      watermark (bool): If True, stream the watermarked version.
+      chunk_size (Optional[int]): Number of bytes per chunk.
+        The default value is 1 MiB.
+
+    Returns:
+      MediaStream: An async context manager and iterator over byte chunks.
+      Its `content_length` is the size of the video, or None if unknown.
+
+    Raises:
+      TikflyAPIError: When entered, if the download URL cannot be resolved
+        or the CDN returns an error; while iterating, if the transfer fails.
+    """
+    async def open_response():
+      media_url = await self.__resolve_media_url('video', video_url, watermark)
+      return await self.downloader.request(
+        media_url,
+        resolve=lambda: self.__resolve_media_url('video', video_url, watermark, refresh=True)
+      )
+
+    return MediaStream(open_response, chunk_size or self.downloader.chunk_size)
+
+  def stream_music(
+    self,
+    video_url: str,
+    chunk_size: Optional[int] = None
+  ) -> MediaStream:
+    """
+    Stream the bytes of the music (audio) of a TikTok video without
+    writing it to disk.
+
+    The download URL is resolved with `download_music` and the audio is
+    requested over the pooled CDN session when the returned stream is
+    entered with `async with`. See `stream_video`.
+
+    Args:
+      video_url (str): Full TikTok video URL.
+      chunk_size (Optional[int]): Number of bytes per chunk.
+        The default value is 1 MiB.
+
+    Returns:
+      MediaStream: An async context manager and iterator over byte chunks.
+      Its `content_length` is the size of the audio, or None if unknown.
+
+    Raises:
+      TikflyAPIError: When entered, if the download URL cannot be resolved
+        or the CDN returns an error; while iterating, if the transfer fails.
+    """
+    async def open_response():
+      media_url = await self.__resolve_media_url('music', video_url)
+      return await self.downloader.request(
+        media_url,
+        resolve=lambda: self.__resolve_media_url('music', video_url, refresh=True)
+      )
+
+    return MediaStream(open_response, chunk_size or self.downloader.chunk_size)
+
+  def download_many(
+    self,
+    video_urls: Iterable[str],
+    dest_dir: Union[str, os.PathLike],
+    concurrency: int = 4,
+    api_concurrency: int = 10,
+    watermark: bool = False,
+    skip_existing: bool = True,
+    segments: int = 1,
+    chunk_size: Optional[int] = None
+  ) -> DownloadBatch:
+    """
+    Download many TikTok videos into a directory.
+
+    Each video is saved as `<video_id>.mp4` in `dest_dir`. Download URLs
+    are resolved with at most `api_concurrency` API requests in flight, and
+    at most `concurrency` files are transferred from the CDN at once, each
+    like `save_video` (resumable `.part` files, retries, URL refresh).
+    URLs with the same video ID are downloaded once: a later URL waits for
+    the download of an earlier one and is reported as a duplicate once it
+    succeeds, or is downloaded itself if it failed. Videos already in
+    `dest_dir` are skipped without calling the API.
+
+    The batch runs as it is iterated, yielding one DownloadResult per URL
+    in completion order; a failed download does not abort the batch.
+    `batch.summary` holds the counts, total bytes and average rate:
+
+      batch = tikfly.download_many(urls, 'videos')
+      async for result in batch:
+        print(result.status, result.path)
+      print(batch.summary.bytes, batch.summary.rate)
+
+    Args:
+      video_urls (Iterable[str]): Full TikTok video URLs. The iterable is
+        consumed lazily.
+      dest_dir (Union[str, os.PathLike]): Destination directory, created
+        if missing.
+      concurrency (int): Maximum number of CDN transfers in flight.
+        The default value is 4.
+      api_concurrency (int): Maximum number of download URL requests in
+        flight. The default value is 10.
+      watermark (bool): If True, download the watermarked versions.
+      skip_existing (bool): Skip videos whose file already exists.
+        Enabled by default.
+      segments (int): Number of concurrent Range requests per file.
+        See `save_video`. The default value is 1.
+      chunk_size (Optional[int]): Number of bytes read and written at a time.
+        The default value is 1 MiB.
+
+    Returns:
+      DownloadBatch: An async iterable of DownloadResult, with a summary.
+
+    Raises:
+      ValueError: If concurrency or api_concurrency is lower than 1.
+    """
+    if concurrency < 1 or api_concurrency < 1:
+      raise ValueError('concurrency and api_concurrency must be at least 1')
+
+    dest_dir = os.fspath(dest_dir)
+    api_slots = asyncio.Semaphore(api_concurrency)
+    cdn_slots = asyncio.Semaphore(concurrency)
+    # Whether the latest download of each video ID succeeded, once it is over
+    attempts: Dict[str, asyncio.Future] = {}
+
+    async def download(video_url: str) -> DownloadResult:
+      video_id = self.__video_id(video_url)
+      path = os.path.join(dest_dir, f'{video_id}.mp4')
+      result = DownloadResult(video_url, video_id, path, 'downloaded')
+
+      while video_id in attempts:
+        attempt = attempts[video_id]
+        if await asyncio.shield(attempt):
+          result.status = 'duplicate'
+          return result
+        if attempts.get(video_id) is attempt:
+          # The earlier download failed: this URL is tried instead
+          break
+
+      attempt = attempts[video_id] = asyncio.get_running_loop().create_future()
+      succeeded = False
+
+      try:
+        if skip_existing and await asyncio.to_thread(os.path.exists, path):
+          result.status = 'skipped'
+          result.size = await asyncio.to_thread(os.path.getsize, path)
+          succeeded = True
+          return result
+
+        async with api_slots:
+          media_url = await self.__resolve_media_url('video', video_url, watermark)
+
+        async with cdn_slots:
+          result.size = await self.downloader.save(
+            media_url,
+            path,
+            chunk_size=chunk_size,
+            resolve=lambda: self.__resolve_media_url('video', video_url, watermark, refresh=True),
+            segments=segments
+          )
+        succeeded = True
+      except Exception as err:
+        result.status = 'failed'
+        result.error = err
+      finally:
+        attempt.set_result(succeeded)
+      return result
+
+    async def results():
+      await asyncio.to_thread(os.makedirs, dest_dir, exist_ok=True)
+      async for _, result in self.__run_many(
+        video_urls, download, concurrency + api_concurrency
+      ):
+        yield result
+
+    return DownloadBatch(results())
+
+  @staticmethod
+  def __video_id(video_url: str) -> str:
+    """
+    Get the video ID of a TikTok URL, falling back to its last path
+    segment for URLs without one (e.g. short links).
+    """
+    match = VIDEO_ID.search(video_url)
+    if match:
+      return match.group(1)
+
+    segment = video_url.split('?')[0].rstrip('/').rsplit('/', 1)[-1]
+    return re.sub(r'[^A-Za-z0-9_-]', '_', segment) or 'video'
+
+  # Pagination Iterators
+  async def iter_user_posts(
+    self,
+    sec_uid: str,
+    count: int = 15,
+    sort_by: Literal['latest', 'popular', 'oldest'] = 'latest',
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts of a TikTok user by secUid.
+
+    Pages are requested one at a time as the iterator is consumed and posts
+    are yielded one by one, so only the current page is held in memory.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of posts to request per page.
+        The default value is 15.
+      sort_by (Literal['latest', 'popular', 'oldest']): Sorting method for posts.
+        See `get_user_posts` for the available values.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: The user's posts, in API order.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/{self.__user_posts_path(sort_by)}'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_user_liked_posts(
+    self,
+    sec_uid: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts liked by a TikTok user by secUid.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of liked posts to request per page.
+        The default value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: The posts liked by the user.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/liked-posts'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_user_repost(
+    self,
+    sec_uid: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts reposted by a TikTok user by secUid.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of reposted posts to request per page.
+        The default value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: The posts reposted by the user.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/repost'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_user_playlist(
+    self,
+    sec_uid: str,
+    count: int = 20,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[PlayListItem]:
+    """
+    Iterate over the playlists of a TikTok user by secUid.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of playlists to request per page.
+        The default value is 20.
+      limit (Optional[int]): Stop after yielding this many playlists.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["mixId", "name", "videoCount"]). When given, items are yielded as
+        dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      PlayListItem: The user's playlists.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/playlist'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('playList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=PlayListItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_followers(
+    self,
+    sec_uid: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[UserListItem]:
+    """
+    Iterate over the followers of a TikTok user by secUid.
+
+    The `minCursor` of each response is used to request the next page.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of followers to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many followers.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["user.uniqueId", "stats.followerCount"]). When given, items are
+        yielded as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      UserListItem: The user's followers.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/followers'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'minCursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('userList',),
+      cursor_param='minCursor',
+      cursor_keys=('minCursor',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=UserListItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_following(
+    self,
+    sec_uid: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[FollowingListItem]:
+    """
+    Iterate over the accounts a TikTok user follows by secUid.
+
+    The `minCursor` of each response is used to request the next page.
+
+    Args:
+      sec_uid (str): TikTok user secUid.
+      count (int): Number of following to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many accounts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["user.uniqueId", "stats.followerCount"]). When given, items are
+        yielded as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      FollowingListItem: The accounts followed by the user.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/followings'
+    params = {
+      'secUid': sec_uid,
+      'count': count,
+      'minCursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('userList',),
+      cursor_param='minCursor',
+      cursor_keys=('minCursor',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=FollowingListItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_user_story(
+    self,
+    user_id: str,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[StoryItem]:
+    """
+    Iterate over the stories of a TikTok user by userId.
+
+    The `MaxCursor` of each response is used to request the next page.
+
+    Args:
+      user_id (str): TikTok user ID.
+      limit (Optional[int]): Stop after yielding this many stories.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      StoryItem: The user's stories.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/user/story'
+    params = {
+      'userId': user_id,
+      'maxCursor': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      cursor_param='maxCursor',
+      cursor_keys=('MaxCursor', 'maxCursor'),
+      has_more_keys=('HasMoreBefore', 'HasMoreAfter', 'hasMore'),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=StoryItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_search_general(
+    self,
+    keyword: str,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[SearchGeneralItem]:
+    """
+    Iterate over general search results for a keyword.
+
+    The cursor and search_id (log_pb.impr_id) of each response are used
+    to request the next page.
+
+    Args:
+      keyword (str): Search keyword.
+      limit (Optional[int]): Stop after yielding this many results.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["type", "item.id"]). When given, items are yielded as dicts keyed
+        by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      SearchGeneralItem: Mixed search results.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/search/general'
+    params = {
+      'keyword': keyword,
+      'cursor': 0,
+      'search_id': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('data', 'items'),
+      search_id_param='search_id',
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=SearchGeneralItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_search_videos(
+    self,
+    keyword: str,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[SearchVideoItem]:
+    """
+    Iterate over video search results for a keyword.
+
+    The cursor and search_id (log_pb.impr_id) of each response are used
+    to request the next page.
+
+    Args:
+      keyword (str): Search keyword.
+      limit (Optional[int]): Stop after yielding this many videos.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      SearchVideoItem: Matching videos.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/search/video'
+    params = {
+      'keyword': keyword,
+      'cursor': 0,
+      'search_id': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('item_list', 'itemList', 'data'),
+      search_id_param='search_id',
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=SearchVideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_search_accounts(
+    self,
+    keyword: str,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[SearchAccountItem]:
+    """
+    Iterate over account search results for a keyword.
+
+    The cursor and search_id (log_pb.impr_id) of each response are used
+    to request the next page.
+
+    Args:
+      keyword (str): Search keyword.
+      limit (Optional[int]): Stop after yielding this many accounts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["user_info.unique_id", "user_info.follower_count"]). When given,
+        items are yielded as dicts keyed by path and the rest of each item is
+        not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      SearchAccountItem: Matching accounts.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/search/account'
+    params = {
+      'keyword': keyword,
+      'cursor': 0,
+      'search_id': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('user_list',),
+      search_id_param='search_id',
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=SearchAccountItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_search_live(
+    self,
+    keyword: str,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[LiveDataItem]:
+    """
+    Iterate over live stream search results for a keyword.
+
+    The cursor and search_id (log_pb.impr_id) of each response are used
+    to request the next page.
+
+    Args:
+      keyword (str): Search keyword.
+      limit (Optional[int]): Stop after yielding this many live streams.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["live_info.raw_data", "live_info.room_info.is_battle"]). When
+        given, items are yielded as dicts keyed by path and the rest of each
+        item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      LiveDataItem: Matching live streams.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/search/live'
+    params = {
+      'keyword': keyword,
+      'cursor': 0,
+      'search_id': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('data',),
+      search_id_param='search_id',
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=LiveDataItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_post_comments(
+    self,
+    video_id: str,
+    count: int = 50,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[Comment]:
+    """
+    Iterate over the comments of a TikTok post by video ID.
+
+    Args:
+      video_id (str): TikTok video ID.
+      count (int): Number of comments to request per page.
+        The default value is 50.
+      limit (Optional[int]): Stop after yielding this many comments.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["cid", "text", "digg_count"]). When given, items are yielded as
+        dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      Comment: The post's comments.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/post/comments'
+    params = {
+      'videoId': video_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('comments',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=Comment,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_post_replies_comment(
+    self,
+    video_id: str,
+    comment_id: str,
+    count: int = 6,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[Comment]:
+    """
+    Iterate over the replies to a specific TikTok comment.
+
+    Args:
+      video_id (str): TikTok video ID.
+      comment_id (str): Comment ID for which to retrieve replies.
+      count (int): Number of reply comments to request per page.
+        The default value is 6.
+      limit (Optional[int]): Stop after yielding this many replies.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each item
+        (e.g. ["cid", "text", "digg_count"]). When given, items are yielded as
+        dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      Comment: The replies to the comment.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/post/comment/replies'
+    params = {
+      'videoId': video_id,
+      'commentId': comment_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('comments',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=Comment,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_hashtag_posts(
+    self,
+    hashtag_id: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts of a TikTok hashtag (challenge).
+
+    Args:
+      hashtag_id (str): Hashtag (challenge) ID.
+      count (int): Number of posts to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: Posts published under the hashtag.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/challenge/posts'
+    params = {
+      'challengeId': hashtag_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_music_posts(
+    self,
+    music_id: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts that use a TikTok music (sound).
+
+    Args:
+      music_id (str): TikTok music (sound) ID.
+      count (int): Number of posts to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: Posts using the music.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/music/posts'
+    params = {
+      'musicId': music_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_place_posts(
+    self,
+    place_id: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts tagged with a TikTok place (location).
+
+    Args:
+      place_id (str): TikTok place (location) ID.
+      count (int): Number of posts to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: Posts tagged with the place.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/place/posts'
+    params = {
+      'placeId': place_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_effect_posts(
+    self,
+    effect_id: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts that use a TikTok effect (sticker).
+
+    Args:
+      effect_id (str): TikTok effect (sticker) ID.
+      count (int): Number of posts to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: Posts using the effect.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/effect/posts'
+    params = {
+      'effectId': effect_id,
+      'count': count,
+      'cursor': 0
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
+
+  async def iter_collection_posts(
+    self,
+    collection_id: str,
+    count: int = 30,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    fields: Optional[Iterable[str]] = None,
+    stream: bool = False
+  ) -> AsyncIterator[VideoItem]:
+    """
+    Iterate over the posts of a TikTok collection.
+
+    Args:
+      collection_id (str): TikTok collection ID.
+      count (int): Number of posts to request per page.
+        The default and maximum value is 30.
+      limit (Optional[int]): Stop after yielding this many posts.
+      max_pages (Optional[int]): Stop after requesting this many pages.
+      prefetch (int): Number of pages to request ahead while the current
+        page is consumed. The default value 0 disables read-ahead.
+      fields (Optional[Iterable[str]]): Dotted paths to extract from each
+        item (e.g. ["id", "stats.playCount"]). When given, items are yielded
+        as dicts keyed by path and the rest of each item is not decoded.
+      stream (bool): If True, parse each page as it is received and yield
+        its items before the whole page has arrived. Streamed pages bypass
+        the response cache and cannot be combined with `prefetch`.
+
+    Yields:
+      VideoItem: Posts in the collection.
+
+    Raises:
+      TikflyAPIError: If an API request fails or returns an error response.
+      ValueError: If stream is combined with prefetch.
+    """
+    url = f'{self.base_api_url}/collection/posts'
+    params = {
+      'collectionId': collection_id,
+      'count': count,
+      'cursor': '0'
+    }
+    async for item in self.__paginate(
+      url,
+      params,
+      ('itemList',),
+      limit=limit,
+      max_pages=max_pages,
+      prefetch=prefetch,
+      item_schema=VideoItem,
+      fields=fields,
+      stream=stream
+    ):
+      yield item
@@ -1 +1,7 @@
 from .TikflyApi import TikflyApi
+from .RetryPolicy import RetryPolicy
+from .RawResponse import RawResponse
+from .DownloadBatch import DownloadBatch, DownloadResult, DownloadSummary
+from .MediaStream import MediaStream
+from .MetricsRegistry import MetricsRegistry
+from .RequestTiming import RequestTiming
@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+from urllib.parse import urlencode
+from typing import Optional, Mapping
+
+class BaseCache(ABC):
+  def __init__(
+    self,
+    ttl: float = 60.0,
+    endpoint_ttls: Optional[Mapping[str, float]] = None
+  ):
+    """
+    Base class for Tikfly API response caches.
+
+    Responses are stored as raw body bytes under a key made of the endpoint
+    path and its sorted query params. Each endpoint can have its own TTL;
+    a TTL of 0 disables caching for that endpoint.
+
+    Args:
+      ttl (float): Default time to live of a cached response, in seconds.
+        The default value is 60.
+      endpoint_ttls (Optional[Mapping[str, float]]): TTL overrides keyed by
+        endpoint path (e.g. {"/user/info": 3600, "/search/video": 0}).
+    """
+    self.ttl = ttl
+    self.endpoint_ttls = dict(endpoint_ttls or {})
+    self.hits = 0
+    self.misses = 0
+
+  def get_ttl(self, endpoint: str) -> float:
+    """
+    Get the time to live in seconds of responses from an endpoint.
+    """
+    return self.endpoint_ttls.get(endpoint, self.ttl)
+
+  @staticmethod
+  def make_key(endpoint: str, params: Mapping) -> str:
+    """
+    Build the cache key of a request from its endpoint path and params.
+    """
+    query = urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+    return f'{endpoint}?{query}'
+
+  @abstractmethod
+  async def get(self, endpoint: str, params: Mapping) -> Optional[bytes]:
+    """
+    Get a cached response body, or None on a miss.
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  async def set(self, endpoint: str, params: Mapping, body: bytes):
+    """
+    Store a response body for the TTL of its endpoint.
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  async def clear(self):
+    """
+    Remove every cached response.
+    """
+    raise NotImplementedError
+
+  def close(self):
+    """
+    Release the resources held by the cache, e.g. open files or database
+    connections. The cache must remain usable afterwards, reopening them
+    on the next access.
+    """
+
+  def stats(self) -> dict:
+    """
+    Get the hit and miss counters of the cache.
+
+    Returns:
+      dict: hits, misses and hit_ratio.
+    """
+    total = self.hits + self.misses
+    return {
+      'hits': self.hits,
+      'misses': self.misses,
+      'hit_ratio': self.hits / total if total else 0.0
+    }
@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Mapping
+
+from .BaseCache import BaseCache
+
+class MemoryCache(BaseCache):
+  def __init__(
+    self,
+    max_entries: int = 1024,
+    ttl: float = 60.0,
+    endpoint_ttls: Optional[Mapping[str, float]] = None
+  ):
+    """
+    In-memory response cache with TTL expiry and LRU eviction.
+
+    Args:
+      max_entries (int): Maximum number of cached responses. The least
+        recently used response is evicted when the cache is full.
+        The default value is 1024.
+      ttl (float): Default time to live of a cached response, in seconds.
+      endpoint_ttls (Optional[Mapping[str, float]]): TTL overrides keyed by
+        endpoint path (e.g. {"/user/info": 3600}).
+
+    Raises:
+      ValueError: If max_entries is lower than 1.
+    """
+    if max_entries < 1:
+      raise ValueError('max_entries must be at least 1')
+
+    super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+    self.max_entries = max_entries
+    self.evictions = 0
+    self.__entries: OrderedDict = OrderedDict()
+
+  def __len__(self):
+    return len(self.__entries)
+
+  async def get(self, endpoint: str, params: Mapping) -> Optional[bytes]:
+    key = self.make_key(endpoint, params)
+    entry = self.__entries.get(key)
+
+    if entry is None or entry[0] <= time.monotonic():
+      if entry is not None:
+        del self.__entries[key]
+      self.misses += 1
+      return None
+
+    self.__entries.move_to_end(key)
+    self.hits += 1
+    return entry[1]
+
+  async def set(self, endpoint: str, params: Mapping, body: bytes):
+    ttl = self.get_ttl(endpoint)
+    if ttl <= 0:
+      return
+
+    key = self.make_key(endpoint, params)
+    self.__entries[key] = (time.monotonic() + ttl, body)
+    self.__entries.move_to_end(key)
+
+    while len(self.__entries) > self.max_entries:
+      self.__entries.popitem(last=False)
+      self.evictions += 1
+
+  async def clear(self):
+    self.__entries.clear()
+
+  def stats(self) -> dict:
+    """
+    Get the hit, miss and eviction counters of the cache.
+
+    Returns:
+      dict: hits, misses, hit_ratio, evictions and size.
+    """
+    return {
+      **super().stats(),
+      'evictions': self.evictions,
+      'size': len(self.__entries)
+    }
@@ -0,0 +1,182 @@
+import os
+import time
+import zlib
+import sqlite3
+import asyncio
+import threading
+from typing import Optional, Mapping
+
+from .BaseCache import BaseCache
+
+EVICTION_INTERVAL = 64
+
+class SqliteCache(BaseCache):
+  def __init__(
+    self,
+    path: str,
+    max_bytes: int = 512 * 1024 * 1024,
+    ttl: float = 3600.0,
+    endpoint_ttls: Optional[Mapping[str, float]] = None,
+    compression_level: int = 6,
+    timeout: float = 30.0
+  ):
+    """
+    Persistent response cache stored in a local SQLite file.
+
+    Bodies are stored zlib-compressed and expire after their endpoint TTL.
+    When the compressed size of all entries exceeds `max_bytes`, expired
+    entries are purged first, then the least recently used ones. The size
+    check runs every few writes, so the bound is approximate.
+
+    The database uses WAL journaling and a busy timeout, so several worker
+    processes on the same host can share one cache file. Each process opens
+    its own connection lazily, including after a fork.
+
+    Args:
+      path (str): Path of the SQLite database file.
+      max_bytes (int): Maximum total size of the compressed bodies.
+        The default value is 512 MiB.
+      ttl (float): Default time to live of a cached response, in seconds.
+        The default value is 3600.
+      endpoint_ttls (Optional[Mapping[str, float]]): TTL overrides keyed by
+        endpoint path (e.g. {"/user/info": 86400}).
+      compression_level (int): zlib compression level, from 0 to 9.
+      timeout (float): Seconds to wait for a lock held by another process.
+    """
+    super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+    self.path = path
+    self.max_bytes = max_bytes
+    self.compression_level = compression_level
+    self.timeout = timeout
+
+    self.__lock = threading.Lock()
+    self.__conn: Optional[sqlite3.Connection] = None
+    self.__pid: Optional[int] = None
+    self.__writes = 0
+
+  def __connect(self) -> sqlite3.Connection:
+    if self.__conn is not None and self.__pid == os.getpid():
+      return self.__conn
+
+    conn = sqlite3.connect(
+      self.path,
+      timeout=self.timeout,
+      isolation_level=None,
+      check_same_thread=False
+    )
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(
+      '''
+      CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+      )
+      '''
+    )
+    conn.execute(
+      'CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)'
+    )
+
+    self.__conn = conn
+    self.__pid = os.getpid()
+    return conn
+
+  def __get(self, key: str) -> Optional[bytes]:
+    now = time.time()
+    with self.__lock:
+      conn = self.__connect()
+      row = conn.execute(
+        'SELECT body, expires_at FROM responses WHERE key = ?',
+        (key,)
+      ).fetchone()
+
+      if row is None:
+        return None
+      if row[1] <= now:
+        conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+        return None
+
+      conn.execute(
+        'UPDATE responses SET accessed_at = ? WHERE key = ?',
+        (now, key)
+      )
+    return zlib.decompress(row[0])
+
+  def __set(self, key: str, body: bytes, ttl: float):
+    compressed = zlib.compress(body, self.compression_level)
+    now = time.time()
+    with self.__lock:
+      conn = self.__connect()
+      conn.execute(
+        '''
+        INSERT OR REPLACE INTO responses (key, body, size, expires_at, accessed_at)
+        VALUES (?, ?, ?, ?, ?)
+        ''',
+        (key, compressed, len(compressed), now + ttl, now)
+      )
+
+      self.__writes += 1
+      if self.__writes % EVICTION_INTERVAL == 0:
+        self.__evict(conn, now)
+
+  def __evict(self, conn: sqlite3.Connection, now: float):
+    conn.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+
+    total = conn.execute(
+      'SELECT COALESCE(SUM(size), 0) FROM responses'
+    ).fetchone()[0]
+    if total <= self.max_bytes:
+      return
+
+    conn.execute(
+      '''
+      DELETE FROM responses WHERE key IN (
+        SELECT key FROM (
+          SELECT key, SUM(size) OVER (ORDER BY accessed_at, key) - size AS freed
+          FROM responses
+        )
+        WHERE freed < ?
+      )
+      ''',
+      (total - self.max_bytes,)
+    )
+
+  async def get(self, endpoint: str, params: Mapping) -> Optional[bytes]:
+    key = self.make_key(endpoint, params)
+    body = await asyncio.to_thread(self.__get, key)
+
+    if body is None:
+      self.misses += 1
+    else:
+      self.hits += 1
+    return body
+
+  async def set(self, endpoint: str, params: Mapping, body: bytes):
+    ttl = self.get_ttl(endpoint)
+    if ttl <= 0:
+      return
+
+    key = self.make_key(endpoint, params)
+    await asyncio.to_thread(self.__set, key, body, ttl)
+
+  async def clear(self):
+    def clear():
+      with self.__lock:
+        self.__connect().execute('DELETE FROM responses')
+
+    await asyncio.to_thread(clear)
+
+  def close(self):
+    """
+    Close the database connection of the current process. A new one is
+    opened on the next access.
+    """
+    with self.__lock:
+      if self.__conn is not None:
+        self.__conn.close()
+      self.__conn = None
+      self.__pid = None
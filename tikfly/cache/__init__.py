@@ -0,0 +1,3 @@
+from .BaseCache import BaseCache
+from .MemoryCache import MemoryCache
+from .SqliteCache import SqliteCache
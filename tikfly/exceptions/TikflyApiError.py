@@ -1,5 +1,14 @@
 class TikflyAPIError(Exception):
-  def __init__(self, message, status_code=None, response=None):
+  def __init__(
+    self,
+    message,
+    status_code=None,
+    response=None,
+    retryable=False,
+    retry_after=None
+  ):
     super().__init__(message)
     self.status_code = status_code
     self.response = response
+    self.retryable = retryable
+    self.retry_after = retry_after
@@ -1,40 +1,41 @@
+from typing import Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
-  id: str
-  title: str
-  desc: str
-  coverLarger: str
-  coverMedium: str
-  coverThumb: str
-  profileLarger: str
-  profileMedium: str
-  profileThumb: str
+  id: Optional[str] = None
+  title: Optional[str] = None
+  desc: Optional[str] = None
+  coverLarger: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  profileLarger: Optional[str] = None
+  profileMedium: Optional[str] = None
+  profileThumb: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeAnnouncement:
-  title: str
-  body: str
+  title: Optional[str] = None
+  body: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeStats:
-  videoCount: int
-  viewCount: int
+  videoCount: Optional[int] = None
+  viewCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeStatsV2:
-  videoCount: str
-  viewCount: str
+  videoCount: Optional[str] = None
+  viewCount: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeInfo:
-  challenge: Challenge
-  challengeAnnouncement: ChallengeAnnouncement
-  stats: ChallengeStats
-  statsV2: ChallengeStatsV2
+  challenge: Optional[Challenge] = None
+  challengeAnnouncement: Optional[ChallengeAnnouncement] = None
+  stats: Optional[ChallengeStats] = None
+  statsV2: Optional[ChallengeStatsV2] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeInfoResponse:
-  challengeInfo: ChallengeInfo
-  statusCode: int
\ No newline at end of file
+  challengeInfo: Optional[ChallengeInfo] = None
+  statusCode: Optional[int] = None
\ No newline at end of file
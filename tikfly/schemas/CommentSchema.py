@@ -1,76 +1,76 @@
 from dataclasses import dataclass
 from typing import List, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class AvatarThumb:
-  uri: str
-  url_list: List[str]
-  url_prefix: Optional[str]
+  uri: Optional[str] = None
+  url_list: Optional[List[str]] = None
+  url_prefix: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class CommentUser:
-  uid: str
-  sec_uid: str
-  unique_id: str
-  nickname: str
-  avatar_thumb: AvatarThumb
-  custom_verify: str
-  enterprise_verify_reason: str
-  account_labels: Optional[Any]
-  ad_cover_url: Optional[Any]
-  advance_feature_item_order: Optional[Any]
-  advanced_feature_info: Optional[Any]
-  bold_fields: Optional[Any]
-  can_message_follow_status_list: Optional[Any]
-  can_set_geofencing: Optional[Any]
-  cha_list: Optional[Any]
-  cover_url: Optional[Any]
-  events: Optional[Any]
-  followers_detail: Optional[Any]
-  geofencing: Optional[Any]
-  homepage_bottom_toast: Optional[Any]
-  item_list: Optional[Any]
-  mutual_relation_avatars: Optional[Any]
-  need_points: Optional[Any]
-  platform_sync_info: Optional[Any]
-  relative_users: Optional[Any]
-  search_highlight: Optional[Any]
-  shield_edit_field_info: Optional[Any]
-  type_label: Optional[Any]
-  user_profile_guide: Optional[Any]
-  user_tags: Optional[Any]
-  white_cover_url: Optional[Any]
+  uid: Optional[str] = None
+  sec_uid: Optional[str] = None
+  unique_id: Optional[str] = None
+  nickname: Optional[str] = None
+  avatar_thumb: Optional[AvatarThumb] = None
+  custom_verify: Optional[str] = None
+  enterprise_verify_reason: Optional[str] = None
+  account_labels: Optional[Any] = None
+  ad_cover_url: Optional[Any] = None
+  advance_feature_item_order: Optional[Any] = None
+  advanced_feature_info: Optional[Any] = None
+  bold_fields: Optional[Any] = None
+  can_message_follow_status_list: Optional[Any] = None
+  can_set_geofencing: Optional[Any] = None
+  cha_list: Optional[Any] = None
+  cover_url: Optional[Any] = None
+  events: Optional[Any] = None
+  followers_detail: Optional[Any] = None
+  geofencing: Optional[Any] = None
+  homepage_bottom_toast: Optional[Any] = None
+  item_list: Optional[Any] = None
+  mutual_relation_avatars: Optional[Any] = None
+  need_points: Optional[Any] = None
+  platform_sync_info: Optional[Any] = None
+  relative_users: Optional[Any] = None
+  search_highlight: Optional[Any] = None
+  shield_edit_field_info: Optional[Any] = None
+  type_label: Optional[Any] = None
+  user_profile_guide: Optional[Any] = None
+  user_tags: Optional[Any] = None
+  white_cover_url: Optional[Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class SortExtraScore:
-  reply_score: float
-  show_more_score: float
+  reply_score: Optional[float] = None
+  show_more_score: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
-  cid: str
-  aweme_id: str
-  text: str
-  comment_language: str
-  create_time: int
-  digg_count: int
-  collect_stat: int
-  reply_comment_total: int
-  reply_id: str
-  reply_to_reply_id: str
-  allow_download_photo: bool
-  author_pin: bool
-  is_author_digged: bool
-  is_comment_translatable: bool
-  is_high_purchase_intent: bool
-  status: int
-  stick_position: int
-  sort_extra_score: SortExtraScore
-  user: CommentUser
+  cid: Optional[str] = None
+  aweme_id: Optional[str] = None
+  text: Optional[str] = None
+  comment_language: Optional[str] = None
+  create_time: Optional[int] = None
+  digg_count: Optional[int] = None
+  collect_stat: Optional[int] = None
+  reply_comment_total: Optional[int] = None
+  reply_id: Optional[str] = None
+  reply_to_reply_id: Optional[str] = None
+  allow_download_photo: Optional[bool] = None
+  author_pin: Optional[bool] = None
+  is_author_digged: Optional[bool] = None
+  is_comment_translatable: Optional[bool] = None
+  is_high_purchase_intent: Optional[bool] = None
+  status: Optional[int] = None
+  stick_position: Optional[int] = None
+  sort_extra_score: Optional[SortExtraScore] = None
+  user: Optional[CommentUser] = None
 
-@dataclass
+@dataclass(slots=True)
 class CommentListResponse:
-  hasMore: int
-  cursor: int
-  total: int
-  comments: List[Comment]
\ No newline at end of file
+  hasMore: Optional[int] = None
+  cursor: Optional[int] = None
+  total: Optional[int] = None
+  comments: Optional[List[Comment]] = None
\ No newline at end of file
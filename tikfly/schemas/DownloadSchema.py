@@ -1,10 +1,11 @@
+from typing import Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class DownloadVideoResponse:
-  play: str
-  play_watermark: str
+  play: Optional[str] = None
+  play_watermark: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DownloadMusicResponse:
-  play: str
\ No newline at end of file
+  play: Optional[str] = None
\ No newline at end of file
@@ -1,35 +1,35 @@
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class EffectIconUrl:
-  uri: str
-  url_list: List[str]
-  url_prefix: Optional[str]
+  uri: Optional[str] = None
+  url_list: Optional[List[str]] = None
+  url_prefix: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class StickerInfo:
-  id: str
-  effect_id: str
-  name: str
-  desc: str
-  effect_source: int
-  publish_time: int
-  owner_id: str
-  owner_nickname: str
-  owner_verified_type: int
-  sec_uid: str
-  is_top_effect_designer: bool
-  user_count: int
-  vv_count: int
-  tags: List[str]
-  children: List[Any]
-  extra: str
-  icon_url: EffectIconUrl
-  attributions: Optional[Any]
-  linked_anchors: Optional[Any]
+  id: Optional[str] = None
+  effect_id: Optional[str] = None
+  name: Optional[str] = None
+  desc: Optional[str] = None
+  effect_source: Optional[int] = None
+  publish_time: Optional[int] = None
+  owner_id: Optional[str] = None
+  owner_nickname: Optional[str] = None
+  owner_verified_type: Optional[int] = None
+  sec_uid: Optional[str] = None
+  is_top_effect_designer: Optional[bool] = None
+  user_count: Optional[int] = None
+  vv_count: Optional[int] = None
+  tags: Optional[List[str]] = None
+  children: Optional[List[Any]] = None
+  extra: Optional[str] = None
+  icon_url: Optional[EffectIconUrl] = None
+  attributions: Optional[Any] = None
+  linked_anchors: Optional[Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class EffectInfoResponse:
-  sticker_infos: List[StickerInfo]
+  sticker_infos: Optional[List[StickerInfo]] = None
 
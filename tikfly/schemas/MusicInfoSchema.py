@@ -1,52 +1,52 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class MusicArtist:
-  id: str
-  uniqueId: str
-  nickname: str
-  secUid: str
-  signature: str
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  ftc: bool
-  openFavorite: bool
-  privateAccount: bool
-  secret: bool
+  id: Optional[str] = None
+  uniqueId: Optional[str] = None
+  nickname: Optional[str] = None
+  secUid: Optional[str] = None
+  signature: Optional[str] = None
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  ftc: Optional[bool] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  secret: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class Music:
-  id: str
-  title: str
-  authorName: str
-  album: str
-  coverLarge: str
-  coverMedium: str
-  coverThumb: str
-  duration: int
-  playUrl: str
-  original: bool
-  private: bool
-  isCopyrighted: bool
-  tt2dsp: Dict[str, Any]
+  id: Optional[str] = None
+  title: Optional[str] = None
+  authorName: Optional[str] = None
+  album: Optional[str] = None
+  coverLarge: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  duration: Optional[int] = None
+  playUrl: Optional[str] = None
+  original: Optional[bool] = None
+  private: Optional[bool] = None
+  isCopyrighted: Optional[bool] = None
+  tt2dsp: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class MusicStats:
-  videoCount: int
+  videoCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class MusicInfo:
-  artist: MusicArtist
-  artists: List[MusicArtist]
-  music: Music
-  stats: MusicStats
+  artist: Optional[MusicArtist] = None
+  artists: Optional[List[MusicArtist]] = None
+  music: Optional[Music] = None
+  stats: Optional[MusicStats] = None
 
-@dataclass
+@dataclass(slots=True)
 class MusicInfoData:
-  musicInfo: MusicInfo
+  musicInfo: Optional[MusicInfo] = None
 
-@dataclass
+@dataclass(slots=True)
 class MusicInfoResponse:
-  data: MusicInfoData
+  data: Optional[MusicInfoData] = None
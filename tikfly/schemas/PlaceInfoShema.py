@@ -1,55 +1,55 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class PoiPhoneInfo:
-  exist: bool
+  exist: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class PoiPictureAlbum:
-  totalCount: int
+  totalCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class PoiDetailTag:
-  content: str
-  tagType: int
+  content: Optional[str] = None
+  tagType: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Poi:
-  id: str
-  name: str
-  address: str
-  category: str
-  type: int
-  typeCode: str
-  city: str
-  cityCode: str
-  province: str
-  country: str
-  countryCode: str
-  fatherPoiId: str
-  fatherPoiName: str
-  ttTypeCode: str
-  ttTypeNameTiny: str
-  ttTypeNameMedium: str
-  ttTypeNameSuper: str
-  indexEnabled: bool
-  isClaimed: bool
-  isCollected: bool
-  phoneInfo: PoiPhoneInfo
-  pictureAlbum: PoiPictureAlbum
-  poiDetailTags: List[PoiDetailTag]
-  allLevelGeoPoiInfo: Dict[str, Any]
+  id: Optional[str] = None
+  name: Optional[str] = None
+  address: Optional[str] = None
+  category: Optional[str] = None
+  type: Optional[int] = None
+  typeCode: Optional[str] = None
+  city: Optional[str] = None
+  cityCode: Optional[str] = None
+  province: Optional[str] = None
+  country: Optional[str] = None
+  countryCode: Optional[str] = None
+  fatherPoiId: Optional[str] = None
+  fatherPoiName: Optional[str] = None
+  ttTypeCode: Optional[str] = None
+  ttTypeNameTiny: Optional[str] = None
+  ttTypeNameMedium: Optional[str] = None
+  ttTypeNameSuper: Optional[str] = None
+  indexEnabled: Optional[bool] = None
+  isClaimed: Optional[bool] = None
+  isCollected: Optional[bool] = None
+  phoneInfo: Optional[PoiPhoneInfo] = None
+  pictureAlbum: Optional[PoiPictureAlbum] = None
+  poiDetailTags: Optional[List[PoiDetailTag]] = None
+  allLevelGeoPoiInfo: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class PoiStats:
-  videoCount: int
+  videoCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class PoiInfo:
-  poi: Poi
-  stats: PoiStats
+  poi: Optional[Poi] = None
+  stats: Optional[PoiStats] = None
 
-@dataclass
+@dataclass(slots=True)
 class PlaceInfoResponse:
-  poiInfo: PoiInfo
\ No newline at end of file
+  poiInfo: Optional[PoiInfo] = None
\ No newline at end of file
@@ -1,143 +1,144 @@
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 from .UserInfoSchema import UserStats, UserStatsV2
 
-@dataclass
+@dataclass(slots=True)
 class Video:
-  id: str
-  height: int
-  width: int
-  duration: int
-  ratio: str
-  cover: str
-  originCover: str
-  dynamicCover: str
-  playAddr: str
-  downloadAddr: str
-  reflowCover: str
-  bitrate: int
-  encodedType: str
-  format: str
-  videoQuality: str
-  encodeUserTag: str
-  codecType: str
-  size: str
+  id: Optional[str] = None
+  height: Optional[int] = None
+  width: Optional[int] = None
+  duration: Optional[int] = None
+  ratio: Optional[str] = None
+  cover: Optional[str] = None
+  originCover: Optional[str] = None
+  dynamicCover: Optional[str] = None
+  playAddr: Optional[str] = None
+  downloadAddr: Optional[str] = None
+  reflowCover: Optional[str] = None
+  bitrate: Optional[int] = None
+  encodedType: Optional[str] = None
+  format: Optional[str] = None
+  videoQuality: Optional[str] = None
+  encodeUserTag: Optional[str] = None
+  codecType: Optional[str] = None
+  size: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Author:
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  commentSetting: int
-  downloadSetting: int
-  duetSetting: int
-  ftc: bool
-  id: str
-  isADVirtual: bool
-  nickname: str
-  openFavorite: bool
-  privateAccount: bool
-  secUid: str
-  secret: bool
-  signature: str
-  stitchSetting: int
-  ttSeller: bool
-  uniqueId: str
-  verified: bool
-  createTime: int
-  uniqueIdModifyTime: int
-  nickNameModifyTime: int
-  UserStoryStatus: int
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  commentSetting: Optional[int] = None
+  downloadSetting: Optional[int] = None
+  duetSetting: Optional[int] = None
+  ftc: Optional[bool] = None
+  id: Optional[str] = None
+  isADVirtual: Optional[bool] = None
+  nickname: Optional[str] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  secUid: Optional[str] = None
+  secret: Optional[bool] = None
+  signature: Optional[str] = None
+  stitchSetting: Optional[int] = None
+  ttSeller: Optional[bool] = None
+  uniqueId: Optional[str] = None
+  verified: Optional[bool] = None
+  createTime: Optional[int] = None
+  uniqueIdModifyTime: Optional[int] = None
+  nickNameModifyTime: Optional[int] = None
+  UserStoryStatus: Optional[int] = None
 
+@dataclass(slots=True)
 class Music:
-  album: str
-  authorName: str
-  coverLarge: str
-  coverMedium: str
-  coverThumb: str
-  duration: int
-  id: str
-  isCopyrighted: bool
-  original: bool
-  playUrl: str
-  private: bool
-  title: str
-  tt2dsp: dict
+  album: Optional[str] = None
+  authorName: Optional[str] = None
+  coverLarge: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  duration: Optional[int] = None
+  id: Optional[str] = None
+  isCopyrighted: Optional[bool] = None
+  original: Optional[bool] = None
+  playUrl: Optional[str] = None
+  private: Optional[bool] = None
+  title: Optional[str] = None
+  tt2dsp: Optional[dict] = None
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
-  coverLarger: str
-  coverMedium: str
-  coverThumb: str
-  desc: str
-  id: str
-  profileLarger: str
-  profileMedium: str
-  profileThumb: str
-  title: str
+  coverLarger: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  desc: Optional[str] = None
+  id: Optional[str] = None
+  profileLarger: Optional[str] = None
+  profileMedium: Optional[str] = None
+  profileThumb: Optional[str] = None
+  title: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemStats:
-  collectCount: int
-  commentCount: int
-  diggCount: int
-  playCount: int
-  shareCount: int
+  collectCount: Optional[int] = None
+  commentCount: Optional[int] = None
+  diggCount: Optional[int] = None
+  playCount: Optional[int] = None
+  shareCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemStatsV2:
-  collectCount: str
-  commentCount: str
-  diggCount: str
-  playCount: str
-  repostCount: str
-  shareCount: str
+  collectCount: Optional[str] = None
+  commentCount: Optional[str] = None
+  diggCount: Optional[str] = None
+  playCount: Optional[str] = None
+  repostCount: Optional[str] = None
+  shareCount: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemStruct:
-  id: str
-  desc: str
-  createTime: str
-  scheduleTime: int
-  video: Video
-  author: Author
-  music: Music
-  challenges: List[Challenge]
-  stats: ItemStats
-  statsV2: ItemStatsV2
+  id: Optional[str] = None
+  desc: Optional[str] = None
+  createTime: Optional[str] = None
+  scheduleTime: Optional[int] = None
+  video: Optional[Video] = None
+  author: Optional[Author] = None
+  music: Optional[Music] = None
+  challenges: Optional[List[Challenge]] = None
+  stats: Optional[ItemStats] = None
+  statsV2: Optional[ItemStatsV2] = None
 
-  originalItem: bool
-  officalItem: bool
-  secret: bool
-  forFriend: bool
+  originalItem: Optional[bool] = None
+  officalItem: Optional[bool] = None
+  secret: Optional[bool] = None
+  forFriend: Optional[bool] = None
 
-  authorStats: UserStats
-  authorStatsV2: UserStatsV2
+  authorStats: Optional[UserStats] = None
+  authorStatsV2: Optional[UserStatsV2] = None
 
-  itemCommentStatus: int
-  takeDown: int
-  privateItem: bool
-  duetEnabled: bool
-  stitchEnabled: bool
-  isAd: bool
-  shareEnabled: bool
-  duetDisplay: int
-  stitchDisplay: int
-  indexEnabled: bool
-  adLabelVersion: int
+  itemCommentStatus: Optional[int] = None
+  takeDown: Optional[int] = None
+  privateItem: Optional[bool] = None
+  duetEnabled: Optional[bool] = None
+  stitchEnabled: Optional[bool] = None
+  isAd: Optional[bool] = None
+  shareEnabled: Optional[bool] = None
+  duetDisplay: Optional[int] = None
+  stitchDisplay: Optional[int] = None
+  indexEnabled: Optional[bool] = None
+  adLabelVersion: Optional[int] = None
 
-  locationCreated: str
-  BAInfo: str
-  suggestedWords: List[str]
-  CategoryType: int
-  textLanguage: str
-  textTranslatable: bool
+  locationCreated: Optional[str] = None
+  BAInfo: Optional[str] = None
+  suggestedWords: Optional[List[str]] = None
+  CategoryType: Optional[int] = None
+  textLanguage: Optional[str] = None
+  textTranslatable: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemInfo:
-  itemStruct: ItemStruct
+  itemStruct: Optional[ItemStruct] = None
 
-@dataclass
+@dataclass(slots=True)
 class PostDetailResponse:
-  itemInfo: ItemInfo
-  statusCode: int
\ No newline at end of file
+  itemInfo: Optional[ItemInfo] = None
+  statusCode: Optional[int] = None
\ No newline at end of file
@@ -0,0 +1,111 @@
+import typing
+import dataclasses
+from typing import Any, Callable, Dict
+
+Decoder = Callable[[Any], Any]
+
+_decoders: Dict[type, Decoder] = {}
+
+def _identity(value: Any) -> Any:
+  return value
+
+def _build_converter(tp: Any) -> Decoder:
+  """
+  Build the converter of a field type. Dataclasses are decoded with their
+  own decoder, lists element by element, and every other type (str, int,
+  Dict, Any, ...) is kept as decoded from JSON.
+  """
+  origin = typing.get_origin(tp)
+
+  if origin is typing.Union:
+    args = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+    if len(args) == 1:
+      return _build_converter(args[0])
+    return _identity
+
+  if origin in (list, typing.List):
+    args = typing.get_args(tp)
+    item = _build_converter(args[0]) if args else _identity
+    if item is _identity:
+      return _identity
+
+    def convert_list(value):
+      if isinstance(value, list):
+        return [item(v) for v in value]
+      return value
+
+    return convert_list
+
+  if dataclasses.is_dataclass(tp):
+    # Resolved at call time so self-referencing schemas do not recurse here.
+    def convert_schema(value):
+      return get_decoder(tp)(value)
+
+    return convert_schema
+
+  return _identity
+
+def _compile(schema: type) -> Decoder:
+  """
+  Generate the decoder function of a schema dataclass.
+
+  The generated function reads every declared field with `dict.get`, so
+  missing fields become None and undeclared fields are ignored, then calls
+  the dataclass constructor positionally.
+  """
+  hints = typing.get_type_hints(schema)
+  fields = dataclasses.fields(schema)
+
+  namespace: Dict[str, Any] = {'schema': schema}
+  args = []
+
+  for index, field in enumerate(fields):
+    converter = _build_converter(hints.get(field.name, Any))
+    if converter is _identity:
+      args.append(f'get({field.name!r})')
+    else:
+      namespace[f'convert_{index}'] = converter
+      args.append(f'convert_{index}(get({field.name!r}))')
+
+  source = (
+    'def decode(data):\n'
+    '  if not isinstance(data, dict):\n'
+    '    return data\n'
+    '  get = data.get\n'
+    f'  return schema({", ".join(args)})\n'
+  )
+  exec(source, namespace)
+  return namespace['decode']
+
+def get_decoder(schema: type) -> Decoder:
+  """
+  Get the decoder of a schema dataclass, generating it on first use.
+
+  Args:
+    schema (type): Schema dataclass, e.g. UserPostResponse.
+
+  Returns:
+    Callable[[Any], Any]: A function turning a decoded JSON object into
+    an instance of the schema.
+  """
+  decoder = _decoders.get(schema)
+  if decoder is None:
+    decoder = _decoders[schema] = _compile(schema)
+  return decoder
+
+def decode(schema: type, data: Any) -> Any:
+  """
+  Decode a JSON object into an instance of a schema dataclass.
+
+  Nested objects and lists of objects are decoded into their declared
+  schemas. Fields missing from the data are set to None and fields not
+  declared in the schema are ignored.
+
+  Args:
+    schema (type): Schema dataclass, e.g. UserPostResponse.
+    data (Any): Decoded JSON object.
+
+  Returns:
+    Any: An instance of the schema, or data unchanged if it is not an object.
+  """
+  return get_decoder(schema)(data)
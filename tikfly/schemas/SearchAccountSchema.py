@@ -1,71 +1,71 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class AvatarThumb:
-  uri: str
-  url_list: List[str]
-  width: int
-  height: int
-  url_prefix: Optional[str]
+  uri: Optional[str] = None
+  url_list: Optional[List[str]] = None
+  width: Optional[int] = None
+  height: Optional[int] = None
+  url_prefix: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserInfo:
-  uid: str
-  nickname: str
-  signature: str
-  avatar_thumb: AvatarThumb
-  follower_count: int
-  total_favorited: int
-  custom_verify: str
-  unique_id: str
-  sec_uid: str
-  room_id: int
-  room_id_str: str
-  enterprise_verify_reason: Optional[str]
-  followers_detail: Optional[dict]
-  platform_sync_info: Optional[dict]
-  geofencing: Optional[dict]
-  cover_url: Optional[str]
-  item_list: Optional[list]
-  type_label: Optional[str]
-  ad_cover_url: Optional[str]
-  relative_users: Optional[list]
-  cha_list: Optional[list]
-  need_points: Optional[int]
-  homepage_bottom_toast: Optional[dict]
-  can_set_geofencing: Optional[bool]
-  white_cover_url: Optional[str]
-  user_tags: Optional[list]
-  bold_fields: Optional[list]
-  search_highlight: Optional[dict]
-  mutual_relation_avatars: Optional[list]
-  events: Optional[list]
-  advance_feature_item_order: Optional[list]
-  advanced_feature_info: Optional[dict]
-  user_profile_guide: Optional[dict]
-  shield_edit_field_info: Optional[dict]
-  can_message_follow_status_list: Optional[list]
-  account_labels: Optional[list]
+  uid: Optional[str] = None
+  nickname: Optional[str] = None
+  signature: Optional[str] = None
+  avatar_thumb: Optional[AvatarThumb] = None
+  follower_count: Optional[int] = None
+  total_favorited: Optional[int] = None
+  custom_verify: Optional[str] = None
+  unique_id: Optional[str] = None
+  sec_uid: Optional[str] = None
+  room_id: Optional[int] = None
+  room_id_str: Optional[str] = None
+  enterprise_verify_reason: Optional[str] = None
+  followers_detail: Optional[dict] = None
+  platform_sync_info: Optional[dict] = None
+  geofencing: Optional[dict] = None
+  cover_url: Optional[str] = None
+  item_list: Optional[list] = None
+  type_label: Optional[str] = None
+  ad_cover_url: Optional[str] = None
+  relative_users: Optional[list] = None
+  cha_list: Optional[list] = None
+  need_points: Optional[int] = None
+  homepage_bottom_toast: Optional[dict] = None
+  can_set_geofencing: Optional[bool] = None
+  white_cover_url: Optional[str] = None
+  user_tags: Optional[list] = None
+  bold_fields: Optional[list] = None
+  search_highlight: Optional[dict] = None
+  mutual_relation_avatars: Optional[list] = None
+  events: Optional[list] = None
+  advance_feature_item_order: Optional[list] = None
+  advanced_feature_info: Optional[dict] = None
+  user_profile_guide: Optional[dict] = None
+  shield_edit_field_info: Optional[dict] = None
+  can_message_follow_status_list: Optional[list] = None
+  account_labels: Optional[list] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserListItem:
-  user_info: UserInfo
-  position: Optional[int]
-  uniqid_position: Optional[int]
-  effects: Optional[list]
-  musics: Optional[list]
-  items: Optional[list]
-  mix_list: Optional[list]
-  challenges: Optional[list]
+  user_info: Optional[UserInfo] = None
+  position: Optional[int] = None
+  uniqid_position: Optional[int] = None
+  effects: Optional[list] = None
+  musics: Optional[list] = None
+  items: Optional[list] = None
+  mix_list: Optional[list] = None
+  challenges: Optional[list] = None
 
-@dataclass
+@dataclass(slots=True)
 class LogPB:
-  impr_id: str
+  impr_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchAccountResponse:
-  hasMore: int
-  cursor: int
-  log_pb: LogPB
-  user_list: List[UserListItem]
\ No newline at end of file
+  hasMore: Optional[int] = None
+  cursor: Optional[int] = None
+  log_pb: Optional[LogPB] = None
+  user_list: Optional[List[UserListItem]] = None
\ No newline at end of file
@@ -1,74 +1,74 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Author:
-  id: str
-  unique_id: str
-  nickname: str
-  avatar_thumb: Optional[str]
-  avatar_medium: Optional[str]
-  avatar_larger: Optional[str]
-  verified: bool
-  signature: Optional[str]
-  sec_uid: Optional[str]
+  id: Optional[str] = None
+  unique_id: Optional[str] = None
+  nickname: Optional[str] = None
+  avatar_thumb: Optional[str] = None
+  avatar_medium: Optional[str] = None
+  avatar_larger: Optional[str] = None
+  verified: Optional[bool] = None
+  signature: Optional[str] = None
+  sec_uid: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuthorStats:
-  follower_count: int
-  following_count: int
-  heart_count: int
-  video_count: int
+  follower_count: Optional[int] = None
+  following_count: Optional[int] = None
+  heart_count: Optional[int] = None
+  video_count: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Music:
-  id: str
-  title: str
-  author_name: str
-  duration: int
-  play_url: str
-  cover_thumb: Optional[str]
+  id: Optional[str] = None
+  title: Optional[str] = None
+  author_name: Optional[str] = None
+  duration: Optional[int] = None
+  play_url: Optional[str] = None
+  cover_thumb: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Video:
-  id: str
-  duration: int
-  width: int
-  height: int
-  play_addr: str
-  download_addr: Optional[str]
-  cover: Optional[str]
+  id: Optional[str] = None
+  duration: Optional[int] = None
+  width: Optional[int] = None
+  height: Optional[int] = None
+  play_addr: Optional[str] = None
+  download_addr: Optional[str] = None
+  cover: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class VideoStats:
-  play_count: int
-  digg_count: int
-  comment_count: int
-  share_count: int
+  play_count: Optional[int] = None
+  digg_count: Optional[int] = None
+  comment_count: Optional[int] = None
+  share_count: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class VideoItem:
-  id: str
-  desc: str
-  create_time: int
-  author: Author
-  author_stats: AuthorStats
-  music: Optional[Music]
-  video: Video
-  stats: VideoStats
+  id: Optional[str] = None
+  desc: Optional[str] = None
+  create_time: Optional[int] = None
+  author: Optional[Author] = None
+  author_stats: Optional[AuthorStats] = None
+  music: Optional[Music] = None
+  video: Optional[Video] = None
+  stats: Optional[VideoStats] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchItem:
-  type: int
-  item: VideoItem
+  type: Optional[int] = None
+  item: Optional[VideoItem] = None
 
-@dataclass
+@dataclass(slots=True)
 class LogPB:
-  impr_id: str
+  impr_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchGeneralResponse:
-  has_more: bool
-  cursor: int
-  log_pb: LogPB
-  items: List[SearchItem]
\ No newline at end of file
+  has_more: Optional[bool] = None
+  cursor: Optional[int] = None
+  log_pb: Optional[LogPB] = None
+  items: Optional[List[SearchItem]] = None
\ No newline at end of file
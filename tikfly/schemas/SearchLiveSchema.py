@@ -1,27 +1,27 @@
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class RoomInfo:
-  has_commerce_goods: bool
-  is_battle: bool
+  has_commerce_goods: Optional[bool] = None
+  is_battle: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class LiveInfo:
-  raw_data: str
-  room_info: RoomInfo
+  raw_data: Optional[str] = None
+  room_info: Optional[RoomInfo] = None
 
-@dataclass
+@dataclass(slots=True)
 class LiveDataItem:
-  live_info: LiveInfo
+  live_info: Optional[LiveInfo] = None
 
-@dataclass
+@dataclass(slots=True)
 class LogPB:
-  impr_id: str
+  impr_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchLiveResponse:
-  hasMore: int
-  cursor: int
-  log_pb: LogPB
-  data: List[LiveDataItem]
\ No newline at end of file
+  hasMore: Optional[int] = None
+  cursor: Optional[int] = None
+  log_pb: Optional[LogPB] = None
+  data: Optional[List[LiveDataItem]] = None
\ No newline at end of file
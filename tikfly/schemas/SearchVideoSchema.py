@@ -1,90 +1,90 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Author:
-  id: str
-  unique_id: str
-  nickname: str
-  sec_uid: str
-  avatar_thumb: str
-  avatar_medium: str
-  avatar_larger: str
-  verified: bool
+  id: Optional[str] = None
+  unique_id: Optional[str] = None
+  nickname: Optional[str] = None
+  sec_uid: Optional[str] = None
+  avatar_thumb: Optional[str] = None
+  avatar_medium: Optional[str] = None
+  avatar_larger: Optional[str] = None
+  verified: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuthorStats:
-  follower_count: int
-  following_count: int
-  heart_count: int
-  video_count: int
+  follower_count: Optional[int] = None
+  following_count: Optional[int] = None
+  heart_count: Optional[int] = None
+  video_count: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
-  id: str
-  title: str
-  desc: str
+  id: Optional[str] = None
+  title: Optional[str] = None
+  desc: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Music:
-  id: str
-  title: str
-  author_name: str
-  duration: int
-  play_url: str
-  cover_thumb: str
-  cover_medium: str
-  cover_large: str
-  original: bool
+  id: Optional[str] = None
+  title: Optional[str] = None
+  author_name: Optional[str] = None
+  duration: Optional[int] = None
+  play_url: Optional[str] = None
+  cover_thumb: Optional[str] = None
+  cover_medium: Optional[str] = None
+  cover_large: Optional[str] = None
+  original: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class Video:
-  id: str
-  duration: int
-  width: int
-  height: int
-  play_addr: str
-  download_addr: str
-  cover: str
+  id: Optional[str] = None
+  duration: Optional[int] = None
+  width: Optional[int] = None
+  height: Optional[int] = None
+  play_addr: Optional[str] = None
+  download_addr: Optional[str] = None
+  cover: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemStats:
-  digg_count: int
-  comment_count: int
-  share_count: int
-  play_count: int
-  collect_count: int
+  digg_count: Optional[int] = None
+  comment_count: Optional[int] = None
+  share_count: Optional[int] = None
+  play_count: Optional[int] = None
+  collect_count: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class TextExtra:
-  start: int
-  end: int
-  type: int
-  user_id: Optional[str]
-  user_unique_id: Optional[str]
-  hashtag_name: Optional[str]
+  start: Optional[int] = None
+  end: Optional[int] = None
+  type: Optional[int] = None
+  user_id: Optional[str] = None
+  user_unique_id: Optional[str] = None
+  hashtag_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchItem:
-  id: str
-  desc: str
-  create_time: int
-  author: Author
-  author_stats: AuthorStats
-  challenges: List[Challenge]
-  text_extra: List[TextExtra]
-  music: Optional[Music]
-  video: Optional[Video]
-  stats: ItemStats
-  is_ad: bool
+  id: Optional[str] = None
+  desc: Optional[str] = None
+  create_time: Optional[int] = None
+  author: Optional[Author] = None
+  author_stats: Optional[AuthorStats] = None
+  challenges: Optional[List[Challenge]] = None
+  text_extra: Optional[List[TextExtra]] = None
+  music: Optional[Music] = None
+  video: Optional[Video] = None
+  stats: Optional[ItemStats] = None
+  is_ad: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class LogPB:
-  impr_id: str
+  impr_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchVideoResponse:
-  has_more: bool
-  cursor: int
-  log_pb: LogPB
-  item_list: List[SearchItem]
+  has_more: Optional[bool] = None
+  cursor: Optional[int] = None
+  log_pb: Optional[LogPB] = None
+  item_list: Optional[List[SearchItem]] = None
@@ -1,38 +1,38 @@
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 from .UserInfoSchema import UserStats, UserStatsV2
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  commentSetting: int
-  downloadSetting: int
-  duetSetting: int
-  ftc: bool
-  id: str
-  isADVirtual: bool
-  nickname: str
-  openFavorite: bool
-  privateAccount: bool
-  secUid: str
-  secret: bool
-  signature: str
-  stitchSetting: int
-  ttSeller: bool
-  uniqueId: str
-  verified: bool
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  commentSetting: Optional[int] = None
+  downloadSetting: Optional[int] = None
+  duetSetting: Optional[int] = None
+  ftc: Optional[bool] = None
+  id: Optional[str] = None
+  isADVirtual: Optional[bool] = None
+  nickname: Optional[str] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  secUid: Optional[str] = None
+  secret: Optional[bool] = None
+  signature: Optional[str] = None
+  stitchSetting: Optional[int] = None
+  ttSeller: Optional[bool] = None
+  uniqueId: Optional[str] = None
+  verified: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserListItem:
-  stats: UserStats
-  statsV2: UserStatsV2
-  user: UserProfile
+  stats: Optional[UserStats] = None
+  statsV2: Optional[UserStatsV2] = None
+  user: Optional[UserProfile] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserFollowerResponse:
-  hasMore: bool
-  minCursor: int
-  total: int
-  userList: List[UserListItem]
+  hasMore: Optional[bool] = None
+  minCursor: Optional[int] = None
+  total: Optional[int] = None
+  userList: Optional[List[UserListItem]] = None
@@ -1,74 +1,74 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
-  diggCount: int
-  followerCount: int
-  followingCount: int
-  friendCount: int
-  heart: int
-  heartCount: int
-  videoCount: int
+  diggCount: Optional[int] = None
+  followerCount: Optional[int] = None
+  followingCount: Optional[int] = None
+  friendCount: Optional[int] = None
+  heart: Optional[int] = None
+  heartCount: Optional[int] = None
+  videoCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserStatsV2:
-  diggCount: str
-  followerCount: str
-  followingCount: str
-  friendCount: str
-  heart: str
-  heartCount: str
-  videoCount: str
+  diggCount: Optional[str] = None
+  followerCount: Optional[str] = None
+  followingCount: Optional[str] = None
+  friendCount: Optional[str] = None
+  heart: Optional[str] = None
+  heartCount: Optional[str] = None
+  videoCount: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class BioLink:
-  link: str
-  risk: int
+  link: Optional[str] = None
+  risk: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class CommerceUserInfo:
-  commerceUser: bool
-  downLoadLink: Dict[str, Any]
-  category: str
-  categoryButton: bool
+  commerceUser: Optional[bool] = None
+  downLoadLink: Optional[Dict[str, Any]] = None
+  category: Optional[str] = None
+  categoryButton: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class User:
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  bioLink: BioLink
-  canExpPlaylist: bool
-  commentSetting: int
-  commerceUserInfo: CommerceUserInfo
-  downloadSetting: int
-  duetSetting: int
-  followingVisibility: int
-  ftc: bool
-  id: str
-  isADVirtual: bool
-  isEmbedBanned: bool
-  nickNameModifyTime: int
-  nickname: str
-  openFavorite: bool
-  privateAccount: bool
-  profileEmbedPermission: int
-  profileTab: Dict[str, Any]
-  secUid: str
-  secret: bool
-  signature: str
-  stitchSetting: int
-  ttSeller: bool
-  uniqueId: str
-  verified: bool
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  bioLink: Optional[BioLink] = None
+  canExpPlaylist: Optional[bool] = None
+  commentSetting: Optional[int] = None
+  commerceUserInfo: Optional[CommerceUserInfo] = None
+  downloadSetting: Optional[int] = None
+  duetSetting: Optional[int] = None
+  followingVisibility: Optional[int] = None
+  ftc: Optional[bool] = None
+  id: Optional[str] = None
+  isADVirtual: Optional[bool] = None
+  isEmbedBanned: Optional[bool] = None
+  nickNameModifyTime: Optional[int] = None
+  nickname: Optional[str] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  profileEmbedPermission: Optional[int] = None
+  profileTab: Optional[Dict[str, Any]] = None
+  secUid: Optional[str] = None
+  secret: Optional[bool] = None
+  signature: Optional[str] = None
+  stitchSetting: Optional[int] = None
+  ttSeller: Optional[bool] = None
+  uniqueId: Optional[str] = None
+  verified: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserInfo:
-  user: User
-  stats: UserStats
+  user: Optional[User] = None
+  stats: Optional[UserStats] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserInfoResponse:
-  statusCode: int
-  userInfo: UserInfo
\ No newline at end of file
+  statusCode: Optional[int] = None
+  userInfo: Optional[UserInfo] = None
\ No newline at end of file
@@ -1,40 +1,40 @@
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Creator:
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  commentSetting: int
-  downloadSetting: int
-  duetSetting: int
-  ftc: bool
-  id: str
-  isADVirtual: bool
-  nickname: str
-  openFavorite: bool
-  privateAccount: bool
-  secUid: str
-  secret: bool
-  signature: str
-  stitchSetting: int
-  ttSeller: bool
-  uniqueId: str
-  verified: bool
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  commentSetting: Optional[int] = None
+  downloadSetting: Optional[int] = None
+  duetSetting: Optional[int] = None
+  ftc: Optional[bool] = None
+  id: Optional[str] = None
+  isADVirtual: Optional[bool] = None
+  nickname: Optional[str] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  secUid: Optional[str] = None
+  secret: Optional[bool] = None
+  signature: Optional[str] = None
+  stitchSetting: Optional[int] = None
+  ttSeller: Optional[bool] = None
+  uniqueId: Optional[str] = None
+  verified: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class PlayListItem:
-  cover: str
-  creator: Creator
-  id: str
-  mixId: str
-  mixName: str
-  name: str
-  videoCount: int
+  cover: Optional[str] = None
+  creator: Optional[Creator] = None
+  id: Optional[str] = None
+  mixId: Optional[str] = None
+  mixName: Optional[str] = None
+  name: Optional[str] = None
+  videoCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserPlaylistResponse:
-  cursor: str
-  hasMore: bool
-  playList: List[PlayListItem]
\ No newline at end of file
+  cursor: Optional[str] = None
+  hasMore: Optional[bool] = None
+  playList: Optional[List[PlayListItem]] = None
\ No newline at end of file
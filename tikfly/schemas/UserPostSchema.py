@@ -1,201 +1,202 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Author:
-  avatarLarger: str
-  avatarMedium: str
-  avatarThumb: str
-  commentSetting: int
-  downloadSetting: int
-  duetSetting: int
-  ftc: bool
-  id: str
-  isADVirtual: bool
-  nickname: str
-  openFavorite: bool
-  privateAccount: bool
-  secUid: str
-  secret: bool
-  signature: str
-  stitchSetting: int
-  ttSeller: bool
-  uniqueId: str
-  verified: bool
-  UserStoryStatus: int
+  avatarLarger: Optional[str] = None
+  avatarMedium: Optional[str] = None
+  avatarThumb: Optional[str] = None
+  commentSetting: Optional[int] = None
+  downloadSetting: Optional[int] = None
+  duetSetting: Optional[int] = None
+  ftc: Optional[bool] = None
+  id: Optional[str] = None
+  isADVirtual: Optional[bool] = None
+  nickname: Optional[str] = None
+  openFavorite: Optional[bool] = None
+  privateAccount: Optional[bool] = None
+  secUid: Optional[str] = None
+  secret: Optional[bool] = None
+  signature: Optional[str] = None
+  stitchSetting: Optional[int] = None
+  ttSeller: Optional[bool] = None
+  uniqueId: Optional[str] = None
+  verified: Optional[bool] = None
+  UserStoryStatus: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuthorStats:
-  diggCount: int
-  followerCount: int
-  followingCount: int
-  friendCount: int
-  heart: int
-  heartCount: int
-  videoCount: int
+  diggCount: Optional[int] = None
+  followerCount: Optional[int] = None
+  followingCount: Optional[int] = None
+  friendCount: Optional[int] = None
+  heart: Optional[int] = None
+  heartCount: Optional[int] = None
+  videoCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuthorStatsV2:
-  diggCount: str
-  followerCount: str
-  followingCount: str
-  friendCount: str
-  heart: str
-  heartCount: str
-  videoCount: str
+  diggCount: Optional[str] = None
+  followerCount: Optional[str] = None
+  followingCount: Optional[str] = None
+  friendCount: Optional[str] = None
+  heart: Optional[str] = None
+  heartCount: Optional[str] = None
+  videoCount: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
-  coverLarger: str
-  coverMedium: str
-  coverThumb: str
-  desc: str
-  id: str
-  profileLarger: str
-  profileMedium: str
-  profileThumb: str
-  title: str
+  coverLarger: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  desc: Optional[str] = None
+  id: Optional[str] = None
+  profileLarger: Optional[str] = None
+  profileMedium: Optional[str] = None
+  profileThumb: Optional[str] = None
+  title: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class TextExtra:
-  awemeId: str
-  end: int
-  hashtagName: str
-  isCommerce: bool
-  secUid: str
-  start: int
-  subType: int
-  type: int
-  userId: str
-  userUniqueId: str
+  awemeId: Optional[str] = None
+  end: Optional[int] = None
+  hashtagName: Optional[str] = None
+  isCommerce: Optional[bool] = None
+  secUid: Optional[str] = None
+  start: Optional[int] = None
+  subType: Optional[int] = None
+  type: Optional[int] = None
+  userId: Optional[str] = None
+  userUniqueId: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Content:
-  desc: str
-  textExtra: List[TextExtra]
+  desc: Optional[str] = None
+  textExtra: Optional[List[TextExtra]] = None
 
-@dataclass
+@dataclass(slots=True)
 class Music:
-  album: str
-  authorName: str
-  coverLarge: str
-  coverMedium: str
-  coverThumb: str
-  duration: int
-  id: str
-  isCopyrighted: bool
-  original: bool
-  playUrl: str
-  private: bool
-  title: str
-  tt2dsp: Dict[str, Any]
+  album: Optional[str] = None
+  authorName: Optional[str] = None
+  coverLarge: Optional[str] = None
+  coverMedium: Optional[str] = None
+  coverThumb: Optional[str] = None
+  duration: Optional[int] = None
+  id: Optional[str] = None
+  isCopyrighted: Optional[bool] = None
+  original: Optional[bool] = None
+  playUrl: Optional[str] = None
+  private: Optional[bool] = None
+  title: Optional[str] = None
+  tt2dsp: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class ItemControl:
-  can_repost: bool
+  can_repost: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
-  collectCount: int
-  commentCount: int
-  diggCount: int
-  playCount: int
-  shareCount: int
+  collectCount: Optional[int] = None
+  commentCount: Optional[int] = None
+  diggCount: Optional[int] = None
+  playCount: Optional[int] = None
+  shareCount: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class StatsV2:
-  collectCount: str
-  commentCount: str
-  diggCount: str
-  playCount: str
-  repostCount: str
-  shareCount: str
+  collectCount: Optional[str] = None
+  commentCount: Optional[str] = None
+  diggCount: Optional[str] = None
+  playCount: Optional[str] = None
+  repostCount: Optional[str] = None
+  shareCount: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class PlayAddr:
-  DataSize: int
-  FileCs: str
-  FileHash: str
-  Height: int
-  Uri: str
-  UrlKey: str
-  UrlList: List[str]
-  Width: int
+  DataSize: Optional[int] = None
+  FileCs: Optional[str] = None
+  FileHash: Optional[str] = None
+  Height: Optional[int] = None
+  Uri: Optional[str] = None
+  UrlKey: Optional[str] = None
+  UrlList: Optional[List[str]] = None
+  Width: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class BitrateInfo:
-  Bitrate: int
-  BitrateFPS: int
-  CodecType: str
-  Format: str
-  GearName: str
-  MVMAF: str
-  PlayAddr: PlayAddr
-  QualityType: int
-  VideoExtra: str
+  Bitrate: Optional[int] = None
+  BitrateFPS: Optional[int] = None
+  CodecType: Optional[str] = None
+  Format: Optional[str] = None
+  GearName: Optional[str] = None
+  MVMAF: Optional[str] = None
+  # Quoted, as the default would shadow the PlayAddr class in the annotation
+  PlayAddr: 'Optional[PlayAddr]' = None
+  QualityType: Optional[int] = None
+  VideoExtra: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Video:
-  PlayAddrStruct: PlayAddr
-  VQScore: str
-  bitrate: int
-  bitrateInfo: List[BitrateInfo]
-  codecType: str
-  cover: str
-  definition: str
-  downloadAddr: str
-  duration: int
-  dynamicCover: str
-  encodedType: str
-  format: str
-  height: int
-  id: str
-  originCover: str
-  playAddr: str
-  ratio: str
-  size: int
-  videoID: str
-  videoQuality: str
-  width: int
+  PlayAddrStruct: Optional[PlayAddr] = None
+  VQScore: Optional[str] = None
+  bitrate: Optional[int] = None
+  bitrateInfo: Optional[List[BitrateInfo]] = None
+  codecType: Optional[str] = None
+  cover: Optional[str] = None
+  definition: Optional[str] = None
+  downloadAddr: Optional[str] = None
+  duration: Optional[int] = None
+  dynamicCover: Optional[str] = None
+  encodedType: Optional[str] = None
+  format: Optional[str] = None
+  height: Optional[int] = None
+  id: Optional[str] = None
+  originCover: Optional[str] = None
+  playAddr: Optional[str] = None
+  ratio: Optional[str] = None
+  size: Optional[int] = None
+  videoID: Optional[str] = None
+  videoQuality: Optional[str] = None
+  width: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class VideoItem:
-  AIGCDescription: str
-  CategoryType: int
-  author: Author
-  authorStats: AuthorStats
-  authorStatsV2: AuthorStatsV2
-  backendSourceEventTracking: str
-  challenges: List[Challenge]
-  contents: List[Content]
-  createTime: int
-  desc: str
-  diversificationId: int
-  duetDisplay: int
-  duetEnabled: bool
-  forFriend: bool
-  id: str
-  isAd: bool
-  isReviewing: bool
-  itemCommentStatus: int
-  item_control: ItemControl
-  music: Music
-  officalItem: bool
-  originalItem: bool
-  privateItem: bool
-  secret: bool
-  shareEnabled: bool
-  stats: Stats
-  statsV2: StatsV2
-  stitchDisplay: int
-  stitchEnabled: bool
-  textExtra: List[TextExtra]
-  textLanguage: str
-  textTranslatable: bool
-  video: Video
+  AIGCDescription: Optional[str] = None
+  CategoryType: Optional[int] = None
+  author: Optional[Author] = None
+  authorStats: Optional[AuthorStats] = None
+  authorStatsV2: Optional[AuthorStatsV2] = None
+  backendSourceEventTracking: Optional[str] = None
+  challenges: Optional[List[Challenge]] = None
+  contents: Optional[List[Content]] = None
+  createTime: Optional[int] = None
+  desc: Optional[str] = None
+  diversificationId: Optional[int] = None
+  duetDisplay: Optional[int] = None
+  duetEnabled: Optional[bool] = None
+  forFriend: Optional[bool] = None
+  id: Optional[str] = None
+  isAd: Optional[bool] = None
+  isReviewing: Optional[bool] = None
+  itemCommentStatus: Optional[int] = None
+  item_control: Optional[ItemControl] = None
+  music: Optional[Music] = None
+  officalItem: Optional[bool] = None
+  originalItem: Optional[bool] = None
+  privateItem: Optional[bool] = None
+  secret: Optional[bool] = None
+  shareEnabled: Optional[bool] = None
+  stats: Optional[Stats] = None
+  statsV2: Optional[StatsV2] = None
+  stitchDisplay: Optional[int] = None
+  stitchEnabled: Optional[bool] = None
+  textExtra: Optional[List[TextExtra]] = None
+  textLanguage: Optional[str] = None
+  textTranslatable: Optional[bool] = None
+  video: Optional[Video] = None
 
-@dataclass
+@dataclass(slots=True)
 class UserPostResponse:
-  cursor: str
-  hasMore: bool
-  itemList: List[VideoItem]
+  cursor: Optional[str] = None
+  hasMore: Optional[bool] = None
+  itemList: Optional[List[VideoItem]] = None
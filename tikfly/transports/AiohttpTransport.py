@@ -0,0 +1,156 @@
+import ssl
+import time
+import asyncio
+import aiohttp
+import certifi
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from .BaseTransport import BaseTransport, StreamedResponse
+from ..RawResponse import RawResponse
+from ..RequestTiming import RequestTiming, create_trace_config
+from ..LoopCloser import LoopCloser
+
+class AiohttpTransport(BaseTransport):
+  def __init__(
+    self,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    connector_limit: int = 100,
+    connector_limit_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    dns_cache_ttl: Optional[int] = 300,
+    profile: bool = False,
+    session: Optional[aiohttp.ClientSession] = None
+  ):
+    """
+    Transport sending requests over a pooled aiohttp session.
+
+    The session is created on the first request and reused by every
+    following one, so connections are kept alive between requests.
+
+    An application can pass its own session instead, e.g. to share one
+    connection pool between Tikfly and its other services or to use a
+    connector tuned differently. That session is used as is: the pool
+    settings and `profile` are ignored, and it is never closed by the
+    transport. To profile requests sent over it, create it with
+    `trace_configs=[create_trace_config()]`, imported from
+    `tikfly.RequestTiming`.
+
+    Args:
+      ssl_context (Optional[ssl.SSLContext]): SSL context of the connections.
+        Defaults to a context verifying certificates against certifi's CA bundle.
+      connector_limit (int): Maximum number of simultaneous connections
+        in the pool. Use 0 for no limit. The default value is 100.
+      connector_limit_per_host (int): Maximum number of simultaneous
+        connections to the same host. Use 0 for no limit (default).
+      keepalive_timeout (float): Seconds an idle connection is kept open
+        for reuse. The default value is 30.
+      dns_cache_ttl (Optional[int]): Seconds resolved DNS entries are cached.
+        Use None to cache forever. The default value is 300.
+      profile (bool): Install the aiohttp trace hooks filling the network
+        phases of profiled requests. Disabled by default.
+      session (Optional[aiohttp.ClientSession]): Session owned by the
+        application to send the requests over.
+    """
+    self.ssl_context = ssl_context or ssl.create_default_context(cafile=certifi.where())
+    self.connector_limit = connector_limit
+    self.connector_limit_per_host = connector_limit_per_host
+    self.keepalive_timeout = keepalive_timeout
+    self.dns_cache_ttl = dns_cache_ttl
+    self.profile = profile
+    self.shared_session = session
+
+    self.__session: Optional[aiohttp.ClientSession] = None
+    self.__closer: Optional[LoopCloser] = None
+
+  def get_session(self) -> aiohttp.ClientSession:
+    """
+    Return the pooled session, creating it on first use.
+
+    A session is bound to the event loop it was created in, so a new one
+    is created when the transport is reused from another loop
+    (e.g. across several `asyncio.run` calls). Each session is closed with
+    its loop, see `LoopCloser`.
+    """
+    if self.shared_session is not None:
+      return self.shared_session
+
+    loop = asyncio.get_running_loop()
+
+    if (
+      self.__session is None
+      or self.__session.closed
+      or self.__closer.loop is not loop
+    ):
+      if self.__closer is not None:
+        self.__closer.discard()
+
+      connector = aiohttp.TCPConnector(
+        limit=self.connector_limit,
+        limit_per_host=self.connector_limit_per_host,
+        keepalive_timeout=self.keepalive_timeout,
+        ttl_dns_cache=self.dns_cache_ttl,
+        use_dns_cache=True,
+        ssl=self.ssl_context
+      )
+      self.__session = aiohttp.ClientSession(
+        connector=connector,
+        trace_configs=[create_trace_config()] if self.profile else None
+      )
+      self.__closer = LoopCloser(self.__session.close, 'aiohttp session')
+
+    return self.__session
+
+  async def aclose(self):
+    """
+    Close the pooled session and release all open connections. A session
+    passed by the application is left open.
+    """
+    closer = self.__closer
+    self.__session = None
+    self.__closer = None
+
+    if closer is not None:
+      await closer.aclose()
+
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    async with self.get_session().get(
+      url,
+      params=params,
+      headers=headers,
+      trace_request_ctx={'timing': timing} if timing is not None else None
+    ) as res:
+      headers_at = time.perf_counter()
+      body = await res.read()
+
+      if timing is not None:
+        timing.transfer = time.perf_counter() - headers_at
+
+      return RawResponse(
+        status=res.status,
+        body=body,
+        url=str(res.url),
+        headers=res.headers,
+        timing=timing
+      )
+
+  @asynccontextmanager
+  async def stream(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str]
+  ) -> AsyncIterator[StreamedResponse]:
+    async with self.get_session().get(url, params=params, headers=headers) as res:
+      yield StreamedResponse(
+        status=res.status,
+        url=str(res.url),
+        headers=res.headers,
+        chunks=res.content.iter_any()
+      )
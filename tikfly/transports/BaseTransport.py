@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from ..RawResponse import RawResponse
+from ..RequestTiming import RequestTiming
+
+@dataclass(slots=True)
+class StreamedResponse:
+  """
+  Response of a streamed request, whose body is read chunk by chunk.
+
+  Args:
+    status (int): HTTP status code.
+    url (str): Requested URL, including the query string.
+    headers (Mapping[str, str]): Response headers.
+    chunks (AsyncIterator[bytes]): The body, in chunks of any size.
+  """
+  status: int
+  url: str
+  headers: Mapping[str, str]
+  chunks: AsyncIterator[bytes]
+
+  async def read(self) -> bytes:
+    """
+    Read the rest of the body.
+    """
+    return b''.join([chunk async for chunk in self.chunks])
+
+class BaseTransport(ABC):
+  """
+  Base class of the transports sending the GET requests of a TikflyApi
+  instance to the Tikfly API.
+
+  A transport returns every response whatever its status; the client
+  checks the status, retries, caches and decodes. Connection failures and
+  timeouts must be raised as `aiohttp.ClientError`, `asyncio.TimeoutError`
+  or a `TikflyAPIError` flagged as retryable.
+  """
+
+  @abstractmethod
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    """
+    Send a GET request and read the whole response.
+
+    Args:
+      url (str): URL of the endpoint, without the query string.
+      params (Mapping): Query params.
+      headers (Mapping[str, str]): Request headers, including the API key.
+      timing (Optional[RequestTiming]): Timing of a profiled request, whose
+        network phases the transport fills when it can measure them.
+
+    Returns:
+      RawResponse: The status, headers and body of the response.
+    """
+    raise NotImplementedError
+
+  @asynccontextmanager
+  async def stream(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str]
+  ) -> AsyncIterator[StreamedResponse]:
+    """
+    Send a GET request and give access to the body as it arrives.
+
+    The default implementation reads the whole response with `send` and
+    yields it as a single chunk.
+
+    Yields:
+      StreamedResponse: The response, valid until the context exits.
+    """
+    response = await self.send(url, params, headers)
+    yield StreamedResponse(
+      status=response.status,
+      url=response.url,
+      headers=response.headers,
+      chunks=_single_chunk(response.body)
+    )
+
+  async def aclose(self):
+    """
+    Release the resources of the transport. It must remain usable
+    afterwards, reopening them on the next request.
+    """
+
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+  yield body
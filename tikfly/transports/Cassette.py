@@ -0,0 +1,111 @@
+import gzip
+import json
+import base64
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Tuple
+
+from ..cache import BaseCache
+
+CASSETTE_VERSION = 1
+
+# Response headers left out of cassettes.
+EXCLUDED_HEADERS = frozenset(('set-cookie',))
+
+@dataclass(slots=True)
+class CassetteEntry:
+  """
+  Request and response pair recorded in a cassette.
+
+  Request headers are never recorded, so cassettes do not contain the
+  API key.
+
+  Args:
+    url (str): URL of the endpoint, without the query string.
+    params (Dict[str, str]): Query params.
+    status (int): HTTP status code of the response.
+    body (bytes): Response body.
+    headers (List[Tuple[str, str]]): Response headers.
+    elapsed (float): Seconds from sending the request to reading the body.
+  """
+  url: str
+  params: Dict[str, str]
+  status: int
+  body: bytes
+  headers: List[Tuple[str, str]] = field(default_factory=list)
+  elapsed: float = 0.0
+
+  @property
+  def key(self) -> str:
+    return BaseCache.make_key(self.url, self.params)
+
+def encode_entry(entry: CassetteEntry) -> str:
+  """
+  Encode an entry as a JSON line. UTF-8 bodies are stored as text and
+  other bodies in base64.
+  """
+  record = {
+    'url': entry.url,
+    'params': entry.params,
+    'status': entry.status,
+    'headers': entry.headers,
+    'elapsed': round(entry.elapsed, 6),
+  }
+  try:
+    record['body'] = entry.body.decode('utf-8')
+  except UnicodeDecodeError:
+    record['body_base64'] = base64.b64encode(entry.body).decode('ascii')
+  return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def encode_header() -> str:
+  return json.dumps({'cassette': CASSETTE_VERSION}) + '\n'
+
+def decode_entry(record: Mapping) -> CassetteEntry:
+  if 'body_base64' in record:
+    body = base64.b64decode(record['body_base64'])
+  else:
+    body = record['body'].encode('utf-8')
+
+  return CassetteEntry(
+    url=record['url'],
+    params=dict(record['params']),
+    status=record['status'],
+    body=body,
+    headers=[tuple(pair) for pair in record['headers']],
+    elapsed=record['elapsed']
+  )
+
+def read_cassette(path: str) -> List[CassetteEntry]:
+  """
+  Read the entries of a cassette file, in recording order.
+
+  A cassette is a gzip-compressed JSON lines file: a header line
+  `{"cassette": <version>}` followed by one line per entry. Recordings
+  appended to an existing file add a header and their own lines.
+
+  Args:
+    path (str): Path of the cassette file.
+
+  Returns:
+    List[CassetteEntry]: The recorded entries.
+
+  Raises:
+    ValueError: If the file is not a cassette or has an unsupported version.
+  """
+  entries = []
+
+  with gzip.open(path, 'rt', encoding='utf-8') as file:
+    for number, line in enumerate(file, 1):
+      if not line.strip():
+        continue
+
+      record = json.loads(line)
+      if 'cassette' in record:
+        if record['cassette'] > CASSETTE_VERSION:
+          raise ValueError(f'Unsupported cassette version: {record["cassette"]}')
+        continue
+      if number == 1:
+        raise ValueError(f'{path} is not a cassette file')
+
+      entries.append(decode_entry(record))
+
+  return entries
@@ -0,0 +1,175 @@
+import ssl
+import time
+import asyncio
+import certifi
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+try:
+  import httpx
+except ImportError:
+  httpx = None
+
+from .BaseTransport import BaseTransport, StreamedResponse
+from ..RawResponse import RawResponse
+from ..RequestTiming import RequestTiming
+from ..LoopCloser import LoopCloser
+from ..exceptions.TikflyApiError import TikflyAPIError
+
+class HttpxTransport(BaseTransport):
+  def __init__(
+    self,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    http2: bool = True,
+    connector_limit: int = 100,
+    keepalive_connections: int = 20,
+    keepalive_timeout: float = 30.0,
+    timeout: Optional[float] = 300.0,
+    client: Optional['httpx.AsyncClient'] = None
+  ):
+    """
+    Transport sending requests with httpx, over HTTP/2 when the server
+    supports it. Requires `pip install tikfly[http2]`.
+
+    Over HTTP/2, concurrent requests to the API host are multiplexed on a
+    few connections instead of one connection per request in flight.
+
+    Args:
+      ssl_context (Optional[ssl.SSLContext]): SSL context of the connections.
+        Defaults to a context verifying certificates against certifi's CA bundle.
+      http2 (bool): Negotiate HTTP/2 with the server. Enabled by default.
+      connector_limit (int): Maximum number of simultaneous connections.
+        The default value is 100.
+      keepalive_connections (int): Maximum number of idle connections kept
+        open for reuse. The default value is 20.
+      keepalive_timeout (float): Seconds an idle connection is kept open
+        for reuse. The default value is 30.
+      timeout (Optional[float]): Seconds allowed for each phase of a request:
+        connecting, sending, waiting for data and acquiring a connection from
+        the pool. Use None for no limit. The default value is 300, aiohttp's
+        default request timeout.
+      client (Optional[httpx.AsyncClient]): Client owned by the application
+        to send the requests with. It is used as is and never closed by
+        the transport.
+
+    Raises:
+      ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+      raise ImportError('HttpxTransport requires httpx: pip install tikfly[http2]')
+
+    self.ssl_context = ssl_context or ssl.create_default_context(cafile=certifi.where())
+    self.http2 = http2
+    self.connector_limit = connector_limit
+    self.keepalive_connections = keepalive_connections
+    self.keepalive_timeout = keepalive_timeout
+    self.timeout = timeout
+    self.shared_client = client
+
+    self.__client: Optional['httpx.AsyncClient'] = None
+    self.__closer: Optional[LoopCloser] = None
+
+  def get_client(self) -> 'httpx.AsyncClient':
+    """
+    Return the client, creating it on first use and again when the
+    transport is reused from another event loop. Each client is closed
+    with its loop, see `LoopCloser`.
+    """
+    if self.shared_client is not None:
+      return self.shared_client
+
+    loop = asyncio.get_running_loop()
+
+    if (
+      self.__client is None
+      or self.__client.is_closed
+      or self.__closer.loop is not loop
+    ):
+      if self.__closer is not None:
+        self.__closer.discard()
+
+      self.__client = httpx.AsyncClient(
+        http2=self.http2,
+        verify=self.ssl_context,
+        timeout=httpx.Timeout(self.timeout),
+        limits=httpx.Limits(
+          max_connections=self.connector_limit or None,
+          max_keepalive_connections=self.keepalive_connections,
+          keepalive_expiry=self.keepalive_timeout
+        )
+      )
+      self.__closer = LoopCloser(self.__client.aclose, 'httpx client')
+
+    return self.__client
+
+  async def aclose(self):
+    """
+    Close the client and release all open connections. A client passed
+    by the application is left open.
+    """
+    closer = self.__closer
+    self.__client = None
+    self.__closer = None
+
+    if closer is not None:
+      await closer.aclose()
+
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    start = time.perf_counter()
+
+    try:
+      async with self.get_client().stream('GET', url, params=params, headers=headers) as res:
+        headers_at = time.perf_counter()
+        body = await res.aread()
+    except httpx.TransportError as err:
+      raise _client_error(err) from err
+
+    if timing is not None:
+      timing.status = res.status_code
+      timing.ttfb = headers_at - start
+      timing.transfer = time.perf_counter() - headers_at
+
+    return RawResponse(
+      status=res.status_code,
+      body=body,
+      url=str(res.url),
+      headers=res.headers,
+      timing=timing
+    )
+
+  @asynccontextmanager
+  async def stream(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str]
+  ) -> AsyncIterator[StreamedResponse]:
+    async def chunks(res):
+      try:
+        async for chunk in res.aiter_bytes():
+          yield chunk
+      except httpx.TransportError as err:
+        raise _client_error(err) from err
+
+    try:
+      async with self.get_client().stream('GET', url, params=params, headers=headers) as res:
+        yield StreamedResponse(
+          status=res.status_code,
+          url=str(res.url),
+          headers=res.headers,
+          chunks=chunks(res)
+        )
+    except httpx.TransportError as err:
+      raise _client_error(err) from err
+
+def _client_error(err: Exception) -> TikflyAPIError:
+  return TikflyAPIError(
+    message=f'Tikfly API client error: {str(err) or type(err).__name__}',
+    retryable=True
+  )
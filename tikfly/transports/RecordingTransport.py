@@ -0,0 +1,171 @@
+import gzip
+import time
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Mapping, Optional
+
+from .BaseTransport import BaseTransport, StreamedResponse
+from .AiohttpTransport import AiohttpTransport
+from .Cassette import CassetteEntry, EXCLUDED_HEADERS, encode_entry, encode_header
+from ..RawResponse import RawResponse
+from ..RequestTiming import RequestTiming
+
+# Bytes of response bodies buffered before they are written to the cassette.
+FLUSH_SIZE = 1024 * 1024
+
+class RecordingTransport(BaseTransport):
+  def __init__(
+    self,
+    path: str,
+    transport: Optional[BaseTransport] = None,
+    append: bool = False,
+    compression_level: int = 6
+  ):
+    """
+    Transport recording request and response pairs to a cassette file
+    while sending the requests through another transport.
+
+    Every response is recorded whatever its status, along with its duration.
+    Requests failing without a response are not recorded, and neither are
+    streamed responses whose body was not read to the end. Request headers
+    are never recorded.
+
+    Responses are buffered and compressed to the file in a worker thread,
+    so recording does not block the event loop. The cassette is only
+    complete once the transport is closed, which `TikflyApi.aclose()` does.
+    Recording resumes in the same file if the transport is used again
+    afterwards.
+
+    Args:
+      path (str): Path of the cassette file.
+      transport (Optional[BaseTransport]): Transport sending the requests.
+        Defaults to an AiohttpTransport.
+      append (bool): Add the recording to an existing cassette instead of
+        overwriting it. Disabled by default.
+      compression_level (int): gzip compression level, from 0 to 9.
+    """
+    self.path = path
+    self.transport = transport if transport is not None else AiohttpTransport()
+    self.append = append
+    self.compression_level = compression_level
+    self.recorded = 0
+
+    self.__file = None
+    self.__written = 0
+    self.__pending: List[CassetteEntry] = []
+    self.__pending_size = 0
+    self.__executor: Optional[ThreadPoolExecutor] = None
+
+  def __write(self, entries: List[CassetteEntry], close: bool = False):
+    """
+    Write entries to the cassette, then close it if `close` is set.
+    Runs in the worker thread, which is the only one using the file.
+    """
+    if entries and self.__file is None:
+      mode = 'at' if self.append or self.__written else 'wt'
+      self.__file = gzip.open(
+        self.path,
+        mode,
+        encoding='utf-8',
+        compresslevel=self.compression_level
+      )
+      self.__file.write(encode_header())
+
+    for entry in entries:
+      self.__file.write(encode_entry(entry))
+    self.__written += len(entries)
+
+    if close and self.__file is not None:
+      self.__file.close()
+      self.__file = None
+
+  def __flush(self, close: bool = False) -> asyncio.Future:
+    """
+    Hand the buffered entries to the worker thread. Its single thread
+    writes them in recording order.
+    """
+    if self.__executor is None:
+      self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tikfly-cassette')
+
+    entries = self.__pending
+    self.__pending = []
+    self.__pending_size = 0
+
+    return asyncio.get_running_loop().run_in_executor(
+      self.__executor,
+      self.__write,
+      entries,
+      close
+    )
+
+  async def __record(
+    self,
+    url: str,
+    params: Mapping,
+    status: int,
+    headers: Mapping[str, str],
+    body: bytes,
+    start: float
+  ):
+    self.__pending.append(CassetteEntry(
+      url=url,
+      params={str(k): str(v) for k, v in params.items()},
+      status=status,
+      body=body,
+      headers=[
+        (k, v) for k, v in headers.items()
+        if k.lower() not in EXCLUDED_HEADERS
+      ],
+      elapsed=time.perf_counter() - start
+    ))
+    self.__pending_size += len(body)
+    self.recorded += 1
+
+    if self.__pending_size >= FLUSH_SIZE:
+      await self.__flush()
+
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    start = time.perf_counter()
+    response = await self.transport.send(url, params, headers, timing)
+    await self.__record(url, params, response.status, response.headers, response.body, start)
+    return response
+
+  @asynccontextmanager
+  async def stream(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str]
+  ) -> AsyncIterator[StreamedResponse]:
+    start = time.perf_counter()
+
+    async with self.transport.stream(url, params, headers) as res:
+      async def tee():
+        chunks = []
+        async for chunk in res.chunks:
+          chunks.append(chunk)
+          yield chunk
+        await self.__record(url, params, res.status, res.headers, b''.join(chunks), start)
+
+      yield dataclasses.replace(res, chunks=tee())
+
+  async def aclose(self):
+    """
+    Close the wrapped transport and complete the cassette file.
+    """
+    try:
+      await self.transport.aclose()
+    finally:
+      if self.__executor is not None or self.__pending:
+        closed = self.__flush(close=True)
+        self.__executor.shutdown(wait=False)
+        self.__executor = None
+        await closed
@@ -0,0 +1,81 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .BaseTransport import BaseTransport
+from .Cassette import CassetteEntry, read_cassette
+from ..RawResponse import RawResponse
+from ..RequestTiming import RequestTiming
+from ..cache import BaseCache
+from ..exceptions.TikflyApiError import TikflyAPIError
+
+class ReplayTransport(BaseTransport):
+  def __init__(self, path: str, speed: Optional[float] = 1.0):
+    """
+    Transport answering requests from a cassette recorded by a
+    RecordingTransport, without any network access.
+
+    Requests are matched on their URL and params. When the same request was
+    recorded several times, its responses are replayed in recording order
+    and the last one is repeated once they have all been used.
+
+    Args:
+      path (str): Path of the cassette file.
+      speed (Optional[float]): Replay speed. Each response is delivered
+        after its recorded duration divided by `speed`: 1 replays the
+        original timing (default), 10 replays ten times faster. Use None
+        to answer without any delay.
+
+    Raises:
+      ValueError: If speed is not positive or the file is not a cassette.
+    """
+    if speed is not None and speed <= 0:
+      raise ValueError('speed must be positive or None')
+
+    self.path = path
+    self.speed = speed
+    self.entries = read_cassette(path)
+    self.replayed = 0
+
+    self.__responses: Dict[str, Deque[CassetteEntry]] = {}
+    for entry in self.entries:
+      self.__responses.setdefault(entry.key, deque()).append(entry)
+
+  def __next_entry(self, url: str, params: Mapping) -> CassetteEntry:
+    key = BaseCache.make_key(url, params)
+    responses = self.__responses.get(key)
+
+    if not responses:
+      raise TikflyAPIError(
+        message=f'No response recorded in {self.path} for GET {key}'
+      )
+    return responses.popleft() if len(responses) > 1 else responses[0]
+
+  async def send(
+    self,
+    url: str,
+    params: Mapping,
+    headers: Mapping[str, str],
+    timing: Optional[RequestTiming] = None
+  ) -> RawResponse:
+    entry = self.__next_entry(url, params)
+
+    delay = entry.elapsed / self.speed if self.speed is not None else 0.0
+    if delay > 0:
+      await asyncio.sleep(delay)
+
+    if timing is not None:
+      timing.status = entry.status
+      timing.ttfb = delay
+
+    self.replayed += 1
+    return RawResponse(
+      status=entry.status,
+      body=entry.body,
+      url=f'{url}?{urlencode(params)}' if params else url,
+      headers=CIMultiDictProxy(CIMultiDict(entry.headers)),
+      timing=timing
+    )
@@ -0,0 +1,6 @@
+from .BaseTransport import BaseTransport, StreamedResponse
+from .AiohttpTransport import AiohttpTransport
+from .HttpxTransport import HttpxTransport
+from .Cassette import CassetteEntry, read_cassette
+from .RecordingTransport import RecordingTransport
+from .ReplayTransport import ReplayTransport